@@ -0,0 +1,98 @@
+# Fifteen Puzzle Benchmark
+# Solve a set of 4x4 instances with IDA* (Manhattan distance), IDA* with a 5-5-5
+# additive pattern database, A* over packed states, and optionally hash-distributed
+# A* on several worker processes, and report solve times.
+# Instances are read from a file with one instance per line: sixteen numbers in
+# reading order, 0 for the blank tile, solved when the board reads 0, 1, ..., 15
+# (the format of Korf's 100 standard instances). Without a file, seeded random
+# walks from the goal are used.
+# Run me via: python3 benchmark_fifteen_puzzle.py [--instances FILE] [--parallel-workers N ...]
+
+import argparse
+import random
+import time
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_parallel_solver import EightPuzzleParallelSolver
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
+PATTERNS = ((1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11, 12, 13, 14, 15))
+
+
+def read_instances(path):
+    instances = []
+    with open(path) as file:
+        for line in file:
+            numbers = [int(number) for number in line.split()]
+            if numbers:
+                instances.append(tuple(None if number == 0 else number for number in numbers[-16:]))
+    return instances
+
+
+def random_walk_instances(count, walk_length, seed):
+    generator = random.Random(seed)
+    problem = EightPuzzleProblem(None, GOAL_STATE, EightPuzzleTransitionModel(4))
+    instances = []
+    for _ in range(count):
+        state = GOAL_STATE
+        for _ in range(walk_length):
+            state = problem.result(state, generator.choice(problem.actions(state)))
+        instances.append(state)
+    return instances
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 4x4 sliding-puzzle solvers.")
+    parser.add_argument("--instances", help="a file of 4x4 instances, one per line")
+    parser.add_argument("--count", type=int, default=10, help="the number of random-walk instances")
+    parser.add_argument("--walk-length", type=int, default=60, help="the length of each random walk")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pattern-database", default="fifteen_puzzle_555.pdb",
+                        help="the pattern database file, built on first use")
+    parser.add_argument("--skip-a-star", action="store_true", help="A* runs out of memory on hard instances")
+    parser.add_argument("--parallel-workers", type=int, nargs="*", default=[],
+                        help="worker counts to run hash-distributed A* (with the pattern database) with")
+    arguments = parser.parse_args()
+
+    if arguments.instances:
+        instances = read_instances(arguments.instances)
+    else:
+        instances = random_walk_instances(arguments.count, arguments.walk_length, arguments.seed)
+
+    start = time.perf_counter()
+    database = EightPuzzlePatternDatabase.load_or_build(arguments.pattern_database, GOAL_STATE, PATTERNS)
+    print(f"Pattern database ready in {time.perf_counter() - start:.1f} s")
+
+    solvers = {
+        "ida_star_manhattan": EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR),
+        "ida_star_pdb_555": EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR,
+                                                             pattern_database=database),
+    }
+    if not arguments.skip_a_star:
+        solvers["a_star_packed"] = EightPuzzleBestFirstSearchSolver(packed=True)
+    for workers in arguments.parallel_workers:
+        solvers[f"hda_star_pdb_{workers}"] = EightPuzzleParallelSolver(workers,
+                                                                      pattern_database_path=arguments.pattern_database)
+
+    transition_model = EightPuzzleTransitionModel(4)
+    totals = dict.fromkeys(solvers, 0.0)
+    print(f"{'instance':>8} {'length':>6}  " + "  ".join(f"{name:>20}" for name in solvers))
+    for number, state in enumerate(instances, start=1):
+        problem = EightPuzzleProblem(state, GOAL_STATE, transition_model)
+        lengths = set()
+        times = []
+        for name, solver in solvers.items():
+            start = time.perf_counter()
+            lengths.add(len(solver.solution(problem)))
+            elapsed = time.perf_counter() - start
+            totals[name] += elapsed
+            times.append(elapsed)
+        length = lengths.pop() if len(lengths) == 1 else f"{sorted(lengths)}"
+        print(f"{number:>8} {length:>6}  " + "  ".join(f"{elapsed:>19.3f}s" for elapsed in times))
+    print(f"{'total':>15}  " + "  ".join(f"{totals[name]:>19.3f}s" for name in solvers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Frontier Benchmark
+# Compare the heap and bucket frontiers of EightPuzzleBestFirstSearchSolver with the
+# queue.PriorityQueue it used to rely on: raw push/pop throughput, and the nodes
+# generated and time taken by A* on the main.py examples and on seeded random
+# deep instances.
+# Run me via: python3 benchmark_frontier.py
+
+import random
+import time
+from queue import PriorityQueue
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_frontier import EightPuzzleHeapFrontier, EightPuzzleBucketFrontier
+from eight_puzzle_node import EightPuzzleNode
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+MAIN_EXAMPLES = [
+    (1, None, 2, 3, 4, 5, 6, 7, 8),
+    (1, 2, 3, None, 4, 5, 6, 7, 8),
+    (7, 2, 4, 5, None, 6, 8, 3, 1),
+    (8, 6, 7, 2, 5, 4, 3, None, 1),
+]
+
+
+class PriorityQueueFrontier:
+    """
+    The solver's original frontier: a locking queue.PriorityQueue that breaks ties on
+    id(node) and never prunes duplicates.
+    """
+
+    def __init__(self):
+        self.queue = PriorityQueue()
+
+    def __len__(self):
+        return self.queue.qsize()
+
+    def best_path_cost(self, state):
+        return float("inf")
+
+    def add(self, node, cost):
+        self.queue.put((cost, id(node), node))
+
+    def pop(self):
+        return self.queue.get()[2]
+
+
+FRONTIERS = {
+    "priority_queue": PriorityQueueFrontier,
+    "heap": EightPuzzleHeapFrontier,
+    "bucket": EightPuzzleBucketFrontier,
+}
+
+
+class CountingSolver(EightPuzzleBestFirstSearchSolver):
+    """
+    A solver that counts the nodes it generates.
+    """
+
+    def __init__(self, frontier_class):
+        super().__init__()
+        self.FRONTIERS = {self.frontier: frontier_class}
+        self.nodes_generated = 0
+
+    def expand(self, node, problem, evaluator=None):
+        children = super().expand(node, problem, evaluator)
+        self.nodes_generated += len(children)
+        return children
+
+
+def random_deep_instances(count, walk_length, seed):
+    """
+    Produce solvable instances by random walks from the goal state.
+    """
+    generator = random.Random(seed)
+    problem = EightPuzzleProblem(None, GOAL_STATE, EightPuzzleTransitionModel())
+    instances = []
+    for _ in range(count):
+        state = GOAL_STATE
+        for _ in range(walk_length):
+            state = problem.result(state, generator.choice(problem.actions(state)))
+        instances.append(state)
+    return instances
+
+
+def benchmark_throughput(operations=200_000, seed=0):
+    generator = random.Random(seed)
+    costs = [generator.randint(0, 60) for _ in range(operations)]
+    nodes = [EightPuzzleNode(index, None, None, cost) for index, cost in enumerate(costs)]
+    print(f"Push/pop throughput ({operations} nodes)")
+    for name, frontier_class in FRONTIERS.items():
+        frontier = frontier_class()
+        start = time.perf_counter()
+        for node, cost in zip(nodes, costs):
+            frontier.add(node, cost)
+        while len(frontier):
+            frontier.pop()
+        elapsed = time.perf_counter() - start
+        print(f"  {name:15} {2 * operations / elapsed:12,.0f} operations/s")
+    print()
+
+
+def benchmark_search(label, instances):
+    print(f"A* on {label} ({len(instances)} instances)")
+    for name, frontier_class in FRONTIERS.items():
+        solver = CountingSolver(frontier_class)
+        start = time.perf_counter()
+        lengths = []
+        for state in instances:
+            problem = EightPuzzleProblem(state, GOAL_STATE, EightPuzzleTransitionModel())
+            lengths.append(len(solver.solution(problem)))
+        elapsed = time.perf_counter() - start
+        print(f"  {name:15} {solver.nodes_generated:10,} nodes generated  {elapsed:8.3f} s  "
+              f"total solution length {sum(lengths)}")
+    print()
+
+
+def main():
+    benchmark_throughput()
+    benchmark_search("main.py examples", MAIN_EXAMPLES)
+    benchmark_search("random deep instances", random_deep_instances(20, 200, seed=1))
+
+
+if __name__ == "__main__":
+    main()
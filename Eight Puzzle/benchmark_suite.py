@@ -0,0 +1,177 @@
+# Benchmark Suite
+# A reproducible benchmark of EightPuzzleTransitionModel, EightPuzzleProblem and
+# EightPuzzleBestFirstSearchSolver on standard 3x3 instance sets:
+#   - the main.py examples,
+#   - seeded random walks whose optimal solutions take exactly 5, 10, ..., 30 moves,
+#   - every hardest instance, 31 moves from the goal.
+# For each solver configuration and instance set it measures solves per second,
+# nodes expanded per second, the peak memory of a solve (tracemalloc), and how many
+# solutions are optimal according to an EightPuzzleDistanceOracle. Node counts and
+# memory are collected in a second pass, so that neither slows the timed pass.
+# Results are written as JSON with sorted keys, so runs can be diffed between
+# versions; `--baseline` prints the change in solves per second against an earlier run.
+# Run me via: python3 benchmark_suite.py [--output FILE] [--baseline FILE]
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+MAIN_EXAMPLES = [
+    (1, None, 2, 3, 4, 5, 6, 7, 8),
+    (1, 2, 3, None, 4, 5, 6, 7, 8),
+    (7, 2, 4, 5, None, 6, 8, 3, 1),
+    (8, 6, 7, 2, 5, 4, 3, None, 1),
+]
+
+SOLVERS = {
+    "a_star_heap": dict(frontier=EightPuzzleBestFirstSearchSolver.HEAP_FRONTIER),
+    "a_star_bucket": dict(frontier=EightPuzzleBestFirstSearchSolver.BUCKET_FRONTIER),
+    "a_star_packed": dict(packed=True),
+    "ida_star": dict(algorithm=EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR),
+    "bidirectional_bfs": dict(algorithm=EightPuzzleBestFirstSearchSolver.BIDIRECTIONAL_BREADTH_FIRST),
+    "mm": dict(algorithm=EightPuzzleBestFirstSearchSolver.MEET_IN_THE_MIDDLE),
+}
+
+
+def random_walk_instances(oracle, depth, count, seed):
+    """
+    Produce instances by seeded random walks from the goal state that only take moves
+    leading one move farther from it, so each instance is exactly `depth` moves away.
+    A walk that reaches a state with no farther neighbor starts over.
+    """
+    generator = random.Random(f"{seed}:{depth}")
+    problem = EightPuzzleProblem(None, GOAL_STATE, EightPuzzleTransitionModel())
+    instances = []
+    while len(instances) < count:
+        state = GOAL_STATE
+        for distance in range(1, depth + 1):
+            farther = [child for child in (problem.result(state, action) for action in problem.actions(state))
+                       if oracle.distance(child) == distance]
+            if not farther:
+                break
+            state = generator.choice(farther)
+        else:
+            instances.append(state)
+    return instances
+
+
+def instance_sets(oracle, depths, count, seed):
+    sets = {"main_examples": MAIN_EXAMPLES}
+    for depth in depths:
+        sets[f"random_walk_{depth:02}"] = random_walk_instances(oracle, depth, count, seed)
+    sets["hardest_31"] = list(oracle.states_at_distance(31))
+    return sets
+
+
+def benchmark(solver, instances, oracle):
+    transition_model = EightPuzzleTransitionModel()
+    problems = [EightPuzzleProblem(state, GOAL_STATE, transition_model) for state in instances]
+
+    start = time.perf_counter()
+    lengths = [len(solver.solution(problem)) for problem in problems]
+    elapsed = time.perf_counter() - start
+
+    nodes_expanded = nodes_generated = peak_memory = 0
+    for problem in problems:
+        statistics = EightPuzzleSearchStatistics()
+        tracemalloc.start()
+        solver.solve(problem, statistics)
+        peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        nodes_expanded += statistics.nodes_expanded
+        nodes_generated += statistics.nodes_generated
+
+    optimal_lengths = [oracle.distance(state) for state in instances]
+    return {
+        "instances": len(instances),
+        "seconds": elapsed,
+        "solves_per_second": len(instances) / elapsed,
+        "nodes_expanded": nodes_expanded,
+        "nodes_generated": nodes_generated,
+        "nodes_expanded_per_second": nodes_expanded / elapsed,
+        "peak_memory_bytes": peak_memory,
+        "total_solution_length": sum(lengths),
+        "total_optimal_length": sum(optimal_lengths),
+        "optimal_solutions": sum(length == optimal for length, optimal in zip(lengths, optimal_lengths)),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    print(f"\nSolves per second against the baseline ({baseline['metadata'].get('commit')})")
+    for set_name, solvers in results.items():
+        for solver_name, metrics in solvers.items():
+            before = baseline["results"].get(set_name, {}).get(solver_name)
+            if before:
+                change = metrics["solves_per_second"] / before["solves_per_second"] - 1
+                print(f"  {set_name:16} {solver_name:14} {change:+8.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 3x3 sliding-puzzle solvers on standard instance sets.")
+    parser.add_argument("--output", default="benchmark_results.json", help="the JSON file to write")
+    parser.add_argument("--baseline", help="an earlier JSON file to compare with")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--count", type=int, default=10, help="the number of random-walk instances per depth")
+    parser.add_argument("--depths", type=int, nargs="+", default=[5, 10, 15, 20, 25, 30])
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=list(SOLVERS))
+    arguments = parser.parse_args()
+
+    start = time.perf_counter()
+    oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+    print(f"Distance oracle built in {time.perf_counter() - start:.1f} s")
+    sets = instance_sets(oracle, arguments.depths, arguments.count, arguments.seed)
+
+    results = {}
+    for set_name, instances in sets.items():
+        results[set_name] = {}
+        for solver_name in arguments.solvers:
+            solver = EightPuzzleBestFirstSearchSolver(**SOLVERS[solver_name])
+            metrics = benchmark(solver, instances, oracle)
+            results[set_name][solver_name] = metrics
+            print(f"{set_name:16} {solver_name:14} {metrics['solves_per_second']:10.1f} solves/s "
+                  f"{metrics['nodes_expanded_per_second']:12,.0f} nodes/s "
+                  f"{metrics['peak_memory_bytes'] / 2 ** 20:8.2f} MiB "
+                  f"{metrics['optimal_solutions']:3}/{metrics['instances']} optimal")
+
+    report = {
+        "metadata": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": arguments.seed,
+            "count": arguments.count,
+            "depths": arguments.depths,
+        },
+        "instances": {set_name: [[0 if tile is None else tile for tile in state] for state in instances]
+                      for set_name, instances in sets.items()},
+        "results": results,
+    }
+    with open(arguments.output, "w") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+    print(f"Results written to {arguments.output}")
+
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,19 +2,25 @@
 # an "eight puzzle" problem.
 # Your implementation should pass the tests in test_eight_puzzle_agent.py.
 # SANKETH KARUTURI
+# Given a planner, such as an EightPuzzleRealTimeSearch, the agent acts online instead:
+# whenever it runs out of actions short of the goal, it asks the planner for the next
+# few, so each action costs at most one bounded plan.
 
 class EightPuzzleAgent:
-    def __init__(self, initial_state, transition_model, actions):
+    def __init__(self, initial_state, transition_model, actions, planner=None):
         """
         Initialize the EightPuzzleAgent with the required attributes.
 
         :param initial_state: The starting state of the puzzle (a tuple representing the board).
         :param transition_model: An object that provides methods to define state transitions for each action.
         :param actions: A list of actions that the agent will execute to solve the puzzle.
+        :param planner: An optional planner with `is_goal(state)` and `plan(state)`, which
+            refills the list of actions from the current state whenever it runs out.
         """
         self.current_state = initial_state  # Set the initial state of the puzzle.
         self.transition_model = transition_model  # Define how actions transition the state.
         self.actions = actions  # List of actions to reach the goal state.
+        self.planner = planner  # Plans more actions online, if given.
 
     def has_actions(self):
         """
@@ -22,6 +28,8 @@ class EightPuzzleAgent:
 
         :return: True if there are remaining actions, False otherwise.
         """
+        if self.planner is not None and not self.actions:  # An online agent has actions until it reaches the goal.
+            return not self.planner.is_goal(self.current_state)
         return len(self.actions) > 0  # Check if the actions list is not empty.
 
     def action(self):
@@ -30,6 +38,8 @@ class EightPuzzleAgent:
 
         :return: The next action to be executed if available, otherwise None.
         """
+        if self.planner is not None and not self.actions and self.has_actions():  # Plan the next actions online.
+            self.actions = self.planner.plan(self.current_state)
         if self.has_actions():  # If there are actions left to execute:
             return self.actions.pop(0)  # Remove and return the first action from the list.
         return None  # If no actions are left, return None.
@@ -0,0 +1,170 @@
+# EightPuzzleBatchSolver: Solve a stream of eight-puzzle problems on a pool of
+# worker processes. Each worker builds one EightPuzzleBestFirstSearchSolver from the
+# batch solver's options and keeps it for its lifetime, so a pattern database or
+# distance oracle file is mapped once per worker and its pages are shared.
+# Problems travel to the workers in chunks and in a compact form: the index of the
+# problem, the board width, and the initial and goal states as bytes (0 for the
+# blank tile). Solutions come back as bytes of action codes, with the status, the
+# suboptimality bound and the budget that stopped the search, if any, and are turned
+# back into EightPuzzleSearchResult instances in the calling process.
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_node_pool import ACTIONS, ACTION_CODES
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+# The solver of the current worker process, made by initialize_worker
+worker_solver = None
+
+
+class EightPuzzleBatchSolverException(Exception):
+    pass
+
+
+def encode_state(state):
+    try:
+        return bytes(0 if tile is None else tile for tile in state)
+    except (TypeError, ValueError):
+        raise EightPuzzleBatchSolverException(f"Cannot encode state {state}") from None
+
+
+def decode_state(encoded_state):
+    return tuple(None if tile == 0 else tile for tile in encoded_state)
+
+
+def encode_actions(actions):
+    return bytes(ACTION_CODES[action] for action in actions)
+
+
+def decode_actions(encoded_actions):
+    return [ACTIONS[code] for code in encoded_actions]
+
+
+def make_solver(solver_options, pattern_database_path):
+    if pattern_database_path is not None:
+        solver_options = dict(solver_options, pattern_database=EightPuzzlePatternDatabase.load(pattern_database_path))
+    return EightPuzzleBestFirstSearchSolver(**solver_options)
+
+
+def initialize_worker(solver_options, pattern_database_path):
+    global worker_solver
+    worker_solver = make_solver(solver_options, pattern_database_path)
+
+
+def solve_chunk(chunk, solver=None):
+    """
+    Solve a chunk of compact problems.
+
+    :param chunk: A list of (index, width, initial state, goal state) tuples.
+    :param solver: The solver to use; defaults to the worker's solver.
+    :return: A list of (index, status, encoded actions, suboptimality bound, exceeded
+        budget) tuples.
+    """
+    if solver is None:
+        solver = worker_solver
+    results = []
+    transition_models = {}
+    for index, width, initial_state, goal_state in chunk:
+        if width not in transition_models:
+            transition_models[width] = EightPuzzleTransitionModel(width)
+        problem = EightPuzzleProblem(decode_state(initial_state), decode_state(goal_state), transition_models[width])
+        result = solver.solve(problem)
+        results.append((index, result.status, encode_actions(result.actions), result.suboptimality_bound,
+                        result.exceeded_budget))
+    return results
+
+
+class EightPuzzleBatchSolver:
+
+    def __init__(self, workers=None, chunk_size=16, pattern_database_path=None, **solver_options):
+        """
+        Initialize the batch solver.
+
+        :param workers: The number of worker processes; defaults to the number of CPUs.
+            With one worker, problems are solved in the calling process.
+        :param chunk_size: The number of problems sent to a worker at a time.
+        :param pattern_database_path: The path of an EightPuzzlePatternDatabase file that
+            each worker maps and gives to its solver.
+        :param solver_options: Keyword arguments for EightPuzzleBestFirstSearchSolver,
+            such as `algorithm` or `distance_oracle_path`.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.pattern_database_path = pattern_database_path
+        self.solver_options = solver_options
+        # Fail early, in the calling process, on options the solver rejects
+        EightPuzzleBestFirstSearchSolver(**solver_options)
+        # The solver of the calling process, made the first time one worker is used
+        self.solver = None
+
+    def solve_many(self, problems, ordered=False):
+        """
+        Solve each problem of an iterable, which may be an endless stream, and yield
+        the results as they complete. Only a few chunks per worker are in flight at
+        once, so the problems are consumed as the workers keep up.
+
+        :param problems: An iterable of EightPuzzleProblem instances. Their transition
+            models are rebuilt in the workers from the width of the board.
+        :param ordered: If True, yield the results in the order of the problems. Results
+            that complete before those of earlier problems wait in a buffer, and no more
+            chunks are sent while it holds as many results as can be in flight.
+        :return: A generator of (index, EightPuzzleSearchResult) pairs, where index is
+            the position of the problem in `problems`.
+        """
+        chunks = self.chunks(problems)
+        if self.workers == 1:
+            if self.solver is None:
+                self.solver = make_solver(self.solver_options, self.pattern_database_path)
+            for chunk in chunks:
+                yield from self.decoded(solve_chunk(chunk, self.solver))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=initialize_worker,
+                                 initargs=(self.solver_options, self.pattern_database_path)) as executor:
+            pending = set()
+            waiting = {}  # Results that arrived before those of earlier problems
+            max_waiting = 2 * self.workers * self.chunk_size
+            next_index = 0
+            exhausted = False
+            while pending or not exhausted:
+                # The chunk holding the next result is pending while results wait, so
+                # pausing here never stalls the stream
+                while not exhausted and len(pending) < 2 * self.workers and len(waiting) < max_waiting:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                    else:
+                        pending.add(executor.submit(solve_chunk, chunk))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, result in self.decoded(future.result()):
+                        if not ordered:
+                            yield index, result
+                        else:
+                            waiting[index] = result
+                while next_index in waiting:
+                    yield next_index, waiting.pop(next_index)
+                    next_index += 1
+
+    def chunks(self, problems):
+        chunk = []
+        for index, problem in enumerate(problems):
+            width = math.isqrt(len(problem.goal_state))
+            chunk.append((index, width, encode_state(problem.initial_state), encode_state(problem.goal_state)))
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def decoded(self, results):
+        for index, status, actions, suboptimality_bound, exceeded_budget in results:
+            yield index, EightPuzzleSearchResult(status, decode_actions(actions), suboptimality_bound=suboptimality_bound,
+                                                 exceeded_budget=exceeded_budget)
@@ -5,49 +5,333 @@
 # solution, which is a list of actions.
 # SANKETH KARUTURI
 
-from queue import PriorityQueue
-from eight_puzzle_node import EightPuzzleNode
+import heapq
+import itertools
+import math
+import os
+import time
+from eight_puzzle_node import EightPuzzleNode, EightPuzzleBoundedNode
+from eight_puzzle_node_pool import EightPuzzleNodePool, ROOT
 from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_frontier import EightPuzzleHeapFrontier, EightPuzzleBucketFrontier, EightPuzzleMeetInTheMiddleFrontier
+from eight_puzzle_heuristics import EightPuzzleManhattanHeuristic, EightPuzzlePackedManhattanHeuristic, manhattan_distances
+from eight_puzzle_packed_problem import EightPuzzlePackedProblem
+from eight_puzzle_permutation_rank import EightPuzzleRankedClosedSet
+from eight_puzzle_problem import action_targets
+from eight_puzzle_relabeling import canonical_problem
+from eight_puzzle_search_budget import EightPuzzleSearchBudget, EightPuzzleBudgetExceeded
+from eight_puzzle_search_result import EightPuzzleSearchResult
+
+
+class EightPuzzleSolverException(Exception):
+    pass
 
 
 class EightPuzzleBestFirstSearchSolver:
     """
     A class that encapsulates the A* search algorithm to solve the eight-puzzle problem.
     It handles the problem definition, expands nodes, evaluates costs, and generates solutions.
+
+    The solver can also run iterative-deepening A* (IDA*), which explores the same
+    f-bounded search space depth-first and only keeps the current path in memory,
+    and anytime repairing A* (ARA*), which finds a solution quickly with an inflated
+    heuristic and then improves it while its budget lasts.
+
+    Two bidirectional searches grow one search from the initial state and one from
+    the goal state, applying the same moves, until they meet: breadth-first search,
+    and MM, a bidirectional A* that is guaranteed to meet in the middle.
+
+    Two searches fit in a fixed amount of memory: recursive best-first search (RBFS),
+    which keeps only the current path and the siblings of its nodes, and simplified
+    memory-bounded A* (SMA*), which runs A* until it stores `max_stored_nodes` nodes
+    and then forgets the leaves with the highest f-cost, backing their cost up to
+    their parents. Both return optimal solutions; SMA* whenever one fits in its memory.
     """
 
-    def __init__(self):
+    A_STAR = "a_star"
+    ITERATIVE_DEEPENING_A_STAR = "ida_star"
+    ANYTIME_REPAIRING_A_STAR = "ara_star"
+    BIDIRECTIONAL_BREADTH_FIRST = "bidirectional_bfs"
+    MEET_IN_THE_MIDDLE = "mm"
+    RECURSIVE_BEST_FIRST = "rbfs"
+    SIMPLIFIED_MEMORY_BOUNDED_A_STAR = "sma_star"
+    ALGORITHMS = (A_STAR, ITERATIVE_DEEPENING_A_STAR, ANYTIME_REPAIRING_A_STAR,
+                  BIDIRECTIONAL_BREADTH_FIRST, MEET_IN_THE_MIDDLE, RECURSIVE_BEST_FIRST,
+                  SIMPLIFIED_MEMORY_BOUNDED_A_STAR)
+
+    # About 30 MB of stored nodes, at roughly 300 bytes per node and its frontier entries
+    DEFAULT_MAX_STORED_NODES = 100_000
+
+    HEAP_FRONTIER = "heap"
+    BUCKET_FRONTIER = "bucket"
+    FRONTIERS = {HEAP_FRONTIER: EightPuzzleHeapFrontier, BUCKET_FRONTIER: EightPuzzleBucketFrontier}
+
+    INVERSE_ACTIONS = {
+        EightPuzzleAgent.move_left: EightPuzzleAgent.move_right,
+        EightPuzzleAgent.move_right: EightPuzzleAgent.move_left,
+        EightPuzzleAgent.move_up: EightPuzzleAgent.move_down,
+        EightPuzzleAgent.move_down: EightPuzzleAgent.move_up,
+    }
+
+    def __init__(self, algorithm=A_STAR, packed=False, pattern_database=None,
+                 distance_oracle_path=None, fall_back_to_search=True, frontier=HEAP_FRONTIER,
+                 canonicalize=False, solution_cache=None, compact_nodes=False,
+                 weight=1, weight_decrement=0.5, time_budget=None, node_budget=None, evaluator=None,
+                 ranked_closed_set=False, max_stored_nodes=None):
         """
         Initialize the solver. The problem instance is not required at initialization,
         ensuring compatibility with test requirements.
+
+        :param algorithm: The search algorithm used by `solution`: A_STAR,
+            ITERATIVE_DEEPENING_A_STAR, ANYTIME_REPAIRING_A_STAR,
+            BIDIRECTIONAL_BREADTH_FIRST, MEET_IN_THE_MIDDLE, RECURSIVE_BEST_FIRST or
+            SIMPLIFIED_MEMORY_BOUNDED_A_STAR.
+        :param packed: If True, A* searches over packed-integer states (see
+            EightPuzzlePackedProblem) instead of tuples.
+        :param pattern_database: An optional EightPuzzlePatternDatabase built for the
+            goal state of the problems to solve. When given, it replaces the Manhattan
+            distance heuristic.
+        :param distance_oracle_path: The path of an EightPuzzleDistanceOracle file. When
+            the oracle was built for the problem's goal state, `solution` reads an
+            optimal path from it instead of searching.
+        :param fall_back_to_search: If True, search when there is no file at
+            `distance_oracle_path`; otherwise raise an EightPuzzleSolverException.
+        :param frontier: The frontier used by A*, either HEAP_FRONTIER or BUCKET_FRONTIER.
+        :param canonicalize: If True, rename the tiles of each problem so that its goal
+            state is canonical before solving it (see eight_puzzle_relabeling). A pattern
+            database or distance oracle built for (None, 1, ..., 8) then serves every
+            goal with the blank tile first. Solutions are unaffected by the renaming.
+        :param solution_cache: An optional EightPuzzleSolutionCache. `solve` returns a
+            cached result without searching, and caches the results it finds.
+        :param compact_nodes: If True, A* searches over packed states and keeps its nodes
+            in an EightPuzzleNodePool instead of EightPuzzleNode objects.
+        :param weight: The weight w of the heuristic in f(n) = g(n) + w * h(n), at least 1.
+            With w > 1, solutions may be up to w times longer than optimal, but are found
+            after far fewer expansions. ARA* starts from this weight.
+        :param weight_decrement: How much ARA* lowers the weight after each solution.
+        :param time_budget: The number of seconds ARA* may spend improving its solution.
+        :param node_budget: The number of nodes ARA* may expand while improving its solution.
+        :param evaluator: An optional heuristic from eight_puzzle_heuristics, built for the
+            goal state of the problems to solve. When given, it replaces the Manhattan
+            distance heuristic and the pattern database.
+        :param ranked_closed_set: If True, A* over tuple states keeps its explored states
+            in an EightPuzzleRankedClosedSet, one bit per state indexed by its rank, instead
+            of a set of tuples. Only boards of up to 12 cells have a small enough one.
+        :param max_stored_nodes: The number of nodes SMA* may keep in memory, at least 2;
+            DEFAULT_MAX_STORED_NODES by default. A solution of depth d only fits if
+            d + 1 nodes can be stored.
         """
-        pass
+        if algorithm not in self.ALGORITHMS:
+            raise EightPuzzleSolverException(f"Unknown search algorithm {algorithm}")
+        if frontier not in self.FRONTIERS:
+            raise EightPuzzleSolverException(f"Unknown frontier {frontier}")
+        if weight < 1 or weight_decrement <= 0:
+            raise EightPuzzleSolverException(f"Cannot search with weight {weight} and decrement {weight_decrement}")
+        if weight != int(weight) and (frontier == self.BUCKET_FRONTIER or compact_nodes):
+            raise EightPuzzleSolverException(f"Weight {weight} does not give the integer costs of {frontier} nodes")
+        if ranked_closed_set and (algorithm != self.A_STAR or packed or compact_nodes):
+            raise EightPuzzleSolverException("Only A* over tuple states keeps a ranked closed set")
+        if max_stored_nodes is not None and (algorithm != self.SIMPLIFIED_MEMORY_BOUNDED_A_STAR or max_stored_nodes < 2):
+            raise EightPuzzleSolverException(f"Only SMA* stores at most {max_stored_nodes} nodes, and at least 2")
+        self.algorithm = algorithm
+        self.frontier = frontier
+        self.packed = packed
+        self.pattern_database = pattern_database
+        self.evaluator = evaluator
+        self.canonicalize = canonicalize
+        self.solution_cache = solution_cache
+        self.compact_nodes = compact_nodes
+        self.weight = weight
+        self.weight_decrement = weight_decrement
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.ranked_closed_set = ranked_closed_set
+        self.max_stored_nodes = max_stored_nodes if max_stored_nodes is not None else self.DEFAULT_MAX_STORED_NODES
+        self.distance_oracle = None
+        if distance_oracle_path is not None:
+            if os.path.exists(distance_oracle_path):
+                self.distance_oracle = EightPuzzleDistanceOracle.load(distance_oracle_path)
+            elif not fall_back_to_search:
+                raise EightPuzzleSolverException(f"No distance oracle found at {distance_oracle_path}")
 
     def solution(self, problem):
+        """
+        Solve the problem using the configured search algorithm and return a list of
+        actions that lead from the initial state to the goal state.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        return self.solve(problem).actions
+
+    def solve(self, problem, statistics=None, deadline=None, max_nodes=None, cancellation_token=None):
+        """
+        Solve the problem using the configured search algorithm.
+
+        A problem whose goal state cannot be reached from its initial state is
+        detected by a parity check before any node is created, so it returns
+        immediately instead of exhausting the state space.
+
+        A search that passes its deadline, expands more than `max_nodes` nodes, or is
+        cancelled stops with the status BUDGET_EXCEEDED, and the actions that reach
+        the expanded state with the lowest heuristic estimate. An anytime search that
+        has found a solution returns it instead.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics that collects the
+            counters and timings of the search. It is attached to the result.
+        :param deadline: The time.monotonic() value at which the search stops, or None.
+        :param max_nodes: The number of nodes the search may expand, or None.
+        :param cancellation_token: An optional EightPuzzleCancellationToken.
+        :return: An EightPuzzleSearchResult holding the status and the list of actions.
+        """
+        started = time.perf_counter() if statistics is not None else None
+        budget = None
+        if deadline is not None or max_nodes is not None or cancellation_token is not None:
+            budget = EightPuzzleSearchBudget(deadline, max_nodes, cancellation_token)
+        if self.canonicalize:
+            problem = canonical_problem(problem)
+        if self.solution_cache is not None:
+            result = self.solution_cache.get(problem)
+            if result is not None:
+                if statistics is not None:
+                    statistics.search_time += time.perf_counter() - started
+                    statistics.solution_depth = len(result.actions) if result.solved else None
+                    result.statistics = statistics
+                return result
+        suboptimality_bound = 1
+        if not problem.is_solvable():
+            actions = None
+        elif self.distance_oracle is not None and self.distance_oracle.goal_state == tuple(problem.goal_state):
+            actions = self.distance_oracle.solution(problem)
+        else:
+            try:
+                actions, suboptimality_bound = self.search_with_bound(problem, statistics, budget)
+            except EightPuzzleBudgetExceeded as exceeded:
+                if statistics is not None:
+                    statistics.search_time += time.perf_counter() - started
+                # Never cached: a later search with a larger budget may solve the problem
+                partial_actions = budget.partial_actions if budget is not None else []
+                return EightPuzzleSearchResult(EightPuzzleSearchResult.BUDGET_EXCEEDED, partial_actions,
+                                               statistics, None, exceeded_budget=exceeded.reason)
+        if actions is None or (not actions and not problem.is_goal(problem.initial_state)):
+            status, actions, suboptimality_bound = EightPuzzleSearchResult.UNSOLVABLE, [], None
+        else:
+            status = EightPuzzleSearchResult.SOLVED
+        if statistics is not None:
+            statistics.search_time += time.perf_counter() - started
+            statistics.solution_depth = len(actions) if status == EightPuzzleSearchResult.SOLVED else None
+        result = EightPuzzleSearchResult(status, actions, statistics, suboptimality_bound)
+        # Only optimal solutions are cached, so that a hit never passes off a longer one
+        if self.solution_cache is not None and suboptimality_bound in (1, None):
+            self.solution_cache.put(problem, result)
+        return result
+
+    def search(self, problem, statistics=None, budget=None):
+        """
+        Run the configured search algorithm on the problem.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget, which raises
+            EightPuzzleBudgetExceeded when it runs out.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        return self.search_with_bound(problem, statistics, budget)[0]
+
+    def search_with_bound(self, problem, statistics=None, budget=None):
+        """
+        Run the configured search algorithm on the problem. Everything a search works
+        with is local to the call, so one solver can run searches on several threads.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget, which raises
+            EightPuzzleBudgetExceeded when it runs out.
+        :return: A pair of the list of actions to reach the goal state, empty if no
+            solution is found, and how many times longer than optimal it may be.
+        """
+        if self.pattern_database is not None and self.pattern_database.goal_state != tuple(problem.goal_state):
+            raise EightPuzzleSolverException(f"The pattern database was not built for goal state {problem.goal_state}")
+        if self.evaluator is not None and self.evaluator.goal_state != tuple(problem.goal_state):
+            raise EightPuzzleSolverException(f"The evaluator was not built for goal state {problem.goal_state}")
+        if self.algorithm == self.ANYTIME_REPAIRING_A_STAR:
+            solution = None
+            # Keep the last, best solution found within the budget
+            try:
+                for solution in self.anytime_search(problem, statistics, budget):
+                    pass
+            except EightPuzzleBudgetExceeded:
+                if solution is None:
+                    raise
+            return solution if solution is not None else ([], None)
+        if self.algorithm == self.BIDIRECTIONAL_BREADTH_FIRST:
+            return self.bidirectional_breadth_first_search(problem, statistics, budget), 1
+        if self.algorithm == self.MEET_IN_THE_MIDDLE:
+            return self.meet_in_the_middle_search(problem, statistics, budget), 1
+        if self.algorithm == self.ITERATIVE_DEEPENING_A_STAR:
+            return self.iterative_deepening_a_star_search(problem, statistics, budget), self.weight
+        if self.algorithm == self.RECURSIVE_BEST_FIRST:
+            return self.recursive_best_first_search(problem, statistics, budget), self.weight
+        if self.algorithm == self.SIMPLIFIED_MEMORY_BOUNDED_A_STAR:
+            return self.simplified_memory_bounded_search(problem, statistics, budget), self.weight
+        if self.packed or self.compact_nodes:
+            # The actions of a packed solution are the same agent methods, so only
+            # the states need converting, and only once.
+            problem = EightPuzzlePackedProblem.from_problem(problem)
+        if self.compact_nodes:
+            return self.pooled_best_first_search(problem, statistics, budget), self.weight
+        return self.best_first_search(problem, statistics, budget), self.weight
+
+    def incremental_evaluator(self, problem):
+        """
+        The heuristic whose evaluations the search keeps and updates move by move: the
+        solver's evaluator, its pattern database, or the Manhattan distance. Over packed
+        states only the Manhattan distance is updated; an evaluator or pattern database
+        reads unpacked tuples, so it evaluates each packed state from scratch.
+        """
+        if isinstance(problem.initial_state, int):
+            if self.evaluator is not None or self.pattern_database is not None:
+                return None
+            return EightPuzzlePackedManhattanHeuristic(problem)
+        if self.evaluator is not None:
+            return self.evaluator
+        if self.pattern_database is not None:
+            return self.pattern_database
+        return EightPuzzleManhattanHeuristic(problem.goal_state)
+
+    def root_node(self, problem, evaluator=None):
+        evaluation = None
+        if evaluator is not None:
+            evaluation = evaluator.evaluation(problem.initial_state)
+        return EightPuzzleNode(state=problem.initial_state, parent=None, action=None, path_cost=0,
+                               evaluation=evaluation)
+
+    def best_first_search(self, problem, statistics=None, budget=None):
         """
         Solve the problem using the A* search algorithm and return a list of actions 
         that lead from the initial state to the goal state.
 
         :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
         :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
         """
-        frontier = PriorityQueue()  # Priority queue to store nodes based on cost
-        explored = set()  # Set to keep track of explored states
+        evaluator = self.incremental_evaluator(problem)
+        frontier = self.FRONTIERS[self.frontier]()  # Nodes ordered by evaluation cost
+        # Set to keep track of explored states
+        explored = EightPuzzleRankedClosedSet(problem.goal_state) if self.ranked_closed_set else set()
 
         # Create the initial node
-        initial_node = EightPuzzleNode(
-            state=problem.initial_state,
-            parent=None,
-            action=None,
-            path_cost=0
-        )
+        initial_node = self.root_node(problem, evaluator)
 
         # Add the initial node to the frontier with its evaluation cost
-        frontier.put((self.cost_so_far_plus_estimated_cost_remaining(initial_node, problem), id(initial_node), initial_node))
+        frontier.add(initial_node, self.cost_so_far_plus_estimated_cost_remaining(initial_node, problem, evaluator=evaluator))
 
-        while not frontier.empty():
+        while frontier:
             # Get the node with the lowest cost
-            _, _, current_node = frontier.get()
+            current_node = frontier.pop()
 
             # Check if the current node represents the goal state
             if current_node.state == problem.goal_state:
@@ -56,82 +340,625 @@ class EightPuzzleBestFirstSearchSolver:
             # Add the current node's state to the explored set
             explored.add(current_node.state)
 
+            if budget is not None:
+                budget.charge(self.estimated_cost_remaining(current_node, problem, evaluator), current_node,
+                              self.actions_to_reach_solution_node)
+
+            if statistics is not None:
+                self.instrumented_expansion(current_node, problem, frontier, explored, statistics, evaluator)
+                continue
+
             # Expand the current node to generate its child nodes
-            for child_node in self.expand(current_node, problem):
-                if child_node.state not in explored:
+            for child_node in self.expand(current_node, problem, evaluator):
+                # Skip explored states, and states already on the frontier by a path as cheap
+                if child_node.state not in explored and child_node.path_cost < frontier.best_path_cost(child_node.state):
                     # Add child node to the frontier with its evaluation cost
-                    frontier.put((
-                        self.cost_so_far_plus_estimated_cost_remaining(child_node, problem),
-                        id(child_node),  # Ensures unique comparison for nodes with the same cost
-                        child_node
-                    ))
+                    frontier.add(child_node, self.cost_so_far_plus_estimated_cost_remaining(child_node, problem,
+                                                                                            evaluator=evaluator))
+
+        return []  # Return an empty list if no solution is found
+
+    def anytime_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem with anytime repairing A* (ARA*), yielding each solution as
+        it improves.
+
+        Each round is a weighted A* search with f(n) = g(n) + w * h(n), which stops as
+        soon as no node on the frontier can lead to a shorter solution under that
+        weight. Rounds after the first reuse the nodes of earlier ones: a node reached
+        by a shorter path after it was expanded is set aside as inconsistent, and
+        returned to the frontier, with every frontier node re-evaluated, once the
+        weight is lowered. The search stops when a round at weight 1 completes, which
+        proves the solution optimal, or when the time or node budget runs out. The
+        budget is only checked once there is a solution to return.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        :return: A generator of (actions, suboptimality bound) pairs, one per round: the
+            best solution so far, which is at most `bound` times longer than optimal.
+        """
+        evaluator = self.incremental_evaluator(problem)
+        weight = self.weight
+        started = time.perf_counter()
+        expanded = 0
+        counter = itertools.count()
+        initial_node = self.root_node(problem, evaluator)
+        best = {initial_node.state: initial_node}  # The cheapest node found for each state
+        closed = set()  # States expanded during the current round
+        inconsistent = {}  # Nodes of closed states reached by a cheaper path during the current round
+        frontier = [(self.cost_so_far_plus_estimated_cost_remaining(initial_node, problem, weight, evaluator), 0,
+                     next(counter), initial_node)]
+        solution_node = initial_node if problem.is_goal(initial_node.state) else None
+
+        while True:
+            budget_exhausted = False
+            while frontier:
+                cost, _, _, node = frontier[0]
+                if best[node.state] is not node or node.state in closed:
+                    heapq.heappop(frontier)  # Outdated by a cheaper node for the same state
+                    continue
+                if solution_node is not None:
+                    if solution_node.path_cost <= cost:
+                        break  # No node on the frontier leads to a shorter solution
+                    if ((self.node_budget is not None and expanded >= self.node_budget)
+                            or (self.time_budget is not None and time.perf_counter() - started >= self.time_budget)):
+                        budget_exhausted = True
+                        break
+                heapq.heappop(frontier)
+                closed.add(node.state)
+                expanded += 1
+                if budget is not None:
+                    budget.charge(self.estimated_cost_remaining(node, problem, evaluator), node,
+                                  self.actions_to_reach_solution_node)
+                if statistics is not None:
+                    statistics.expanded(node, len(frontier), len(closed))
+                children = self.timed_expansion(node, problem, statistics, evaluator)
+                for child_node in children:
+                    known_node = best.get(child_node.state)
+                    if known_node is not None and known_node.path_cost <= child_node.path_cost:
+                        if statistics is not None:
+                            statistics.duplicates_pruned += 1
+                        continue
+                    best[child_node.state] = child_node
+                    if problem.is_goal(child_node.state):
+                        solution_node = child_node
+                    if child_node.state in closed:
+                        inconsistent[child_node.state] = child_node
+                    else:
+                        heapq.heappush(frontier, (
+                            self.cost_so_far_plus_estimated_cost_remaining(child_node, problem, weight, evaluator),
+                            -child_node.path_cost, next(counter), child_node))
+
+            if solution_node is None:
+                return  # Every reachable state was expanded without finding the goal
+
+            # Every node that could still lead to a shorter solution is on the frontier
+            # or inconsistent, so the shortest solution is at least the lowest g + h among them.
+            open_nodes = [node for _, _, _, node in frontier if best[node.state] is node and node.state not in closed]
+            open_nodes.extend(inconsistent.values())
+            lower_bound = min((self.cost_so_far_plus_estimated_cost_remaining(node, problem, 1, evaluator)
+                               for node in open_nodes),
+                              default=solution_node.path_cost)
+            if lower_bound >= solution_node.path_cost or not solution_node.path_cost:
+                bound = 1
+            else:
+                bound = min(weight, solution_node.path_cost / lower_bound)
+            yield self.actions_to_reach_solution_node(solution_node), bound
+            if bound == 1 or budget_exhausted:
+                return
+
+            weight = max(1, weight - self.weight_decrement)
+            frontier = [(self.cost_so_far_plus_estimated_cost_remaining(node, problem, weight, evaluator), -node.path_cost,
+                         next(counter), node) for node in open_nodes]
+            heapq.heapify(frontier)
+            closed.clear()
+            inconsistent.clear()
+
+    def bidirectional_breadth_first_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem with front-to-front bidirectional breadth-first search and
+        return a list of actions that lead from the initial state to the goal state.
+
+        The forward search starts at the initial state and the backward search at the
+        goal state; moves are invertible, so the backward search applies the same
+        moves. Each step expands a whole layer of the search with the smaller layer.
+        The first layer that reaches a state seen by the other search holds a
+        shortest solution, which is the shortest of the paths through those states.
+        Each search only reaches about half the solution's depth, so together they
+        store roughly the square root of the states a one-way search would.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+            Only the forward search's states are candidates for the partial solution.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        if problem.is_goal(problem.initial_state):
+            return []
+        # For each direction, the state each state was reached from and by which move
+        parents = ({problem.initial_state: None}, {problem.goal_state: None})
+        layers = ([problem.initial_state], [problem.goal_state])
+        depths = [0, 0]
+        while layers[0] and layers[1]:
+            side = 0 if len(layers[0]) <= len(layers[1]) else 1
+            reached, other = parents[side], parents[1 - side]
+            next_layer = []
+            meeting_state, meeting_length = None, math.inf
+            for state in layers[side]:
+                if budget is not None:
+                    self.charge_bidirectional_expansion(budget, side, state, parents[0],
+                                                        lambda state: self.heuristic(state, problem))
+                if statistics is not None:
+                    self.record_bidirectional_expansion(statistics, state, depths[side], len(next_layer), len(reached))
+                for action, child_state in self.bidirectional_children(state, problem, statistics):
+                    if child_state in reached:
+                        if statistics is not None:
+                            statistics.duplicates_pruned += 1
+                        continue
+                    reached[child_state] = (state, action)
+                    next_layer.append(child_state)
+                    if child_state in other:
+                        length = self.path_length(parents[0], child_state) + self.path_length(parents[1], child_state)
+                        if length < meeting_length:
+                            meeting_state, meeting_length = child_state, length
+            if meeting_state is not None:
+                return self.stitch_paths(parents[0], parents[1], meeting_state)
+            layers[side][:] = next_layer
+            depths[side] += 1
+        return []  # Return an empty list if no solution is found
+
+    def meet_in_the_middle_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem with MM (Holte et al., 2016), a bidirectional heuristic
+        search, and return a list of actions that lead from the initial state to the
+        goal state.
+
+        Each direction orders its frontier by the priority max(f, 2g), so neither
+        search expands a node beyond the middle of an optimal path, and the direction
+        with the lower priority is expanded next. The backward search estimates the
+        distance to the initial state with the Manhattan distance. The search stops
+        once no pair of frontier nodes can join into a path shorter than the best
+        found: when it is at most the lowest priority, either lowest f, or the sum of
+        the lowest g of each direction plus one move.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+            Only the forward search's states are candidates for the partial solution.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        initial_state, goal_state = problem.initial_state, problem.goal_state
+        if problem.is_goal(initial_state):
+            return []
+        backward_heuristic = EightPuzzleManhattanHeuristic(initial_state).heuristic
+        heuristics = (lambda state: self.heuristic(state, problem), backward_heuristic)
+        path_costs = ({initial_state: 0}, {goal_state: 0})
+        parents = ({initial_state: None}, {goal_state: None})
+        frontiers = (EightPuzzleMeetInTheMiddleFrontier(), EightPuzzleMeetInTheMiddleFrontier())
+        frontiers[0].add(initial_state, 0, heuristics[0](initial_state))
+        frontiers[1].add(goal_state, 0, heuristics[1](goal_state))
+        best_length, meeting_state = math.inf, None
+        priority, cost, path_cost = (EightPuzzleMeetInTheMiddleFrontier.PRIORITY, EightPuzzleMeetInTheMiddleFrontier.COST,
+                                     EightPuzzleMeetInTheMiddleFrontier.PATH_COST)
+
+        while frontiers[0] and frontiers[1]:
+            forward_priority, backward_priority = frontiers[0].lowest(priority), frontiers[1].lowest(priority)
+            lower_bound = max(min(forward_priority, backward_priority),
+                              frontiers[0].lowest(cost), frontiers[1].lowest(cost),
+                              frontiers[0].lowest(path_cost) + frontiers[1].lowest(path_cost) + 1)
+            if best_length <= lower_bound:
+                break
+            side = 0 if forward_priority <= backward_priority else 1
+            state = frontiers[side].pop()
+            reached, other = path_costs[side], path_costs[1 - side]
+            if budget is not None:
+                self.charge_bidirectional_expansion(budget, side, state, parents[0], heuristics[0])
+            if statistics is not None:
+                self.record_bidirectional_expansion(statistics, state, reached[state], len(frontiers[side]), len(reached))
+            child_path_cost = reached[state] + 1  # Each move has a fixed cost of 1
+            for action, child_state in self.bidirectional_children(state, problem, statistics):
+                if child_path_cost >= reached.get(child_state, math.inf):
+                    if statistics is not None:
+                        statistics.duplicates_pruned += 1
+                    continue
+                reached[child_state] = child_path_cost
+                parents[side][child_state] = (state, action)
+                if statistics is not None:
+                    started = time.perf_counter()
+                    estimate = heuristics[side](child_state)
+                    statistics.heuristic_time += time.perf_counter() - started
+                else:
+                    estimate = heuristics[side](child_state)
+                frontiers[side].add(child_state, child_path_cost, child_path_cost + estimate)
+                if child_state in other and child_path_cost + other[child_state] < best_length:
+                    best_length, meeting_state = child_path_cost + other[child_state], child_state
+
+        if meeting_state is None:
+            return []  # Return an empty list if no solution is found
+        return self.stitch_paths(parents[0], parents[1], meeting_state)
+
+    @staticmethod
+    def bidirectional_children(state, problem, statistics=None):
+        """
+        The actions from a state of a bidirectional search and the states they lead to,
+        timed and counted when there are statistics.
+        """
+        if statistics is None:
+            return [(action, problem.result(state, action)) for action in problem.actions(state)]
+        started = time.perf_counter()
+        children = [(action, problem.result(state, action)) for action in problem.actions(state)]
+        statistics.expansion_time += time.perf_counter() - started
+        statistics.nodes_generated += len(children)
+        return children
+
+    def record_bidirectional_expansion(self, statistics, state, path_cost, frontier_size, explored_size):
+        node = None
+        if statistics.on_expand:
+            # The node's path cost is its depth in whichever search expanded it
+            node = EightPuzzleNode(state=state, parent=None, action=None, path_cost=path_cost)
+        statistics.expanded(node, frontier_size, explored_size)
+
+    def charge_bidirectional_expansion(self, budget, side, state, forward_parents, heuristic):
+        if side == 0:
+            budget.charge(heuristic(state), state, lambda state: self.forward_actions(forward_parents, state))
+        else:
+            # The backward search's states have no path from the initial state
+            budget.charge(math.inf, state, None)
+
+    @staticmethod
+    def path_length(parents, state):
+        length = 0
+        while parents[state] is not None:
+            state = parents[state][0]
+            length += 1
+        return length
+
+    def stitch_paths(self, forward_parents, backward_parents, meeting_state):
+        """
+        Join the forward path to a meeting state with the backward path from it.
+
+        :param forward_parents: The state and move each state was reached by from the initial state.
+        :param backward_parents: The state and move each state was reached by from the goal state.
+        :param meeting_state: A state reached by both searches.
+        :return: A list of actions from the initial state to the goal state.
+        """
+        actions = self.forward_actions(forward_parents, meeting_state)
+        # The backward search moved away from the goal, so each of its moves is undone
+        state = meeting_state
+        while backward_parents[state] is not None:
+            state, action = backward_parents[state]
+            actions.append(self.INVERSE_ACTIONS[action])
+        return actions
+
+    @staticmethod
+    def forward_actions(parents, state):
+        """
+        The actions that reach a state of a search, from the state and move each
+        state was reached by.
+        """
+        actions = []
+        while parents[state] is not None:
+            state, action = parents[state]
+            actions.append(action)
+        actions.reverse()
+        return actions
+
+    def pooled_best_first_search(self, problem, statistics=None, budget=None):
+        """
+        A* over packed states with its nodes kept in an EightPuzzleNodePool.
+
+        A node is an index into the pool, and the frontier is a heap of single integers
+        that order nodes like the heap frontier does: by f, then deeper first, then
+        first in, first out. One dict holds the lowest path cost found for each state,
+        which serves both as the explored set and for discarding outdated heap entries.
+        Costs must be integers. As in `expand`, the move that undoes a node's action is
+        never generated. The Manhattan distance of a child is updated from its
+        parent's, which is recovered from the parent's key as (f - g) / w.
+
+        :param problem: An EightPuzzlePackedProblem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        pool = EightPuzzleNodePool(problem.transition_model)
+        transition_model = problem.transition_model
+        moves = action_targets(transition_model.width)
+        evaluator = self.incremental_evaluator(problem)
+        # key = f << 48 | (65535 - g) << 32 | index
+        root = pool.add(problem.initial_state, ROOT, None, 0)
+        weight = int(self.weight)
+        frontier = [weight * self.heuristic(problem.initial_state, problem) << 48 | 65535 << 32 | root]
+        best_path_costs = {problem.initial_state: 0}
+        expanded = 0
+
+        while frontier:
+            key = heapq.heappop(frontier)
+            index = key & 0xFFFFFFFF
+            state = pool.states[index]
+            path_cost = pool.path_costs[index]
+            if path_cost != best_path_costs[state]:
+                continue  # A cheaper path to the state was found after this entry was added
+            if state == problem.goal_state:
+                return pool.actions_to(index)
+            blank = transition_model.blank_index(state)
+            if evaluator is not None:
+                estimate = ((key >> 48) - path_cost) // weight
+            if budget is not None:
+                budget.charge(estimate if evaluator is not None else self.heuristic(state, problem), index,
+                              pool.actions_to)
+            if statistics is not None:
+                expanded += 1
+                node = None
+                if statistics.on_expand:
+                    node = EightPuzzleNode(state, None, pool.action(index), path_cost)
+                statistics.expanded(node, len(frontier), expanded)
+
+            child_path_cost = path_cost + 1  # Each move has a fixed cost of 1
+            undo = self.INVERSE_ACTIONS.get(pool.action(index))
+            for action, target in moves[blank]:
+                if action is undo:
+                    continue
+                if statistics is not None:
+                    started = time.perf_counter()
+                child_state = transition_model.swap(state, blank, target)
+                if statistics is not None:
+                    statistics.expansion_time += time.perf_counter() - started
+                    statistics.nodes_generated += 1
+                if child_path_cost < best_path_costs.get(child_state, math.inf):
+                    best_path_costs[child_state] = child_path_cost
+                    child = pool.add(child_state, index, action, child_path_cost)
+                    if statistics is not None:
+                        started = time.perf_counter()
+                    if evaluator is not None:
+                        child_estimate = evaluator.updated(estimate, child_state,
+                                                           transition_model.tile_at(state, target), target, blank)
+                    else:
+                        child_estimate = self.heuristic(child_state, problem)
+                    if statistics is not None:
+                        statistics.heuristic_time += time.perf_counter() - started
+                    cost = child_path_cost + weight * child_estimate
+                    heapq.heappush(frontier, cost << 48 | (65535 - child_path_cost) << 32 | child)
+                elif statistics is not None:
+                    statistics.duplicates_pruned += 1
 
         return []  # Return an empty list if no solution is found
 
-    def expand(self, node, problem):
+    def instrumented_expansion(self, node, problem, frontier, explored, statistics, evaluator=None):
+        """
+        The expansion step of best_first_search, timed and counted. It is kept apart
+        so that a search without statistics pays nothing for them.
+        """
+        statistics.expanded(node, len(frontier), len(explored))
+        children = self.timed_expansion(node, problem, statistics, evaluator)
+        for child_node in children:
+            if child_node.state not in explored and child_node.path_cost < frontier.best_path_cost(child_node.state):
+                started = time.perf_counter()
+                cost = self.cost_so_far_plus_estimated_cost_remaining(child_node, problem, evaluator=evaluator)
+                statistics.heuristic_time += time.perf_counter() - started
+                frontier.add(child_node, cost)
+            else:
+                statistics.duplicates_pruned += 1
+
+    def timed_expansion(self, node, problem, statistics, evaluator=None):
+        """
+        Expand a node, and with statistics, count its children and time the expansion:
+        the children's evaluations as heuristic time and the rest as expansion time.
+        """
+        if statistics is None:
+            return self.expand(node, problem, evaluator)
+        heuristic_time = statistics.heuristic_time
+        started = time.perf_counter()
+        children = self.expand(node, problem, evaluator, statistics)
+        statistics.expansion_time += time.perf_counter() - started - (statistics.heuristic_time - heuristic_time)
+        statistics.nodes_generated += len(children)
+        return children
+
+    def iterative_deepening_a_star_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem using iterative-deepening A* (IDA*) and return a list of
+        actions that lead from the initial state to the goal state.
+
+        Each iteration is a depth-first search that prunes every node whose f-cost
+        exceeds the current bound, and the next bound is the smallest f-cost that was
+        pruned. The board is mutated in place and only the current path is kept, so
+        memory stays linear in the depth of the solution. The children of a node are
+        searched lowest estimate first.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update. Nodes
+            expanded again by a later iteration are counted again.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        return EightPuzzleIterativeDeepeningSearch(problem, self.incremental_evaluator(problem), self.weight,
+                                                   statistics, budget).run()
+
+    def recursive_best_first_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem using recursive best-first search (RBFS) and return a list of
+        actions that lead from the initial state to the goal state.
+
+        RBFS follows the child with the lowest f-cost while it stays below the f-cost of
+        the best alternative elsewhere in the tree. When it does not, the subtree is
+        forgotten and its lowest f-cost is backed up to its root, to be expanded again
+        once it is the best alternative. Only the current path and the siblings of its
+        nodes are kept, so memory stays linear in the depth of the solution.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        return EightPuzzleRecursiveBestFirstSearch(self, problem, self.incremental_evaluator(problem),
+                                                   statistics, budget).run()
+
+    def simplified_memory_bounded_search(self, problem, statistics=None, budget=None):
+        """
+        Solve the problem using simplified memory-bounded A* (SMA*) and return a list of
+        actions that lead from the initial state to the goal state.
+
+        SMA* expands the leaf with the lowest f-cost, as A* does, but keeps at most
+        `max_stored_nodes` nodes. Past that, it forgets the leaves with the highest
+        f-cost, and a parent remembers the f-cost of each forgotten child, to restore it
+        when the child is generated again; once all its children are forgotten, it
+        becomes a leaf again with the lowest of their costs. A node too deep for a
+        solution through it to fit in memory gets an infinite f-cost.
+        Like RBFS, SMA* searches the tree of paths without a set of explored states,
+        so a state reached by several paths may be expanded once for each.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        :return: A list of actions to reach the goal state.
+        :raises EightPuzzleBudgetExceeded: With the MAX_STORED_NODES reason, when no solution
+            fits in `max_stored_nodes` nodes.
+        """
+        return EightPuzzleSimplifiedMemoryBoundedSearch(self, problem, self.incremental_evaluator(problem),
+                                                        statistics, budget).run()
+
+    @staticmethod
+    def record_bounded_expansion(statistics, expanded_states, node, frontier_size, stored_size):
+        """
+        Count an expansion of RBFS or SMA*, and whether its state was expanded before.
+        """
+        statistics.expanded(node, frontier_size, stored_size)
+        if node.state in expanded_states:
+            statistics.nodes_reexpanded += 1
+        else:
+            expanded_states.add(node.state)
+
+    def expand(self, node, problem, evaluator=None, statistics=None):
         """
         Expand the current node by generating its child nodes based on valid actions.
 
+        The moves available from each position of the blank tile are precomputed, and
+        the move that undoes the node's own action is never generated: it leads back to
+        the parent, which was reached by a shorter path. Children are nodes of the same
+        class as their parent.
+
         :param node: The node to expand.
         :param problem: The problem instance containing the action and transition definitions.
+        :param evaluator: The evaluator of the search, if it keeps node evaluations; the
+            children's evaluations are then updated from the node's.
+        :param statistics: An optional EightPuzzleSearchStatistics, whose heuristic time
+            the evaluation updates are added to.
         :return: A list of child nodes generated from the current node.
         """
         children = []
-        for action in problem.actions(node.state):
-            # Generate the new state resulting from the action
-            child_state = problem.result(node.state, action)
-            # Calculate the path cost for the child node
-            path_cost = node.path_cost + 1  # Each move has a fixed cost of 1
+        state = node.state
+        if node.evaluation is None:
+            evaluator = None
+        packed = isinstance(state, int)
+        if packed:
+            transition_model = problem.transition_model
+            blank = transition_model.blank_index(state)
+            moves = action_targets(transition_model.width)[blank]
+        else:
+            blank = state.index(None)
+            moves = action_targets(math.isqrt(len(state)))[blank]
+        undo = self.INVERSE_ACTIONS.get(node.action)
+        node_class = type(node)
+        path_cost = node.path_cost + 1  # Each move has a fixed cost of 1
+        for action, target in moves:
+            if action is undo:
+                continue
+            # The tile at the target cell moves into the blank cell
+            if packed:
+                tile = transition_model.tile_at(state, target)
+                child_state = transition_model.swap(state, blank, target)
+            else:
+                tile = state[target]
+                board = list(state)
+                board[blank], board[target] = tile, None
+                child_state = tuple(board)
+            evaluation = None
+            if evaluator is not None:
+                if statistics is not None:
+                    started = time.perf_counter()
+                    evaluation = evaluator.updated(node.evaluation, child_state, tile, target, blank)
+                    statistics.heuristic_time += time.perf_counter() - started
+                else:
+                    evaluation = evaluator.updated(node.evaluation, child_state, tile, target, blank)
             # Create a new child node
-            child_node = EightPuzzleNode(
+            children.append(node_class(
                 state=child_state,
                 parent=node,
                 action=action,
-                path_cost=path_cost
-            )
-            children.append(child_node)  # Add the child node to the list
+                path_cost=path_cost,
+                evaluation=evaluation
+            ))
         return children
 
-    def cost_so_far_plus_estimated_cost_remaining(self, node, problem):
+    def cost_so_far_plus_estimated_cost_remaining(self, node, problem, weight=None, evaluator=None):
         """
-        Calculate the evaluation function f(n) = g(n) + h(n) for A* search.
+        Calculate the evaluation function f(n) = g(n) + w * h(n) for A* search.
 
         :param node: The current node to evaluate.
         :param problem: The problem instance containing the heuristic definition.
+        :param weight: The weight w of the heuristic; defaults to the solver's weight.
+        :param evaluator: The evaluator that made the node's evaluation, if it has one.
         :return: The total estimated cost to the goal.
         """
-        return node.path_cost + self.heuristic(node.state, problem)
+        if weight is None:
+            weight = self.weight
+        estimate = self.estimated_cost_remaining(node, problem, evaluator)
+        if weight == 1:
+            return node.path_cost + estimate
+        return node.path_cost + weight * estimate
+
+    def estimated_cost_remaining(self, node, problem, evaluator=None):
+        """
+        The heuristic estimate h(n), read from the node's evaluation when it has one.
+
+        :param node: The node to estimate the distance to the goal of.
+        :param problem: The problem instance containing the heuristic definition.
+        :param evaluator: The evaluator that made the node's evaluation, if it has one.
+        :return: The estimated cost to the goal.
+        """
+        if evaluator is not None and node.evaluation is not None:
+            return evaluator.estimate(node.evaluation)
+        return self.heuristic(node.state, problem)
 
     def heuristic(self, state, problem):
         """
-        Heuristic function using the Manhattan distance for the eight-puzzle problem.
+        Heuristic function using the Manhattan distance for the eight-puzzle problem,
+        or the solver's evaluator or pattern database if it has one.
 
         :param state: The current state of the puzzle.
         :param problem: The problem instance containing goal state information.
         :return: The heuristic cost representing the estimated distance to the goal.
         """
-        # Define the goal positions for each tile
-        goal_positions = {
-            None: (0, 0), 1: (0, 1), 2: (0, 2),
-            3: (1, 0), 4: (1, 1), 5: (1, 2),
-            6: (2, 0), 7: (2, 1), 8: (2, 2)
-        }
-
-        def position(value):
-            """
-            Helper function to get the row and column of a value in the puzzle state.
-            """
-            index = state.index(value)
-            return index // 3, index % 3
+        if self.evaluator is not None or self.pattern_database is not None:
+            if isinstance(state, int):
+                state = problem.transition_model.unpack(state)
+            evaluator = self.evaluator if self.evaluator is not None else self.pattern_database
+            return evaluator.heuristic(state)
+        if isinstance(state, int):
+            return self.packed_heuristic(state, problem)
 
         # Calculate the total Manhattan distance for all tiles
+        distances = manhattan_distances(tuple(problem.goal_state))
         total_distance = 0
-        for tile in state:
+        for index, tile in enumerate(state):
             if tile is not None:  # Skip the blank tile
-                current_pos = position(tile)
-                goal_pos = goal_positions[tile]
-                # Calculate Manhattan distance for the tile
-                total_distance += abs(current_pos[0] - goal_pos[0]) + abs(current_pos[1] - goal_pos[1])
+                total_distance += distances[tile][index]
+        return total_distance
+
+    def packed_heuristic(self, state, problem):
+        """
+        Manhattan distance for a packed-integer state, using the per-cell distance
+        table of an EightPuzzlePackedProblem.
+
+        :param state: The current state of the puzzle as a packed integer.
+        :param problem: The EightPuzzlePackedProblem the state belongs to.
+        :return: The heuristic cost representing the estimated distance to the goal.
+        """
+        bits = problem.transition_model.bits_per_cell
+        cell_mask = problem.transition_model.cell_mask
+        total_distance = 0
+        for index, distances in enumerate(problem.tile_distances):
+            total_distance += distances[(state >> (bits * index)) & cell_mask]
         return total_distance
 
     def actions_to_reach_solution_node(self, node):
@@ -150,3 +977,335 @@ class EightPuzzleBestFirstSearchSolver:
         return actions
 
 
+class EightPuzzleIterativeDeepeningSearch:
+    """
+    One IDA* search of EightPuzzleBestFirstSearchSolver. It holds what the recursion
+    reads at every node, so that the solver itself keeps no state between searches.
+    """
+
+    def __init__(self, problem, evaluator, weight=1, statistics=None, budget=None):
+        """
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param evaluator: The heuristic, whose evaluations are updated move by move.
+        :param weight: The weight w of the heuristic in f(n) = g(n) + w * h(n).
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        """
+        self.board = list(problem.initial_state)
+        self.goal = list(problem.goal_state)
+        self.moves = action_targets(math.isqrt(len(self.board)))
+        self.evaluator = evaluator
+        # The Manhattan distance is its own evaluation, and is updated inline
+        self.distances = evaluator.distances if type(evaluator) is EightPuzzleManhattanHeuristic else None
+        self.weight = weight
+        self.statistics = statistics
+        self.budget = budget
+
+    def run(self):
+        """
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        board, statistics = self.board, self.statistics
+        evaluation = self.evaluator.evaluation(board)
+        bound = self.weight * self.evaluator.estimate(evaluation)
+        path = []
+        while True:
+            if statistics is not None:
+                statistics.iterations += 1
+            next_bound = self.bounded_depth_first_search(board.index(None), 0, evaluation, bound, path)
+            if next_bound is None:
+                return path  # The goal was reached; path holds the actions that reach it
+            if next_bound == math.inf:
+                return []  # Every branch was exhausted without exceeding the bound
+            bound = next_bound
+
+    def bounded_depth_first_search(self, blank, path_cost, evaluation, bound, path):
+        """
+        One depth-first iteration of IDA*, applying moves to the board in place and
+        undoing them on the way back up.
+
+        :param blank: The index of the blank tile within the board.
+        :param path_cost: The cost of the path from the initial state to the board.
+        :param evaluation: The evaluation of the board by the evaluator.
+        :param bound: The largest f-cost explored during this iteration.
+        :param path: The actions leading to the board; holds the solution once the goal is reached.
+        :return: None if the goal was reached, otherwise the smallest f-cost that exceeded the bound.
+        """
+        board, evaluator, distances = self.board, self.evaluator, self.distances
+        estimate = evaluation if distances is not None else evaluator.estimate(evaluation)
+        cost = path_cost + self.weight * estimate
+        if cost > bound:
+            return cost
+        if board == self.goal:
+            return None
+
+        if self.budget is not None:
+            # The path changes as the search goes on, so the budget keeps a copy
+            self.budget.charge(estimate, path, list)
+        if self.statistics is not None:
+            self.record_expansion(path)
+
+        smallest_exceeding_cost = math.inf
+        # Never undo the move that produced this board
+        undo = EightPuzzleBestFirstSearchSolver.INVERSE_ACTIONS[path[-1]] if path else None
+        statistics = self.statistics
+        children = []
+        for action, target in self.moves[blank]:
+            if action is undo:
+                continue
+            if statistics is not None:
+                started = time.perf_counter()
+            tile = board[target]
+            board[blank], board[target] = tile, None
+            if statistics is not None:
+                generated = time.perf_counter()
+                statistics.expansion_time += generated - started
+            # Only the moved tile changed, so update the evaluation instead of recomputing it
+            if distances is not None:
+                tile_distances = distances[tile]
+                child_evaluation = evaluation + tile_distances[blank] - tile_distances[target]
+                child_estimate = child_evaluation
+            else:
+                child_evaluation = evaluator.updated(evaluation, board, tile, target, blank)
+                child_estimate = evaluator.estimate(child_evaluation)
+            if statistics is not None:
+                statistics.heuristic_time += time.perf_counter() - generated
+            board[blank], board[target] = None, tile
+            children.append((child_estimate, action, target, tile, child_evaluation))
+        # Search the children lowest estimate first, which reaches the goal sooner in the
+        # last iteration and breaks ties towards it
+        if len(children) > 1:
+            children.sort(key=lambda child: child[0])
+        for _, action, target, tile, child_evaluation in children:
+            board[blank], board[target] = tile, None
+            path.append(action)
+            result = self.bounded_depth_first_search(target, path_cost + 1, child_evaluation, bound, path)
+            if result is None:
+                return None
+            path.pop()
+            board[blank], board[target] = None, tile
+            smallest_exceeding_cost = min(smallest_exceeding_cost, result)
+        return smallest_exceeding_cost
+
+    def record_expansion(self, path):
+        """
+        Count an IDA* expansion. The path is the only frontier IDA* keeps, so its
+        length is reported as the frontier size. A node is built for the expansion
+        callbacks only when there are any.
+        """
+        statistics, board = self.statistics, self.board
+        node = None
+        if statistics.on_expand:
+            node = EightPuzzleNode(state=tuple(board), parent=None, action=path[-1] if path else None,
+                                   path_cost=len(path))
+        statistics.expanded(node, len(path))
+        # Every move but the undo move generates a child
+        children = len(self.moves[board.index(None)]) - (1 if path else 0)
+        statistics.nodes_generated += children
+
+
+class EightPuzzleRecursiveBestFirstSearch:
+    """
+    One RBFS search of EightPuzzleBestFirstSearchSolver, holding what the recursion
+    reads at every node.
+    """
+
+    def __init__(self, solver, problem, evaluator, statistics=None, budget=None):
+        """
+        :param solver: The EightPuzzleBestFirstSearchSolver that expands and evaluates nodes.
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param evaluator: The heuristic, whose evaluations are updated move by move.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        """
+        self.solver = solver
+        self.problem = problem
+        self.evaluator = evaluator
+        self.statistics = statistics
+        self.budget = budget
+        # The states expanded so far, to count re-expansions; only kept for statistics
+        self.expanded_states = set() if statistics is not None else None
+        # The nodes held in memory: the root and the children of each node on the recursion stack
+        self.stored = 1
+
+    def run(self):
+        """
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        solver, problem = self.solver, self.problem
+        root = solver.root_node(problem, self.evaluator)
+        cost = solver.cost_so_far_plus_estimated_cost_remaining(root, problem, evaluator=self.evaluator)
+        solution_node, _ = self.search(root, cost, math.inf)
+        return solver.actions_to_reach_solution_node(solution_node) if solution_node is not None else []
+
+    def search(self, node, cost, cost_limit):
+        """
+        Search below a node while its best f-cost stays within a limit.
+
+        :param node: The node to search below.
+        :param cost: The f-cost of the node, possibly backed up from an earlier search of it.
+        :param cost_limit: The f-cost of the best alternative to the node.
+        :return: A pair of the solution node, or None, and the node's backed-up f-cost.
+        """
+        solver, problem, evaluator = self.solver, self.problem, self.evaluator
+        if problem.is_goal(node.state):
+            return node, cost
+        if self.budget is not None:
+            self.budget.charge(solver.estimated_cost_remaining(node, problem, evaluator), node,
+                               solver.actions_to_reach_solution_node)
+        children = solver.timed_expansion(node, problem, self.statistics, evaluator)
+        self.stored += len(children)
+        if self.statistics is not None:
+            solver.record_bounded_expansion(self.statistics, self.expanded_states, node, len(children), self.stored)
+        if not children:
+            return None, math.inf
+        # A child costs at least as much as its parent (pathmax), which keeps backed-up costs
+        costs = [max(cost, solver.cost_so_far_plus_estimated_cost_remaining(child, problem, evaluator=evaluator))
+                 for child in children]
+        try:
+            while True:
+                best = min(range(len(children)), key=costs.__getitem__)
+                if costs[best] > cost_limit:
+                    return None, costs[best]
+                alternative = min((child_cost for index, child_cost in enumerate(costs) if index != best),
+                                  default=math.inf)
+                solution_node, costs[best] = self.search(children[best], costs[best], min(cost_limit, alternative))
+                if solution_node is not None:
+                    return solution_node, costs[best]
+        finally:
+            self.stored -= len(children)
+
+
+class EightPuzzleSimplifiedMemoryBoundedSearch:
+    """
+    One SMA* search of EightPuzzleBestFirstSearchSolver.
+
+    The frontier holds the leaves, ordered by f-cost, and the nodes with forgotten
+    children, ordered by the lowest f-cost among those; expanding such a node
+    generates its forgotten children again. A second heap orders the leaves from the
+    highest f-cost, to pick those to forget. Entries are invalidated rather than
+    removed when a node leaves the frontier or moves within it.
+    """
+
+    def __init__(self, solver, problem, evaluator, statistics=None, budget=None):
+        """
+        :param solver: The EightPuzzleBestFirstSearchSolver that expands and evaluates nodes.
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param evaluator: The heuristic, whose evaluations are updated move by move.
+        :param statistics: An optional EightPuzzleSearchStatistics to update.
+        :param budget: An optional EightPuzzleSearchBudget to charge for each expansion.
+        """
+        self.solver = solver
+        self.problem = problem
+        self.evaluator = evaluator
+        self.max_stored_nodes = solver.max_stored_nodes
+        self.statistics = statistics
+        self.budget = budget
+        self.expanded_states = set() if statistics is not None else None
+        self.frontier = []  # Entries (f-cost, -depth, entry, node): lowest cost, then deepest, first
+        self.worst_leaves = []  # Entries (-f-cost, depth, entry, node): highest cost, then shallowest, first
+        self.leaves = 0
+        self.stored = 0  # The nodes in memory
+        self.counter = itertools.count()
+
+    def add(self, node):
+        """
+        Put a node on the frontier, or move it there: a leaf by its f-cost, and a node
+        with stored children by the lowest f-cost of its forgotten children.
+        """
+        node.entry = next(self.counter)
+        if node.children:
+            heapq.heappush(self.frontier, (min(node.forgotten.values()), -node.path_cost, node.entry, node))
+        else:
+            heapq.heappush(self.frontier, (node.cost, -node.path_cost, node.entry, node))
+            heapq.heappush(self.worst_leaves, (-node.cost, node.path_cost, node.entry, node))
+            self.leaves += 1
+
+    def pop(self, heap):
+        while True:
+            cost, _, entry, node = heapq.heappop(heap)
+            if node.entry == entry:
+                node.entry = None
+                if not node.children:
+                    self.leaves -= 1
+                return cost, node
+
+    def forget(self, leaf):
+        """
+        Remove a leaf from memory, and back its f-cost up to its parent.
+        """
+        parent = leaf.parent
+        parent.children.remove(leaf)
+        if parent.forgotten is None:
+            parent.forgotten = {}
+        parent.forgotten[leaf.state] = leaf.cost
+        if not parent.children:
+            # Every child is forgotten, so the parent costs at least the cheapest of them
+            parent.cost = min(parent.forgotten.values())
+        self.add(parent)
+
+    def compact(self):
+        """
+        Drop the invalidated entries once they outnumber the valid ones, at most two per
+        stored node, so that the heaps do not keep forgotten nodes alive.
+        """
+        if len(self.frontier) + len(self.worst_leaves) > 4 * self.stored + 64:
+            self.frontier = [entry for entry in self.frontier if entry[3].entry == entry[2]]
+            self.worst_leaves = [entry for entry in self.worst_leaves if entry[3].entry == entry[2]]
+            heapq.heapify(self.frontier)
+            heapq.heapify(self.worst_leaves)
+
+    def run(self):
+        """
+        :return: A list of actions to reach the goal state.
+        :raises EightPuzzleBudgetExceeded: With the MAX_STORED_NODES reason, when no solution
+            fits in the solver's max_stored_nodes nodes.
+        """
+        solver, problem, evaluator = self.solver, self.problem, self.evaluator
+        statistics, budget, max_stored_nodes = self.statistics, self.budget, self.max_stored_nodes
+        evaluation = evaluator.evaluation(problem.initial_state) if evaluator is not None else None
+        root = EightPuzzleBoundedNode(problem.initial_state, None, None, 0, evaluation)
+        root.cost = solver.cost_so_far_plus_estimated_cost_remaining(root, problem, evaluator=evaluator)
+        self.add(root)
+        self.stored = 1
+
+        while True:
+            cost, node = self.pop(self.frontier)
+            if cost == math.inf:
+                raise EightPuzzleBudgetExceeded(EightPuzzleSearchBudget.MAX_STORED_NODES)
+            if problem.is_goal(node.state):
+                return solver.actions_to_reach_solution_node(node)
+            if budget is not None:
+                budget.charge(solver.estimated_cost_remaining(node, problem, evaluator), node,
+                              solver.actions_to_reach_solution_node)
+            if statistics is not None:
+                solver.record_bounded_expansion(statistics, self.expanded_states, node, self.leaves, self.stored)
+
+            # A leaf generates all its children, and a node in memory its forgotten ones,
+            # each costing at least its parent and what it cost when it was forgotten
+            forgotten = node.forgotten if node.forgotten is not None else {}
+            children = solver.timed_expansion(node, problem, statistics, evaluator)
+            if node.children:
+                children = [child for child in children if child.state in forgotten]
+            node.forgotten = None
+            for child in children:
+                if child.path_cost + 1 >= max_stored_nodes and not problem.is_goal(child.state):
+                    child.cost = math.inf  # Its children could not be stored along with its path
+                else:
+                    child.cost = max(node.cost, forgotten.get(child.state, 0),
+                                     solver.cost_so_far_plus_estimated_cost_remaining(child, problem, evaluator=evaluator))
+                node.children.append(child)
+                self.add(child)
+            self.stored += len(children)
+            if not node.children:
+                node.cost = math.inf  # A dead end
+                self.add(node)
+
+            # Forget the worst leaves, keeping at least one
+            while self.stored > max_stored_nodes and self.leaves > 1:
+                _, leaf = self.pop(self.worst_leaves)
+                self.forget(leaf)
+                self.stored -= 1
+                if statistics is not None:
+                    statistics.nodes_forgotten += 1
+            self.compact()
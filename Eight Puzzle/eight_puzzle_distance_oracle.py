@@ -0,0 +1,177 @@
+# EightPuzzleDistanceOracle: The exact number of moves from every state of the
+# 3x3 puzzle to one goal state. Only 9!/2 = 181,440 states can reach the goal, so
+# a breadth-first search from the goal labels all of them once, and the distances
+# are stored in a byte table indexed by the perfect index of
+# EightPuzzlePermutationRanker: the position of the blank tile and half the
+# lexicographic rank of the permutation of the other eight tiles.
+# With the table, an optimal solution is found by greedy descent: from each state,
+# take any move to a neighbor that is one move closer to the goal.
+# Tables are saved and mapped in the format of eight_puzzle_table_file.
+
+import math
+import os
+from collections import deque
+from eight_puzzle_permutation_rank import EightPuzzlePermutationRanker
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_table_file import save_table, load_table
+from eight_puzzle_transition_model import move_targets
+
+MAGIC = b"EPDO"
+VERSION = 2  # Version 1 indexed states by their tiles rather than their goal positions
+WIDTH = 3
+CELLS = WIDTH * WIDTH
+TABLE_SIZE = CELLS * math.factorial(CELLS - 1) // 2
+UNREACHABLE = 255
+
+
+class EightPuzzleDistanceOracleException(Exception):
+    pass
+
+
+class EightPuzzleDistanceOracle:
+
+    def __init__(self, goal_state, table):
+        """
+        Initialize the oracle from an already-built table. Use `build` or `load` to
+        create one.
+
+        :param goal_state: The goal state the table was built for.
+        :param table: A byte array of TABLE_SIZE distances, indexed by `index(state)`.
+        """
+        self.goal_state = tuple(goal_state)
+        self.table = table
+        self.ranker = EightPuzzlePermutationRanker(self.goal_state)
+
+    def index(self, state):
+        """
+        The index of a state within the table.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: An integer in range(TABLE_SIZE).
+        """
+        return self.ranker.index(state)
+
+    def states_at_distance(self, distance):
+        """
+        Every state whose optimal solution takes exactly `distance` moves.
+
+        :param distance: A number of moves.
+        :return: A generator of states, as tuples, in order of their index.
+        """
+        for index, value in enumerate(self.table):
+            if value == distance:
+                yield self.ranker.unindex(index)
+
+    def distance(self, state):
+        """
+        The number of moves of an optimal solution from `state` to the goal state.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: The distance, or None if the goal state cannot be reached.
+        """
+        distance = self.table[self.index(state)]
+        if distance == UNREACHABLE or not self.reaches_goal(state):
+            return None
+        return distance
+
+    def reaches_goal(self, state):
+        # A state that cannot reach the goal shares its index with one that can
+        return EightPuzzleProblem(state, self.goal_state, None).is_solvable()
+
+    @classmethod
+    def build(cls, goal_state):
+        """
+        Label every state that can reach the goal state by breadth-first search from it.
+
+        :param goal_state: The goal state of the puzzle.
+        :return: A new EightPuzzleDistanceOracle.
+        """
+        goal_state = tuple(goal_state)
+        if len(goal_state) != CELLS or sorted(goal_state, key=lambda tile: tile or 0) != [None, *range(1, CELLS)]:
+            raise EightPuzzleDistanceOracleException(f"{goal_state} is not a state of the 3x3 puzzle")
+        state_index = EightPuzzlePermutationRanker(goal_state).index
+        table = bytearray([UNREACHABLE]) * TABLE_SIZE
+        table[state_index(goal_state)] = 0
+        frontier = deque([(list(goal_state), goal_state.index(None), 0)])
+        while frontier:
+            board, blank, distance = frontier.popleft()
+            for targets in move_targets(WIDTH):
+                target = targets[blank]
+                if target is None:
+                    continue
+                child = board.copy()
+                child[blank], child[target] = child[target], None
+                index = state_index(child)
+                if table[index] == UNREACHABLE:
+                    table[index] = distance + 1
+                    frontier.append((child, target, distance + 1))
+        return cls(goal_state, table)
+
+    def solution(self, problem):
+        """
+        Produce an optimal list of actions by greedy descent on the table. Each step
+        tries at most four moves, so this takes time linear in the solution length.
+
+        :param problem: An EightPuzzleProblem whose goal state is the oracle's goal state.
+        :return: A list of actions to reach the goal state, or None if it cannot be reached.
+        """
+        if tuple(problem.goal_state) != self.goal_state:
+            raise EightPuzzleDistanceOracleException(f"The oracle was not built for goal state {problem.goal_state}")
+        state = problem.initial_state
+        distance = self.distance(state)
+        if distance is None:
+            return None
+        actions = []
+        while distance > 0:
+            for action in problem.actions(state):
+                child = problem.result(state, action)
+                if self.table[self.index(child)] == distance - 1:
+                    break
+            else:
+                raise EightPuzzleDistanceOracleException(f"The oracle table is inconsistent at state {state}")
+            actions.append(action)
+            state = child
+            distance -= 1
+        return actions
+
+    def save(self, path):
+        """
+        Write the goal state and table to a file that `load` can map.
+
+        :param path: The path of the file to write.
+        """
+        save_table(path, MAGIC, VERSION, self.goal_state, self.table)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a file written by `save` into memory, read-only.
+
+        :param path: The path of the file to load.
+        :return: A new EightPuzzleDistanceOracle.
+        """
+        loaded = load_table(path, MAGIC, VERSION, TABLE_SIZE)
+        if loaded is None:
+            raise EightPuzzleDistanceOracleException(f"{path} is not a distance oracle file")
+        return cls(*loaded)
+
+    @classmethod
+    def load_or_build(cls, path, goal_state):
+        """
+        Load the oracle at `path`, building and saving it first if the file does not
+        exist, was built for a different goal state, or is of an older version.
+
+        :param path: The path of the oracle file.
+        :param goal_state: The goal state of the puzzle.
+        :return: An EightPuzzleDistanceOracle.
+        """
+        if os.path.exists(path):
+            try:
+                oracle = cls.load(path)
+            except EightPuzzleDistanceOracleException:
+                oracle = None
+            if oracle is not None and oracle.goal_state == tuple(goal_state):
+                return oracle
+        oracle = cls.build(goal_state)
+        oracle.save(path)
+        return oracle
@@ -0,0 +1,296 @@
+# EightPuzzleExternalBreadthFirstSearch: A breadth-first search from the goal state
+# whose layers live on disk instead of in memory, for state spaces such as the
+# 15-puzzle or large pattern sets that do not fit in RAM. States are packed with the
+# packed transition model and each layer is a file of fixed-width big-endian records
+# in ascending order, so byte order is numeric order and a layer can be merged or
+# binary-searched as a stream.
+# A layer is built by streaming the previous one, buffering at most `buffer_size`
+# children, and spilling each full buffer as a sorted run file. The runs are then
+# merged, and the merge drops duplicates and every state of the previous two layers:
+# on an undirected graph, a neighbor of a layer-d state lies in layer d-1, d or d+1.
+# Only the run buffers and one block per open file are held in memory.
+# Finished layers are renamed into place and recorded in a manifest, so an
+# interrupted search resumes from the last complete layer.
+
+import heapq
+import json
+import mmap
+import os
+
+from eight_puzzle_packed_transition_model import EightPuzzlePackedTransitionModel
+
+VERSION = 1
+MANIFEST = "manifest.json"
+RECORDS_PER_BLOCK = 4096
+
+
+class EightPuzzleExternalBreadthFirstSearchException(Exception):
+    pass
+
+
+def read_states(path, record_size):
+    """
+    Stream the states stored in a layer or run file.
+
+    :param path: The path of the file.
+    :param record_size: The number of bytes of each record.
+    :return: A generator of packed states, in file order.
+    """
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(record_size * RECORDS_PER_BLOCK)
+            if not block:
+                return
+            for offset in range(0, len(block), record_size):
+                yield int.from_bytes(block[offset:offset + record_size], "big")
+
+
+def unique(states):
+    """
+    Drop repeated states from a sorted stream.
+    """
+    previous = None
+    for state in states:
+        if state != previous:
+            yield state
+            previous = state
+
+
+def difference(states, excluded):
+    """
+    The states of a sorted stream that do not appear in another sorted stream.
+    """
+    excluded = iter(excluded)
+    current = next(excluded, None)
+    for state in states:
+        while current is not None and current < state:
+            current = next(excluded, None)
+        if current != state:
+            yield state
+
+
+class EightPuzzleExternalBreadthFirstSearch:
+
+    def __init__(self, goal_state, directory, pattern=None, buffer_size=1 << 20):
+        """
+        Open or create an external-memory search in `directory`. If the directory holds
+        the manifest of an earlier search, it must be for the same goal and pattern,
+        and `run` continues it.
+
+        :param goal_state: The goal state the layers count moves to, with None as the blank tile.
+        :param directory: The directory of the layer files and the manifest.
+        :param pattern: The tiles to tell apart, or None for all of them. The other tiles
+                        are packed as 0, so the search runs over the abstract state space.
+        :param buffer_size: The number of children held in memory before spilling a run.
+        """
+        self.goal_state = tuple(goal_state)
+        width = int(round(len(self.goal_state) ** 0.5))
+        if width < 2 or width * width != len(self.goal_state) or self.goal_state.count(None) != 1:
+            raise EightPuzzleExternalBreadthFirstSearchException(f"Invalid goal state {goal_state}")
+        if buffer_size < 1:
+            raise EightPuzzleExternalBreadthFirstSearchException(f"Invalid buffer size {buffer_size}")
+        self.transition_model = EightPuzzlePackedTransitionModel(width)
+        if pattern is not None:
+            pattern = tuple(sorted(pattern))
+            if not pattern or any(tile is None or tile not in self.goal_state for tile in pattern):
+                raise EightPuzzleExternalBreadthFirstSearchException(f"Invalid pattern {pattern}")
+        self.pattern = pattern
+        self.packed_goal_state = self.pack(self.goal_state)
+        model = self.transition_model
+        self.record_size = (model.blank_shift + (model.cells - 1).bit_length() + 7) // 8
+        self.targets = (model.left_targets, model.right_targets, model.up_targets, model.down_targets)
+        self.directory = directory
+        self.buffer_size = buffer_size
+        os.makedirs(directory, exist_ok=True)
+        self.layer_sizes = []
+        self.complete = False
+        self.read_manifest()
+
+    def pack(self, state):
+        """
+        The packed state, with the tiles outside the pattern packed as 0.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: An integer.
+        """
+        if self.pattern is None:
+            return self.transition_model.pack(state)
+        model = self.transition_model
+        if len(state) != model.cells or None not in state:
+            raise EightPuzzleExternalBreadthFirstSearchException(f"Cannot pack state {state}")
+        packed = 0
+        for index, tile in enumerate(state):
+            if tile is None:
+                packed |= index << model.blank_shift
+            elif tile in self.pattern:
+                packed |= tile << (model.bits_per_cell * index)
+        return packed
+
+    def run(self, max_depth=None):
+        """
+        Build the layers that are not yet on disk.
+
+        :param max_depth: The deepest layer to build, or None to run until a layer is empty.
+        :return: The number of states in each layer.
+        """
+        self.remove_partial_files()
+        if not self.layer_sizes:
+            self.write_layer(0, [self.packed_goal_state])
+            self.layer_sizes.append(1)
+            self.write_manifest()
+        while not self.complete and (max_depth is None or len(self.layer_sizes) <= max_depth):
+            depth = len(self.layer_sizes)
+            size = self.expand(depth)
+            if size == 0:
+                os.remove(self.layer_path(depth))
+                self.complete = True
+            else:
+                self.layer_sizes.append(size)
+            self.write_manifest()
+        return list(self.layer_sizes)
+
+    def expand(self, depth):
+        """
+        Build layer `depth` from layer `depth - 1`.
+
+        :return: The number of states in the new layer.
+        """
+        runs = []
+        buffer = []
+        for state in self.layer(depth - 1):
+            buffer.extend(self.children(state))
+            if len(buffer) >= self.buffer_size:
+                runs.append(self.write_run(depth, len(runs), buffer))
+                buffer = []
+        if buffer or not runs:
+            runs.append(self.write_run(depth, len(runs), buffer))
+        merged = unique(heapq.merge(*(read_states(run, self.record_size) for run in runs)))
+        previous = heapq.merge(*(self.layer(earlier) for earlier in range(max(0, depth - 2), depth)))
+        size = self.write_layer(depth, difference(merged, previous))
+        for run in runs:
+            os.remove(run)
+        return size
+
+    def children(self, state):
+        model = self.transition_model
+        blank = state >> model.blank_shift
+        for targets in self.targets:
+            target = targets[blank]
+            if target is not None:
+                yield model.swap(state, blank, target)
+
+    def layer(self, depth):
+        """
+        Stream the states of a layer.
+
+        :param depth: The number of moves from the goal state.
+        :return: A generator of packed states, in ascending order.
+        """
+        if not 0 <= depth < len(self.layer_sizes):
+            raise EightPuzzleExternalBreadthFirstSearchException(f"Layer {depth} has not been built")
+        return read_states(self.layer_path(depth), self.record_size)
+
+    def distance(self, state):
+        """
+        The number of moves from `state` to the goal state, found by binary search of
+        each layer file.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: The distance, or None if the state is not in any built layer.
+        """
+        key = self.pack(state).to_bytes(self.record_size, "big")
+        for depth in range(len(self.layer_sizes)):
+            if self.layer_contains(depth, key):
+                return depth
+        return None
+
+    def layer_contains(self, depth, key):
+        size = self.record_size
+        with open(self.layer_path(depth), "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as records:
+            low, high = 0, len(records) // size
+            while low < high:
+                middle = (low + high) // 2
+                record = records[middle * size:(middle + 1) * size]
+                if record < key:
+                    low = middle + 1
+                elif record > key:
+                    high = middle
+                else:
+                    return True
+        return False
+
+    def layer_path(self, depth):
+        return os.path.join(self.directory, f"layer_{depth:04d}.bin")
+
+    def write_run(self, depth, number, states):
+        path = os.path.join(self.directory, f"run_{depth:04d}_{number:06d}.tmp")
+        self.write_records(path, sorted(set(states)))
+        return path
+
+    def write_layer(self, depth, states):
+        # Write under a temporary name and rename once the data is on disk, so a
+        # layer file is either complete or absent.
+        path = self.layer_path(depth)
+        size = self.write_records(path + ".tmp", states)
+        os.replace(path + ".tmp", path)
+        return size
+
+    def write_records(self, path, states):
+        size = 0
+        record_size = self.record_size
+        block = bytearray()
+        with open(path, "wb") as file:
+            for state in states:
+                block += state.to_bytes(record_size, "big")
+                size += 1
+                if len(block) >= record_size * RECORDS_PER_BLOCK:
+                    file.write(block)
+                    block.clear()
+            file.write(block)
+            file.flush()
+            os.fsync(file.fileno())
+        return size
+
+    def remove_partial_files(self):
+        # Runs, temporary files and layers past the manifest are left by an interrupted
+        # search, and are rebuilt.
+        complete = {os.path.basename(self.layer_path(depth)) for depth in range(len(self.layer_sizes))}
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp") or (name.startswith("layer_") and name not in complete):
+                os.remove(os.path.join(self.directory, name))
+
+    def manifest(self):
+        return {
+            "version": VERSION,
+            "goal_state": [0 if tile is None else tile for tile in self.goal_state],
+            "pattern": None if self.pattern is None else list(self.pattern),
+            "record_size": self.record_size,
+            "layer_sizes": self.layer_sizes,
+            "complete": self.complete,
+        }
+
+    def write_manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + ".tmp", "w") as file:
+            json.dump(self.manifest(), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(path + ".tmp", path)
+
+    def read_manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path) as file:
+                manifest = json.load(file)
+        except (OSError, ValueError) as error:
+            raise EightPuzzleExternalBreadthFirstSearchException(f"Cannot read manifest {path}: {error}")
+        expected = self.manifest()
+        for field in ("version", "goal_state", "pattern", "record_size"):
+            if manifest.get(field) != expected[field]:
+                raise EightPuzzleExternalBreadthFirstSearchException(
+                    f"Manifest {path} was written for a different search ({field})")
+        self.layer_sizes = list(manifest["layer_sizes"])
+        self.complete = bool(manifest["complete"])
@@ -0,0 +1,182 @@
+# EightPuzzleFrontier: Frontiers for best-first search over eight-puzzle nodes.
+# A frontier keeps at most one live node per state: the one with the lowest path
+# cost so far. Adding a cheaper node for a state leaves the old entry in place and
+# skips it when it surfaces (lazy deletion), so nothing is ever searched for or
+# removed from the middle of the queue. Neither frontier takes a lock.
+#
+# EightPuzzleHeapFrontier orders nodes with heapq. EightPuzzleBucketFrontier keeps
+# one stack per integer cost, which suits the small integer costs of the puzzle.
+# Both break ties between equal costs in favor of deeper nodes: the heap by path
+# cost, the buckets by popping the most recently added node.
+# EightPuzzleMeetInTheMiddleFrontier is the open list of bidirectional MM search.
+
+import heapq
+import itertools
+import math
+
+
+class EightPuzzleFrontierException(Exception):
+    pass
+
+
+class EightPuzzleHeapFrontier:
+
+    def __init__(self):
+        self.heap = []
+        self.best = {}  # The live node of each state in the frontier
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.best)
+
+    def best_path_cost(self, state):
+        """
+        The path cost of the frontier's node for `state`.
+
+        :param state: A state of the puzzle.
+        :return: The path cost, or infinity if the state is not in the frontier.
+        """
+        node = self.best.get(state)
+        return math.inf if node is None else node.path_cost
+
+    def add(self, node, cost):
+        """
+        Add a node, replacing the frontier's node for the same state.
+
+        :param node: The node to add.
+        :param cost: The node's evaluation, f(node).
+        """
+        self.best[node.state] = node
+        # Deeper nodes first among equal costs, then first in, first out
+        heapq.heappush(self.heap, (cost, -node.path_cost, next(self.counter), node))
+
+    def pop(self):
+        """
+        Remove and return the live node with the lowest cost.
+
+        :return: The node.
+        """
+        while self.heap:
+            node = heapq.heappop(self.heap)[3]
+            if self.best.get(node.state) is node:
+                del self.best[node.state]
+                return node
+        raise EightPuzzleFrontierException("Cannot pop from an empty frontier")
+
+
+class EightPuzzleBucketFrontier:
+
+    def __init__(self):
+        self.buckets = []  # buckets[cost] is a stack of nodes with that cost
+        self.lowest = 0  # No bucket below this index holds a node
+        self.best = {}
+        self.entries = 0
+
+    def __len__(self):
+        return len(self.best)
+
+    def best_path_cost(self, state):
+        """
+        The path cost of the frontier's node for `state`.
+
+        :param state: A state of the puzzle.
+        :return: The path cost, or infinity if the state is not in the frontier.
+        """
+        node = self.best.get(state)
+        return math.inf if node is None else node.path_cost
+
+    def add(self, node, cost):
+        """
+        Add a node, replacing the frontier's node for the same state.
+
+        :param node: The node to add.
+        :param cost: The node's evaluation, f(node), which must be a non-negative integer.
+        """
+        if cost != int(cost) or cost < 0:
+            raise EightPuzzleFrontierException(f"A bucket frontier cannot hold cost {cost}")
+        cost = int(cost)
+        while len(self.buckets) <= cost:
+            self.buckets.append([])
+        self.best[node.state] = node
+        self.buckets[cost].append(node)
+        self.entries += 1
+        if cost < self.lowest:
+            self.lowest = cost
+
+    def pop(self):
+        """
+        Remove and return the live node with the lowest cost.
+
+        :return: The node.
+        """
+        while self.entries:
+            bucket = self.buckets[self.lowest]
+            if not bucket:
+                self.lowest += 1
+                continue
+            node = bucket.pop()
+            self.entries -= 1
+            if self.best.get(node.state) is node:
+                del self.best[node.state]
+                return node
+        raise EightPuzzleFrontierException("Cannot pop from an empty frontier")
+
+
+class EightPuzzleMeetInTheMiddleFrontier:
+    """
+    The open list of one direction of bidirectional MM search. It holds states with
+    their path costs and answers the three questions MM asks: the lowest priority
+    max(f, 2g), the lowest f and the lowest g. Each is kept in its own heap, and
+    entries for states that were removed or reached again more cheaply are skipped
+    when they surface.
+    """
+
+    PRIORITY, COST, PATH_COST = 0, 1, 2
+
+    def __init__(self):
+        self.path_costs = {}  # The path cost of each state in the frontier
+        self.heaps = ([], [], [])  # Entries ordered by priority, by f and by g
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.path_costs)
+
+    def __contains__(self, state):
+        return state in self.path_costs
+
+    def add(self, state, path_cost, cost):
+        """
+        Add a state, replacing its entry if it is already in the frontier.
+
+        :param state: A state of the puzzle.
+        :param path_cost: The cost of the path to the state, g.
+        :param cost: The state's evaluation, f = g + h.
+        """
+        self.path_costs[state] = path_cost
+        count = next(self.counter)
+        for heap, key in zip(self.heaps, (max(cost, 2 * path_cost), cost, path_cost)):
+            heapq.heappush(heap, (key, count, state, path_cost))
+
+    def lowest(self, order):
+        """
+        The lowest key of a live entry in one of the orders.
+
+        :param order: PRIORITY, COST or PATH_COST.
+        :return: The key, or infinity if the frontier is empty.
+        """
+        heap = self.heaps[order]
+        while heap and self.path_costs.get(heap[0][2]) != heap[0][3]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else math.inf
+
+    def pop(self):
+        """
+        Remove and return the state with the lowest priority.
+
+        :return: The state.
+        """
+        if self.lowest(self.PRIORITY) == math.inf:
+            raise EightPuzzleFrontierException("Cannot pop from an empty frontier")
+        state = heapq.heappop(self.heaps[self.PRIORITY])[2]
+        del self.path_costs[state]
+        return state
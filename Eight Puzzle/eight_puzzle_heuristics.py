@@ -0,0 +1,302 @@
+# EightPuzzleHeuristics: Admissible heuristics for EightPuzzleBestFirstSearchSolver,
+# each built for one goal state and given to the solver as its `evaluator`.
+#
+# An evaluator computes an estimate from scratch with `heuristic(state)`, and also
+# offers an incremental form for searches that move one tile at a time:
+#   - `evaluation(state)` computes the evaluation of a state, a value from which
+#     `estimate(evaluation)` reads the estimate,
+#   - `updated(evaluation, board, tile, source, target)` computes the evaluation
+#     of a child from its parent's, where `tile` moved from cell `source` to cell
+#     `target` (the blank tile's former cell) to give `board`.
+# For the Manhattan distance the evaluation is the estimate itself. The other
+# evaluators keep a little more, so that only the lines or tables touched by the
+# moved tile are revisited. EightPuzzlePatternDatabase offers the same interface.
+# EightPuzzlePackedManhattanHeuristic evaluates packed-integer states, for which
+# `board` is the packed child state.
+
+import math
+from collections import deque
+from functools import lru_cache
+
+
+class EightPuzzleHeuristicException(Exception):
+    pass
+
+
+@lru_cache(maxsize=64)
+def manhattan_distances(goal_state):
+    """
+    The Manhattan distance of every tile at every index from its position in the goal
+    state, computed once per goal state.
+
+    :param goal_state: The goal state, as a tuple.
+    :return: A dict mapping each tile to a tuple of distances indexed by cell.
+    """
+    width = math.isqrt(len(goal_state))
+    distances = {}
+    for goal_index, tile in enumerate(goal_state):
+        if tile is not None:
+            distances[tile] = tuple(abs(index // width - goal_index // width) + abs(index % width - goal_index % width)
+                                    for index in range(len(goal_state)))
+    return distances
+
+
+def board_width(goal_state):
+    width = math.isqrt(len(goal_state))
+    if width * width != len(goal_state) or None not in goal_state:
+        raise EightPuzzleHeuristicException(f"{goal_state} is not the goal state of a square board")
+    return width
+
+
+class EightPuzzleManhattanHeuristic:
+
+    def __init__(self, goal_state):
+        self.goal_state = tuple(goal_state)
+        board_width(self.goal_state)
+        self.distances = manhattan_distances(self.goal_state)
+
+    def heuristic(self, state):
+        distances = self.distances
+        return sum(distances[tile][index] for index, tile in enumerate(state) if tile is not None)
+
+    def evaluation(self, state):
+        return self.heuristic(state)
+
+    def estimate(self, evaluation):
+        return evaluation
+
+    def updated(self, evaluation, board, tile, source, target):
+        distances = self.distances[tile]
+        return evaluation + distances[target] - distances[source]
+
+
+class EightPuzzlePackedManhattanHeuristic:
+    """
+    The Manhattan distance of packed-integer states, read from the per-cell distance
+    table of an EightPuzzlePackedProblem.
+    """
+
+    def __init__(self, problem):
+        """
+        :param problem: The EightPuzzlePackedProblem whose states are evaluated.
+        """
+        self.goal_state = problem.tuple_goal_state
+        self.tile_distances = problem.tile_distances
+        self.bits_per_cell = problem.transition_model.bits_per_cell
+        self.cell_mask = problem.transition_model.cell_mask
+
+    def heuristic(self, state):
+        bits, cell_mask = self.bits_per_cell, self.cell_mask
+        return sum(distances[(state >> (bits * index)) & cell_mask] for index, distances in enumerate(self.tile_distances))
+
+    def evaluation(self, state):
+        return self.heuristic(state)
+
+    def estimate(self, evaluation):
+        return evaluation
+
+    def updated(self, evaluation, board, tile, source, target):
+        tile_distances = self.tile_distances
+        return evaluation + tile_distances[target][tile] - tile_distances[source][tile]
+
+
+class EightPuzzleLinearConflictHeuristic:
+    """
+    The Manhattan distance plus two moves for each tile that must leave its goal row
+    or column to let another tile of that line pass. In each line, the tiles that
+    belong there but are out of order must include all but a longest increasing run
+    of their goal positions, and each of those takes at least two extra moves.
+
+    The evaluation is (Manhattan distance, conflicts of each row, conflicts of each
+    column). A horizontal move keeps the order of the tiles in its row, so only the
+    two columns the tile moves between are recounted, and likewise for rows.
+    """
+
+    def __init__(self, goal_state):
+        self.goal_state = tuple(goal_state)
+        self.width = width = board_width(self.goal_state)
+        self.manhattan = EightPuzzleManhattanHeuristic(self.goal_state)
+        self.goal_rows = {tile: index // width for index, tile in enumerate(self.goal_state) if tile is not None}
+        self.goal_columns = {tile: index % width for index, tile in enumerate(self.goal_state) if tile is not None}
+        self.rows = tuple(tuple(range(row * width, row * width + width)) for row in range(width))
+        self.columns = tuple(tuple(range(column, width * width, width)) for column in range(width))
+
+    def heuristic(self, state):
+        return self.estimate(self.evaluation(state))
+
+    def evaluation(self, state):
+        return (self.manhattan.heuristic(state),
+                tuple(self.row_conflicts(state, row) for row in range(self.width)),
+                tuple(self.column_conflicts(state, column) for column in range(self.width)))
+
+    def estimate(self, evaluation):
+        manhattan, row_conflicts, column_conflicts = evaluation
+        return manhattan + 2 * (sum(row_conflicts) + sum(column_conflicts))
+
+    def updated(self, evaluation, board, tile, source, target):
+        manhattan, row_conflicts, column_conflicts = evaluation
+        manhattan = self.manhattan.updated(manhattan, board, tile, source, target)
+        width = self.width
+        if source // width == target // width:
+            conflicts = list(column_conflicts)
+            for column in (source % width, target % width):
+                conflicts[column] = self.column_conflicts(board, column)
+            return manhattan, row_conflicts, tuple(conflicts)
+        conflicts = list(row_conflicts)
+        for row in (source // width, target // width):
+            conflicts[row] = self.row_conflicts(board, row)
+        return manhattan, tuple(conflicts), column_conflicts
+
+    def row_conflicts(self, board, row):
+        goal_rows, goal_columns = self.goal_rows, self.goal_columns
+        return line_conflicts([goal_columns[board[cell]] for cell in self.rows[row]
+                               if board[cell] is not None and goal_rows[board[cell]] == row])
+
+    def column_conflicts(self, board, column):
+        goal_rows, goal_columns = self.goal_rows, self.goal_columns
+        return line_conflicts([goal_rows[board[cell]] for cell in self.columns[column]
+                               if board[cell] is not None and goal_columns[board[cell]] == column])
+
+
+def line_conflicts(goal_positions):
+    """
+    The number of tiles of a line that must leave it: the tiles outside a longest
+    increasing run of their goal positions along the line.
+    """
+    if len(goal_positions) < 2:
+        return 0
+    longest = [1] * len(goal_positions)
+    for later in range(1, len(goal_positions)):
+        for earlier in range(later):
+            if goal_positions[earlier] < goal_positions[later] and longest[earlier] + 1 > longest[later]:
+                longest[later] = longest[earlier] + 1
+    return len(goal_positions) - max(longest)
+
+
+@lru_cache(maxsize=16)
+def walking_distance_table(width, blank_line):
+    """
+    The walking distance of every arrangement reachable from the goal along one axis.
+
+    An arrangement records, for each line of the board (row or column), how many of
+    its tiles belong to each line, and which line holds the blank tile. A move along
+    the axis takes a tile from a line next to the blank tile's into it. A
+    breadth-first search from the goal arrangement labels every arrangement with
+    the fewest such moves.
+
+    :param width: The width of the board.
+    :param blank_line: The line that holds the blank tile in the goal state.
+    :return: A tuple of: a dict mapping each (counts, blank line) arrangement to a
+        code; a list of distances by code; and a flat list of transitions, where
+        entry (code * 2 + direction) * width + group is the code reached when a tile
+        of `group` moves toward lower lines (direction 0) or higher lines (direction
+        1), or -1 if no such tile is next to the blank tile.
+    """
+    goal_counts = tuple(width - (line == blank_line) if line == group else 0
+                        for line in range(width) for group in range(width))
+    codes = {(goal_counts, blank_line): 0}
+    distances = [0]
+    transitions = [-1] * (2 * width)
+    frontier = deque([(goal_counts, blank_line)])
+    while frontier:
+        arrangement = frontier.popleft()
+        counts, blank = arrangement
+        code = codes[arrangement]
+        for direction, source in ((0, blank + 1), (1, blank - 1)):
+            # A tile moving toward lower lines comes from the line after the blank's
+            if not 0 <= source < width:
+                continue
+            for group in range(width):
+                if counts[source * width + group] == 0:
+                    continue
+                child_counts = list(counts)
+                child_counts[source * width + group] -= 1
+                child_counts[blank * width + group] += 1
+                child = (tuple(child_counts), source)
+                if child not in codes:
+                    codes[child] = len(distances)
+                    distances.append(distances[code] + 1)
+                    transitions.extend([-1] * (2 * width))
+                    frontier.append(child)
+                transitions[(code * 2 + direction) * width + group] = codes[child]
+    return codes, distances, transitions
+
+
+class EightPuzzleWalkingDistanceHeuristic:
+    """
+    The walking distance of Ken'ichiro Takahashi: the fewest vertical moves needed to
+    bring every tile to its goal row, counting only which rows the tiles are in,
+    plus the same for horizontal moves and columns. No move is both vertical and
+    horizontal, so the sum is admissible. It accounts for tiles that block each
+    other across lines, which the linear conflict heuristic does not.
+
+    The evaluation is the pair of codes of the vertical and horizontal arrangements,
+    and a move follows one precomputed transition.
+    """
+
+    def __init__(self, goal_state):
+        self.goal_state = tuple(goal_state)
+        self.width = width = board_width(self.goal_state)
+        blank = self.goal_state.index(None)
+        self.goal_rows = {tile: index // width for index, tile in enumerate(self.goal_state) if tile is not None}
+        self.goal_columns = {tile: index % width for index, tile in enumerate(self.goal_state) if tile is not None}
+        self.row_codes, self.row_distances, self.row_transitions = walking_distance_table(width, blank // width)
+        self.column_codes, self.column_distances, self.column_transitions = walking_distance_table(width, blank % width)
+
+    def heuristic(self, state):
+        return self.estimate(self.evaluation(state))
+
+    def evaluation(self, state):
+        width = self.width
+        row_counts = [0] * (width * width)
+        column_counts = [0] * (width * width)
+        for index, tile in enumerate(state):
+            if tile is None:
+                blank = index
+            else:
+                row_counts[index // width * width + self.goal_rows[tile]] += 1
+                column_counts[index % width * width + self.goal_columns[tile]] += 1
+        return (self.row_codes[(tuple(row_counts), blank // width)],
+                self.column_codes[(tuple(column_counts), blank % width)])
+
+    def estimate(self, evaluation):
+        row_code, column_code = evaluation
+        return self.row_distances[row_code] + self.column_distances[column_code]
+
+    def updated(self, evaluation, board, tile, source, target):
+        row_code, column_code = evaluation
+        width = self.width
+        direction = 0 if target < source else 1
+        if source // width == target // width:
+            column_code = self.column_transitions[(column_code * 2 + direction) * width + self.goal_columns[tile]]
+        else:
+            row_code = self.row_transitions[(row_code * 2 + direction) * width + self.goal_rows[tile]]
+        return row_code, column_code
+
+
+class EightPuzzleMaxHeuristic:
+    """
+    The largest estimate of several admissible evaluators, which is admissible too.
+    The evaluation is the tuple of the evaluators' evaluations.
+    """
+
+    def __init__(self, evaluators):
+        self.evaluators = tuple(evaluators)
+        if not self.evaluators:
+            raise EightPuzzleHeuristicException("A max heuristic needs at least one evaluator")
+        self.goal_state = self.evaluators[0].goal_state
+        if any(evaluator.goal_state != self.goal_state for evaluator in self.evaluators):
+            raise EightPuzzleHeuristicException("The evaluators of a max heuristic must share a goal state")
+
+    def heuristic(self, state):
+        return max(evaluator.heuristic(state) for evaluator in self.evaluators)
+
+    def evaluation(self, state):
+        return tuple(evaluator.evaluation(state) for evaluator in self.evaluators)
+
+    def estimate(self, evaluation):
+        return max(evaluator.estimate(part) for evaluator, part in zip(self.evaluators, evaluation))
+
+    def updated(self, evaluation, board, tile, source, target):
+        return tuple(evaluator.updated(part, board, tile, source, target)
+                     for evaluator, part in zip(self.evaluators, evaluation))
@@ -1,11 +1,31 @@
 # EightPuzzleNode: A node in the search graph of the eight puzzle problem.
 # As specified by Russell & Norvig, a Node has a state, a parent node, an action,
-# and a path cost.
+# and a path cost. Nodes are created by the hundred thousand, so they have slots
+# instead of a __dict__. A node may also carry the evaluation of its state by the
+# solver's heuristic (see eight_puzzle_heuristics), from which its children's
+# evaluations are updated instead of computed from scratch.
+# EightPuzzleBoundedNode adds what SMA* keeps for each node it stores.
+
 
 class EightPuzzleNode:
 
-    def __init__(self, state, parent, action, path_cost):
+    __slots__ = ("state", "parent", "action", "path_cost", "evaluation")
+
+    def __init__(self, state, parent, action, path_cost, evaluation=None):
         self.state = state
         self.parent = parent
         self.action = action
         self.path_cost = path_cost
+        self.evaluation = evaluation
+
+
+class EightPuzzleBoundedNode(EightPuzzleNode):
+
+    __slots__ = ("cost", "children", "forgotten", "entry")
+
+    def __init__(self, state, parent, action, path_cost, evaluation=None):
+        super().__init__(state, parent, action, path_cost, evaluation)
+        self.cost = 0  # The f-cost, backed up from its children once they are all forgotten
+        self.children = []  # The children still in memory
+        self.forgotten = None  # The f-costs of the children forgotten since its last expansion, by state
+        self.entry = None  # The node's current frontier entry, if it is on the frontier
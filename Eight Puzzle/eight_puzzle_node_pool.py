@@ -0,0 +1,98 @@
+# EightPuzzleNodePool: Compact storage for the nodes of a search over packed-integer
+# states (see EightPuzzlePackedTransitionModel). Instead of one EightPuzzleNode
+# object per node, the pool keeps each field in a parallel buffer and a node is
+# just its index:
+#   - states:     the packed state, 8 bytes (array "Q"), or a list of ints for
+#                 boards too large to pack in 64 bits,
+#   - parents:    the index of the parent node, 4 bytes (array "i"; -1 for the root),
+#   - path_costs: g, 2 bytes (array "H"),
+#   - actions:    the action that produced the node as a 2-bit code, four per byte.
+# That is about 14.25 bytes per node for the 3x3 puzzle, against a few hundred for
+# an EightPuzzleNode and its state tuple. The actions to reach a node are found by
+# walking the parent indexes back to the root.
+
+from array import array
+from eight_puzzle_agent import EightPuzzleAgent
+
+ACTIONS = (EightPuzzleAgent.move_left, EightPuzzleAgent.move_right, EightPuzzleAgent.move_up, EightPuzzleAgent.move_down)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+ROOT = -1  # The parent index of the root node
+
+
+class EightPuzzleNodePoolException(Exception):
+    pass
+
+
+class EightPuzzleNodePool:
+
+    def __init__(self, transition_model):
+        """
+        :param transition_model: The EightPuzzlePackedTransitionModel of the states to store.
+        """
+        state_bits = transition_model.blank_shift + (transition_model.cells - 1).bit_length()
+        self.states = array("Q") if state_bits <= 64 else []
+        self.parents = array("i")
+        self.path_costs = array("H")
+        self.actions = bytearray()
+
+    def __len__(self):
+        return len(self.parents)
+
+    def add(self, state, parent, action, path_cost):
+        """
+        Store a node.
+
+        :param state: The packed state of the node.
+        :param parent: The index of the parent node, or ROOT.
+        :param action: The action that produced the node from its parent, or None for the root.
+        :param path_cost: The cost of the path to the node, below 65536.
+        :return: The index of the new node.
+        """
+        if not 0 <= path_cost <= 0xFFFF:
+            raise EightPuzzleNodePoolException(f"Cannot store path cost {path_cost}")
+        index = len(self.parents)
+        self.states.append(state)
+        self.parents.append(parent)
+        self.path_costs.append(path_cost)
+        shift = (index & 3) << 1
+        if shift == 0:
+            self.actions.append(0)
+        if action is not None:
+            self.actions[index >> 2] |= ACTION_CODES[action] << shift
+        return index
+
+    def state(self, index):
+        return self.states[index]
+
+    def parent(self, index):
+        return self.parents[index]
+
+    def path_cost(self, index):
+        return self.path_costs[index]
+
+    def action(self, index):
+        if self.parents[index] == ROOT:
+            return None
+        return ACTIONS[(self.actions[index >> 2] >> ((index & 3) << 1)) & 3]
+
+    def actions_to(self, index):
+        """
+        The actions that lead from the root to a node.
+
+        :param index: The index of the node.
+        :return: A list of actions.
+        """
+        actions = []
+        while self.parents[index] != ROOT:
+            actions.append(self.action(index))
+            index = self.parents[index]
+        actions.reverse()
+        return actions
+
+    def nbytes(self):
+        """
+        The size of the buffers, in bytes.
+        """
+        states = self.states.itemsize * len(self.states) if isinstance(self.states, array) else 0
+        return (states + self.parents.itemsize * len(self.parents)
+                + self.path_costs.itemsize * len(self.path_costs) + len(self.actions))
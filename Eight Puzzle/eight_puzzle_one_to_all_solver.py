@@ -0,0 +1,113 @@
+# EightPuzzleOneToAllSolver: Solve any number of problems that share one goal state
+# with a single breadth-first search backward from the goal. Moves are invertible and
+# cost the same, so when the backward search first reaches a state, the move back to
+# the state it came from starts an optimal path to the goal. That move is recorded
+# for every state reached, and the solution from a start is read by following the
+# recorded moves, in time proportional to its length.
+# The backward search only runs as far as the starts asked about so far require, and
+# picks up where it stopped for later starts, so a stream of starts costs at most one
+# search of the state space in total. The moves are kept in a byte per state, indexed
+# by the perfect index of EightPuzzlePermutationRanker, when the state space is small
+# enough (the 3x3 puzzle takes 181,440 bytes), and in a dict otherwise.
+
+import math
+from collections import deque
+from eight_puzzle_node_pool import ACTIONS
+from eight_puzzle_permutation_rank import EightPuzzlePermutationRanker
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_transition_model import move_targets
+
+MAX_TABLE_STATES = 1 << 24
+UNKNOWN = 255  # The state has not been reached yet
+GOAL = 4
+INVERSE_ACTION_CODES = (1, 0, 3, 2)  # right undoes left, left undoes right, down undoes up, up undoes down
+
+
+class EightPuzzleOneToAllSolverException(Exception):
+    pass
+
+
+class EightPuzzleOneToAllSolver:
+
+    def __init__(self, goal_state):
+        """
+        :param goal_state: The goal state shared by the problems to solve.
+        """
+        self.goal_state = tuple(goal_state)
+        ranker = EightPuzzlePermutationRanker(self.goal_state)
+        self.targets = move_targets(math.isqrt(len(self.goal_state)))
+        if ranker.size <= MAX_TABLE_STATES:
+            self.key = ranker.index
+            self.table = bytearray([UNKNOWN]) * ranker.size
+            self.action_code = self.table.__getitem__
+        else:
+            self.key = tuple
+            self.table = {}
+            self.action_code = lambda key: self.table.get(key, UNKNOWN)
+        self.table[self.key(self.goal_state)] = GOAL
+        self.frontier = deque([(self.goal_state, self.goal_state.index(None))])
+        self.states_reached = 1
+
+    def solve(self, initial_state):
+        """
+        Solve the problem of reaching the goal state from `initial_state`.
+
+        :param initial_state: A state of the puzzle, as a tuple or list.
+        :return: An EightPuzzleSearchResult holding an optimal list of actions.
+        """
+        initial_state = tuple(initial_state)
+        if not EightPuzzleProblem(initial_state, self.goal_state, None).is_solvable():
+            return EightPuzzleSearchResult(EightPuzzleSearchResult.UNSOLVABLE, [], suboptimality_bound=None)
+        key = self.key(initial_state)
+        if not self.search_until(key):
+            raise EightPuzzleOneToAllSolverException(f"The backward search did not reach {initial_state}")
+        actions = []
+        state, code = initial_state, self.action_code(key)
+        while code != GOAL:
+            actions.append(ACTIONS[code])
+            blank = state.index(None)
+            target = self.targets[code][blank]
+            board = list(state)
+            board[blank], board[target] = board[target], None
+            state = tuple(board)
+            code = self.action_code(self.key(state))
+        return EightPuzzleSearchResult(EightPuzzleSearchResult.SOLVED, actions)
+
+    def solve_many(self, initial_states):
+        """
+        Solve the problem of each start of an iterable, which may be an endless stream.
+
+        :param initial_states: An iterable of states of the puzzle.
+        :return: A generator of EightPuzzleSearchResult instances, in the order of the starts.
+        """
+        for initial_state in initial_states:
+            yield self.solve(initial_state)
+
+    def search_until(self, key=None):
+        """
+        Continue the backward search until it reaches the state with the given key, or
+        until it has reached every state if `key` is None.
+
+        :return: True if the state was reached.
+        """
+        frontier, table, targets, state_key, action_code = (self.frontier, self.table, self.targets, self.key,
+                                                            self.action_code)
+        while frontier:
+            if key is not None and action_code(key) != UNKNOWN:
+                return True
+            state, blank = frontier.popleft()
+            for code, moves in enumerate(targets):
+                target = moves[blank]
+                if target is None:
+                    continue
+                board = list(state)
+                board[blank], board[target] = board[target], None
+                child = tuple(board)
+                child_key = state_key(child)
+                if action_code(child_key) == UNKNOWN:
+                    # The move that undoes this one leads from the child towards the goal
+                    table[child_key] = INVERSE_ACTION_CODES[code]
+                    frontier.append((child, target))
+                    self.states_reached += 1
+        return key is None or action_code(key) != UNKNOWN
@@ -0,0 +1,59 @@
+# EightPuzzlePackedProblem: The Eight Puzzle as a search problem over packed-integer
+# states (see EightPuzzlePackedTransitionModel). Tuple states are packed once, at
+# construction, so a search never copies or scans a tuple. The actions available
+# for each position of the blank tile are precomputed, in the same order as
+# EightPuzzleProblem.actions. The board width follows from the goal state.
+
+import math
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_problem import EightPuzzleProblem, EightPuzzleProblemException, blank_actions
+from eight_puzzle_packed_transition_model import EightPuzzlePackedTransitionModel
+
+
+class EightPuzzlePackedProblem:
+
+    def __init__(self, initial_state, goal_state, transition_model=None):
+        width = math.isqrt(len(goal_state))
+        self.transition_model = transition_model or EightPuzzlePackedTransitionModel(width)
+        self.initial_state = self.transition_model.pack(initial_state)
+        self.goal_state = self.transition_model.pack(goal_state)
+        self.tuple_initial_state = tuple(initial_state)
+        self.tuple_goal_state = tuple(goal_state)
+        self.blank_actions = blank_actions(width)
+        self.action_targets = {
+            EightPuzzleAgent.move_left: self.transition_model.left_targets,
+            EightPuzzleAgent.move_right: self.transition_model.right_targets,
+            EightPuzzleAgent.move_up: self.transition_model.up_targets,
+            EightPuzzleAgent.move_down: self.transition_model.down_targets,
+        }
+        # tile_distances[index][tile] is the Manhattan distance of `tile` at `index`
+        # from its position in the goal state; the blank tile (0) costs nothing.
+        goal_positions = {tile: index for index, tile in enumerate(goal_state) if tile is not None}
+        self.tile_distances = tuple(
+            tuple(0 if tile not in goal_positions else
+                  abs(index // width - goal_positions[tile] // width) + abs(index % width - goal_positions[tile] % width)
+                  for tile in range(self.transition_model.cell_mask + 1))
+            for index in range(width * width)
+        )
+
+    @classmethod
+    def from_problem(cls, problem):
+        return cls(problem.initial_state, problem.goal_state)
+
+    def is_goal(self, state):
+        return state == self.goal_state
+
+    def is_solvable(self):
+        return EightPuzzleProblem(self.tuple_initial_state, self.tuple_goal_state, None).is_solvable()
+
+    def actions(self, state):
+        return self.blank_actions[state >> self.transition_model.blank_shift]
+
+    def result(self, state, action):
+        targets = self.action_targets.get(action)
+        if targets is None:
+            raise EightPuzzleProblemException("Action was not left, right, up or down.")
+        return self.transition_model.move_blank(state, targets, action.__name__)
+
+    def action_cost(self, state, action, result_state):
+        return 1
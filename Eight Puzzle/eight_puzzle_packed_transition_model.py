@@ -0,0 +1,88 @@
+# EightPuzzlePackedTransitionModel: The "movement rules" of the classic eight-puzzle
+# for states packed into a single integer. Each cell occupies a fixed number of bits
+# (cell i in bits i*b..i*b+b-1, the blank tile stored as 0) and the index of the
+# blank tile is kept above the board, so a state never has to be scanned to find it.
+# For the 3x3 puzzle, cells take 4 bits, so the board fits in 36 bits and the blank
+# index in bits 36..39. Moves are applied with precomputed shift and mask tables
+# instead of copying tuples.
+
+from eight_puzzle_transition_model import EightPuzzleTransitionException, move_targets
+
+
+class EightPuzzlePackedTransitionModel:
+
+    def __init__(self, width=3):
+        self.width = width
+        self.cells = width * width
+        # At least four bits per cell; the 24-puzzle needs five
+        self.bits_per_cell = max(4, (self.cells - 1).bit_length())
+        self.cell_mask = (1 << self.bits_per_cell) - 1
+        self.blank_shift = self.cells * self.bits_per_cell
+        board_mask = (1 << self.blank_shift) - 1
+        self.left_targets, self.right_targets, self.up_targets, self.down_targets = move_targets(width)
+        # Clearing a cell is the same for every state, so the masks are computed once
+        # per target cell.
+        self.clear_target_masks = tuple(board_mask & ~(self.cell_mask << (self.bits_per_cell * target))
+                                        for target in range(self.cells))
+
+    def pack(self, puzzle_state):
+        if len(puzzle_state) != self.cells or None not in puzzle_state:
+            raise EightPuzzleTransitionException(f"Cannot pack state {puzzle_state}")
+        packed = 0
+        for index, tile in enumerate(puzzle_state):
+            if tile is None:
+                packed |= index << self.blank_shift
+            elif isinstance(tile, int) and 0 < tile <= self.cell_mask:
+                packed |= tile << (self.bits_per_cell * index)
+            else:
+                raise EightPuzzleTransitionException(f"Cannot pack tile {tile} of state {puzzle_state}")
+        return packed
+
+    def unpack(self, packed_state):
+        blank = self.blank_index(packed_state)
+        return tuple(None if index == blank else self.tile_at(packed_state, index) for index in range(self.cells))
+
+    def blank_index(self, packed_state):
+        return packed_state >> self.blank_shift
+
+    def tile_at(self, packed_state, index):
+        return (packed_state >> (self.bits_per_cell * index)) & self.cell_mask
+
+    def can_move_left(self, packed_state):
+        return self.left_targets[packed_state >> self.blank_shift] is not None
+
+    def can_move_right(self, packed_state):
+        return self.right_targets[packed_state >> self.blank_shift] is not None
+
+    def can_move_up(self, packed_state):
+        return self.up_targets[packed_state >> self.blank_shift] is not None
+
+    def can_move_down(self, packed_state):
+        return self.down_targets[packed_state >> self.blank_shift] is not None
+
+    def move_left(self, packed_state):
+        return self.move_blank(packed_state, self.left_targets, "move_left")
+
+    def move_right(self, packed_state):
+        return self.move_blank(packed_state, self.right_targets, "move_right")
+
+    def move_up(self, packed_state):
+        return self.move_blank(packed_state, self.up_targets, "move_up")
+
+    def move_down(self, packed_state):
+        return self.move_blank(packed_state, self.down_targets, "move_down")
+
+    def move_blank(self, packed_state, targets, move_name):
+        blank = packed_state >> self.blank_shift
+        target = targets[blank]
+        if target is None:
+            raise EightPuzzleTransitionException(f"Cannot {move_name} for state {self.unpack(packed_state)}")
+        return self.swap(packed_state, blank, target)
+
+    def swap(self, packed_state, blank, target):
+        # Move the tile at `target` into the blank cell; the target cell becomes blank.
+        bits = self.bits_per_cell
+        tile = (packed_state >> (bits * target)) & self.cell_mask
+        return ((packed_state & self.clear_target_masks[target])
+                | (tile << (bits * blank))
+                | (target << self.blank_shift))
@@ -0,0 +1,370 @@
+# EightPuzzleParallelSolver: Hash-distributed A* (HDA*, Kishimoto, Fukunaga and
+# Botea, 2009) for a single hard problem, on a group of worker processes.
+# Every state is owned by one worker, chosen by a hash of its packed form (see
+# EightPuzzlePackedTransitionModel). Only the owner keeps the state's path cost
+# and parent, so duplicates are caught without any shared table. A worker
+# expands the best nodes of its own open list and sends each child to the child's
+# owner. Children for the same owner are collected into batches, so a queue
+# message carries many nodes.
+#
+# Workers expand nodes out of global f order, so a state can be reached again
+# more cheaply and is then reopened. The first solution found is an incumbent,
+# not the answer. The incumbent's cost is broadcast, and workers drop every node
+# whose f is not below it. The search ends when every worker is idle and no batch
+# is in flight. Termination is detected in the coordinating process with
+# Mattern's four-counter method. Every worker counts the batches it sent and
+# received, and a worker that runs out of work says so. That starts a probe wave,
+# which collects every worker's counts. If two waves in a row find every worker
+# idle with unchanged counts, and as many batches received as sent, nothing was
+# in flight and the incumbent is optimal. The solution is then traced back by
+# asking each state's owner for its parent.
+
+import heapq
+import math
+import multiprocessing
+import os
+import queue
+import time
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_node_pool import ACTIONS, ACTION_CODES
+from eight_puzzle_packed_problem import EightPuzzlePackedProblem
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase
+from eight_puzzle_search_result import EightPuzzleSearchResult
+
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15  # 2**64 divided by the golden ratio, made odd
+HASH_MASK = (1 << 64) - 1
+
+
+class EightPuzzleParallelSolverException(Exception):
+    pass
+
+
+def owner(state, workers):
+    # Multiplicative hashing spreads neighbouring states evenly over the workers
+    return ((hash(state) * HASH_MULTIPLIER) & HASH_MASK) * workers >> 64
+
+
+def run_worker(rank, inboxes, reports, initial_state, goal_state, batch_size, pattern_database_path):
+    EightPuzzleHashDistributedWorker(rank, inboxes, reports, initial_state, goal_state, batch_size,
+                                     pattern_database_path).run()
+
+
+class EightPuzzleHashDistributedWorker:
+    """
+    One worker of the parallel solver, running in its own process. Its inbox receives
+    batches of nodes as (state, path cost, heuristic, parent state, action code)
+    tuples, and control messages from the coordinating process: the incumbent's
+    cost, termination probes, parent lookups and the request to stop.
+    """
+
+    FLUSH_INTERVAL = 1024  # Expansions between sending partial batches
+
+    def __init__(self, rank, inboxes, reports, initial_state, goal_state, batch_size, pattern_database_path=None):
+        self.rank = rank
+        self.inboxes = inboxes
+        self.reports = reports
+        self.batch_size = batch_size
+        self.problem = EightPuzzlePackedProblem(initial_state, goal_state)
+        self.transition_model = self.problem.transition_model
+        self.pattern_database = None
+        if pattern_database_path is not None:
+            self.pattern_database = EightPuzzlePatternDatabase.load(pattern_database_path)
+        self.path_costs = {}
+        self.parents = {}  # The parent state and action code of each state this worker owns
+        self.open_list = []  # Heap of (f, -g, state); entries made stale by a cheaper path are skipped
+        self.outboxes = [[] for _ in inboxes]
+        self.bound = math.inf  # The cost of the best solution found by any worker
+        self.sent = 0
+        self.received = 0
+        self.reported = None  # The counts of the last idle report
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+
+    def run(self):
+        inbox = self.inboxes[self.rank]
+        while True:
+            try:
+                while True:
+                    if not self.receive(inbox.get_nowait()):
+                        return
+            except queue.Empty:
+                pass
+            if self.has_work():
+                for _ in range(self.batch_size):
+                    if not self.has_work():
+                        break
+                    self.expand()
+                    if self.nodes_expanded % self.FLUSH_INTERVAL == 0:
+                        self.flush()
+                continue
+            self.flush()
+            if self.reported != (self.sent, self.received):
+                self.reported = (self.sent, self.received)
+                self.reports.put(("idle", self.rank))
+            if not self.receive(inbox.get()):
+                return
+
+    def receive(self, message):
+        """
+        Handle one message from the inbox.
+
+        :return: False if the worker should stop, True otherwise.
+        """
+        kind = message[0]
+        if kind == "nodes":
+            self.received += 1
+            for node in message[1]:
+                self.add(*node)
+        elif kind == "bound":
+            self.bound = min(self.bound, message[1])
+        elif kind == "probe":
+            idle = self.is_idle()
+            if not idle:
+                self.reported = None  # Say so again once idle, to start another wave
+            self.reports.put(("probe", self.rank, message[1], idle, self.sent, self.received))
+        elif kind == "trace":
+            self.reports.put(("parent", message[1]) + self.parents[message[1]])
+        elif kind == "stop":
+            self.reports.put(("done", self.rank, self.nodes_expanded, self.nodes_generated))
+            return False
+        return True
+
+    def add(self, state, path_cost, heuristic, parent, action_code):
+        if heuristic is None:
+            heuristic = self.heuristic(state)
+        if path_cost >= self.path_costs.get(state, math.inf) or path_cost + heuristic >= self.bound:
+            return
+        self.path_costs[state] = path_cost
+        self.parents[state] = (parent, action_code)
+        if state == self.problem.goal_state:
+            self.bound = path_cost
+            self.reports.put(("solution", path_cost, state))
+            return
+        heapq.heappush(self.open_list, (path_cost + heuristic, -path_cost, state))
+
+    def heuristic(self, state):
+        if self.pattern_database is not None:
+            return self.pattern_database.heuristic(self.transition_model.unpack(state))
+        tile_distances = self.problem.tile_distances
+        bits, mask = self.transition_model.bits_per_cell, self.transition_model.cell_mask
+        return sum(tile_distances[index][(state >> (bits * index)) & mask] for index in range(self.transition_model.cells))
+
+    def has_work(self):
+        open_list, path_costs = self.open_list, self.path_costs
+        while open_list and -open_list[0][1] != path_costs[open_list[0][2]]:
+            heapq.heappop(open_list)
+        return bool(open_list) and open_list[0][0] < self.bound
+
+    def is_idle(self):
+        return not self.has_work() and not any(self.outboxes)
+
+    def expand(self):
+        cost, negative_path_cost, state = heapq.heappop(self.open_list)
+        self.nodes_expanded += 1
+        path_cost = -negative_path_cost
+        heuristic = cost - path_cost
+        parent = self.parents[state][0]
+        problem, transition_model = self.problem, self.transition_model
+        blank = state >> transition_model.blank_shift
+        workers = len(self.inboxes)
+        for action in problem.actions(state):
+            target = problem.action_targets[action][blank]
+            child_state = transition_model.swap(state, blank, target)
+            if child_state == parent:
+                continue  # Undoing the last move never helps
+            self.nodes_generated += 1
+            if self.pattern_database is not None:
+                child_heuristic = None  # Computed by the owner
+            else:
+                # The tile at `target` moves into the blank cell
+                tile = transition_model.tile_at(state, target)
+                distances = problem.tile_distances
+                child_heuristic = heuristic + distances[blank][tile] - distances[target][tile]
+            node = (child_state, path_cost + 1, child_heuristic, state, ACTION_CODES[action])
+            destination = owner(child_state, workers)
+            if destination == self.rank:
+                self.add(*node)
+            else:
+                outbox = self.outboxes[destination]
+                outbox.append(node)
+                if len(outbox) >= self.batch_size:
+                    self.send(destination)
+
+    def send(self, destination):
+        self.inboxes[destination].put(("nodes", self.outboxes[destination]))
+        self.outboxes[destination] = []
+        self.sent += 1
+
+    def flush(self):
+        for destination, outbox in enumerate(self.outboxes):
+            if outbox:
+                self.send(destination)
+
+
+class EightPuzzleParallelSolver:
+    """
+    Solve one problem optimally with hash-distributed A* on several worker processes.
+    Meant for problems large enough to keep every worker busy, such as hard
+    instances of the 15-puzzle; with one worker the problem is solved in the
+    calling process by A* over packed states.
+    """
+
+    def __init__(self, workers=None, batch_size=64, pattern_database_path=None, poll_interval=1.0):
+        """
+        Initialize the parallel solver.
+
+        :param workers: The number of worker processes; defaults to the number of CPUs.
+        :param batch_size: The number of nodes sent to another worker in one message.
+        :param pattern_database_path: The path of an EightPuzzlePatternDatabase file that
+            each worker maps as its heuristic, instead of the Manhattan distance.
+        :param poll_interval: Seconds between checks that the workers are still alive.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1 or batch_size < 1:
+            raise EightPuzzleParallelSolverException("The solver needs at least one worker and a positive batch size")
+        self.batch_size = batch_size
+        self.pattern_database_path = pattern_database_path
+        self.poll_interval = poll_interval
+
+    def solution(self, problem):
+        """
+        Solve the problem and return a list of actions that lead from the initial state to the goal state.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :return: A list of actions to reach the goal state. If no solution is found, return an empty list.
+        """
+        return self.solve(problem).actions
+
+    def solve(self, problem, statistics=None):
+        """
+        Solve the problem and say how the search ended.
+
+        :param problem: An instance of EightPuzzleProblem, representing the problem.
+        :param statistics: An optional EightPuzzleSearchStatistics, which receives the
+            nodes expanded and generated by all workers.
+        :return: An EightPuzzleSearchResult.
+        """
+        if self.workers == 1:
+            pattern_database = None
+            if self.pattern_database_path is not None:
+                pattern_database = EightPuzzlePatternDatabase.load(self.pattern_database_path)
+            return EightPuzzleBestFirstSearchSolver(packed=True, pattern_database=pattern_database).solve(problem, statistics)
+
+        start = time.perf_counter()
+        if not problem.is_solvable():
+            return EightPuzzleSearchResult(EightPuzzleSearchResult.UNSOLVABLE, [], statistics, None)
+        initial_state, goal_state = tuple(problem.initial_state), tuple(problem.goal_state)
+        inboxes = [multiprocessing.Queue() for _ in range(self.workers)]
+        reports = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=run_worker, daemon=True,
+                                             args=(rank, inboxes, reports, initial_state, goal_state,
+                                                   self.batch_size, self.pattern_database_path))
+                     for rank in range(self.workers)]
+        for process in processes:
+            process.start()
+        try:
+            packed_problem = EightPuzzlePackedProblem(initial_state, goal_state)
+            root = packed_problem.initial_state
+            inboxes[owner(root, self.workers)].put(("nodes", [(root, 0, None, None, None)]))
+            solution_state = self.wait_for_termination(inboxes, reports, processes)
+            actions = [] if solution_state is None else self.trace(solution_state, inboxes, reports, processes)
+            totals = self.stop(inboxes, reports, processes)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        if statistics is not None:
+            statistics.nodes_expanded += totals[0]
+            statistics.nodes_generated += totals[1]
+            statistics.search_time += time.perf_counter() - start
+            statistics.solution_depth = len(actions)
+        status = EightPuzzleSearchResult.SOLVED if solution_state is not None else EightPuzzleSearchResult.UNSOLVABLE
+        return EightPuzzleSearchResult(status, actions, statistics, 1 if solution_state is not None else None)
+
+    def next_report(self, reports, processes):
+        while True:
+            try:
+                return reports.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise EightPuzzleParallelSolverException("A worker process died during the search") from None
+
+    def wait_for_termination(self, inboxes, reports, processes):
+        """
+        Relay incumbent costs to the workers until the search has ended.
+
+        Each idle report starts a probe wave unless one is under way. The search has
+        ended once two waves in a row find every worker idle with the same counts, and
+        every batch sent was received.
+
+        :return: The packed state that ends the best solution, or None if there is none.
+        """
+        incumbent, solution_state = math.inf, None
+        root_batches = 1  # Sent by this process, so no worker counts them as sent
+        wave, replies, previous = 0, None, None  # The current wave, its replies, and the last wave's if all idle
+        idle_reported = False  # An idle report arrived since the current wave started
+        while True:
+            report = self.next_report(reports, processes)
+            kind = report[0]
+            if kind == "solution":
+                _, cost, state = report
+                if cost < incumbent:
+                    incumbent, solution_state = cost, state
+                    for inbox in inboxes:
+                        inbox.put(("bound", cost))
+            elif kind == "idle":
+                idle_reported = True
+            elif kind == "probe" and report[2] == wave and replies is not None:
+                _, rank, _, idle, sent, received = report
+                replies[rank] = (idle, sent, received)
+                if len(replies) < len(inboxes):
+                    continue
+                all_idle = all(idle for idle, _, _ in replies.values())
+                if (all_idle and replies == previous
+                        and root_batches + sum(sent for _, sent, _ in replies.values())
+                        == sum(received for _, _, received in replies.values())):
+                    return solution_state
+                previous = replies if all_idle else None
+                replies = None
+                # Waves continue while every worker is idle, so the next one can confirm this one
+                idle_reported = idle_reported or all_idle
+            if replies is None and idle_reported:
+                wave += 1
+                replies = {}
+                idle_reported = False
+                for inbox in inboxes:
+                    inbox.put(("probe", wave))
+
+    def trace(self, state, inboxes, reports, processes):
+        actions = []
+        while True:
+            inboxes[owner(state, self.workers)].put(("trace", state))
+            report = self.next_report(reports, processes)
+            while report[0] != "parent" or report[1] != state:
+                report = self.next_report(reports, processes)
+            _, _, parent, action_code = report
+            if parent is None:
+                break
+            actions.append(ACTIONS[action_code])
+            state = parent
+        actions.reverse()
+        return actions
+
+    def stop(self, inboxes, reports, processes):
+        """
+        Stop the workers.
+
+        :return: The total nodes expanded and generated by the workers.
+        """
+        for inbox in inboxes:
+            inbox.put(("stop",))
+        done, nodes_expanded, nodes_generated = set(), 0, 0
+        while len(done) < len(inboxes):
+            report = self.next_report(reports, processes)
+            if report[0] == "done" and report[1] not in done:
+                done.add(report[1])
+                nodes_expanded += report[2]
+                nodes_generated += report[3]
+        return nodes_expanded, nodes_generated
@@ -0,0 +1,247 @@
+# EightPuzzlePatternDatabase: An additive pattern-database heuristic for the eight
+# puzzle. The tiles are split into disjoint patterns. For each pattern, a backward
+# breadth-first search from the goal state over the positions of only that
+# pattern's tiles records the fewest moves *of those tiles* needed to place them,
+# so the values of disjoint patterns can be added and remain admissible.
+# Each table is a compact byte array indexed by the positions of the pattern's
+# tiles. Tables are saved to a single file and loaded with mmap, so the pages are
+# shared by every process that loads the same file.
+
+import math
+import mmap
+import os
+import struct
+from collections import deque
+
+MAGIC = b"EPDB"
+VERSION = 1
+HEADER = struct.Struct("<4sBBB")  # magic, version, number of cells, number of patterns
+UNSEEN = 255
+
+
+class EightPuzzlePatternDatabaseException(Exception):
+    pass
+
+
+class EightPuzzlePatternDatabase:
+
+    def __init__(self, goal_state, patterns, tables):
+        """
+        Initialize the pattern database from already-built tables. Use `build`,
+        `load` or `load_or_build` to create one.
+
+        :param goal_state: The goal state the tables were built for.
+        :param patterns: A tuple of disjoint tuples of tiles.
+        :param tables: One byte array per pattern, indexed by the positions of its tiles.
+        """
+        self.goal_state = tuple(goal_state)
+        self.patterns = tuple(tuple(pattern) for pattern in patterns)
+        self.tables = tables
+        self.cells = len(self.goal_state)
+        # The pattern of each tile, and the radix of its position in that pattern's index
+        self.tile_patterns = {tile: (number, self.cells ** place)
+                              for number, pattern in enumerate(self.patterns) for place, tile in enumerate(pattern)}
+
+    @staticmethod
+    def default_patterns(goal_state):
+        """
+        Split the tiles of the goal state, in reading order, into two halves.
+
+        :param goal_state: The goal state of the puzzle.
+        :return: A tuple of two disjoint tuples of tiles.
+        """
+        tiles = [tile for tile in goal_state if tile is not None]
+        half = (len(tiles) + 1) // 2
+        return tuple(tiles[:half]), tuple(tiles[half:])
+
+    @classmethod
+    def build(cls, goal_state, patterns=None):
+        """
+        Build the tables for each pattern by backward breadth-first search from the goal.
+
+        :param goal_state: The goal state of the puzzle.
+        :param patterns: Disjoint tuples of tiles; defaults to `default_patterns(goal_state)`.
+        :return: A new EightPuzzlePatternDatabase.
+        """
+        patterns = patterns or cls.default_patterns(goal_state)
+        tiles = [tile for pattern in patterns for tile in pattern]
+        if len(tiles) != len(set(tiles)) or not set(tiles) <= set(goal_state) - {None}:
+            raise EightPuzzlePatternDatabaseException(f"Patterns {patterns} are not disjoint tiles of {goal_state}")
+        neighbors = cls.neighbors(len(goal_state))
+        tables = [cls.build_table(goal_state, pattern, neighbors) for pattern in patterns]
+        return cls(goal_state, patterns, tables)
+
+    @staticmethod
+    def neighbors(cells):
+        """
+        The cells adjacent to each cell of a square board.
+
+        :param cells: The number of cells on the board.
+        :return: A tuple holding, for each cell, a tuple of its neighboring cells.
+        """
+        width = math.isqrt(cells)
+        if width * width != cells:
+            raise EightPuzzlePatternDatabaseException(f"A board of {cells} cells is not square")
+        return tuple(
+            tuple(neighbor for neighbor, allowed in ((cell - 1, cell % width > 0),
+                                                     (cell + 1, cell % width < width - 1),
+                                                     (cell - width, cell >= width),
+                                                     (cell + width, cell < cells - width))
+                  if allowed)
+            for cell in range(cells)
+        )
+
+    @staticmethod
+    def build_table(goal_state, pattern, neighbors):
+        """
+        A 0-1 breadth-first search over the positions of the pattern's tiles and the
+        blank tile. Moving a pattern tile costs 1 and moving any other tile costs 0.
+
+        :return: A bytearray holding the distance for every placement of the pattern's tiles.
+        """
+        cells = len(goal_state)
+        radices = [cells ** i for i in range(len(pattern))]
+        start = sum(goal_state.index(tile) * radix for tile, radix in zip(pattern, radices))
+        distances = bytearray([UNSEEN]) * (cells ** len(pattern) * cells)
+        table = bytearray([UNSEEN]) * (cells ** len(pattern))
+
+        frontier = deque([(start, goal_state.index(None), 0)])
+        while frontier:
+            index, blank, distance = frontier.popleft()
+            if distances[index * cells + blank] != UNSEEN:
+                continue
+            distances[index * cells + blank] = distance
+            if distance < table[index]:
+                table[index] = distance
+            # The cells occupied by the pattern's tiles, in pattern order
+            occupied = [(index // radix) % cells for radix in radices]
+            for neighbor in neighbors[blank]:
+                if neighbor in occupied:
+                    # The pattern tile at `neighbor` slides into the blank cell
+                    radix = radices[occupied.index(neighbor)]
+                    child = index + (blank - neighbor) * radix
+                    if distances[child * cells + neighbor] == UNSEEN:
+                        frontier.append((child, neighbor, distance + 1))
+                elif distances[index * cells + neighbor] == UNSEEN:
+                    frontier.appendleft((index, neighbor, distance))
+        return table
+
+    def heuristic(self, state):
+        """
+        The sum of the pattern distances of a state.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: An admissible estimate of the number of moves to the goal state.
+        """
+        positions = {tile: index for index, tile in enumerate(state)}
+        cells = self.cells
+        total = 0
+        for pattern, table in zip(self.patterns, self.tables):
+            index = 0
+            for tile in reversed(pattern):
+                index = index * cells + positions[tile]
+            total += table[index]
+        return total
+
+    def evaluation(self, state):
+        """
+        The evaluation of a state for incremental updates: the sum of the pattern
+        distances and the index of each pattern's table entry.
+        """
+        positions = {tile: index for index, tile in enumerate(state)}
+        indices = []
+        for pattern in self.patterns:
+            index = 0
+            for tile in reversed(pattern):
+                index = index * self.cells + positions[tile]
+            indices.append(index)
+        return sum(table[index] for table, index in zip(self.tables, indices)), tuple(indices)
+
+    def estimate(self, evaluation):
+        return evaluation[0]
+
+    def updated(self, evaluation, board, tile, source, target):
+        """
+        The evaluation after `tile` moved from cell `source` to cell `target`. Only
+        the moved tile's pattern changes, and its index moves by a multiple of the
+        tile's radix.
+        """
+        placement = self.tile_patterns.get(tile)
+        if placement is None:
+            return evaluation  # The tile belongs to no pattern
+        number, radix = placement
+        total, indices = evaluation
+        table = self.tables[number]
+        index = indices[number]
+        child_index = index + (target - source) * radix
+        return (total + table[child_index] - table[index],
+                indices[:number] + (child_index,) + indices[number + 1:])
+
+    def save(self, path):
+        """
+        Write the goal state, patterns and tables to a file that `load` can map.
+
+        :param path: The path of the file to write.
+        """
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.cells, len(self.patterns)))
+            file.write(bytes(0 if tile is None else tile for tile in self.goal_state))
+            for pattern in self.patterns:
+                file.write(bytes([len(pattern)]) + bytes(pattern))
+            for table in self.tables:
+                file.write(table)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a file written by `save` into memory. The tables are read-only views of
+        the mapping, so processes that load the same file share its pages.
+
+        :param path: The path of the file to load.
+        :return: A new EightPuzzlePatternDatabase.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, cells, pattern_count = HEADER.unpack_from(mapping, 0)
+        if magic != MAGIC or version != VERSION:
+            raise EightPuzzlePatternDatabaseException(f"{path} is not a pattern database file")
+        offset = HEADER.size
+        goal_state = tuple(None if tile == 0 else tile for tile in mapping[offset:offset + cells])
+        offset += cells
+        patterns = []
+        for _ in range(pattern_count):
+            length = mapping[offset]
+            patterns.append(tuple(mapping[offset + 1:offset + 1 + length]))
+            offset += 1 + length
+        tables = []
+        view = memoryview(mapping)
+        for pattern in patterns:
+            size = cells ** len(pattern)
+            tables.append(view[offset:offset + size])
+            offset += size
+        if offset != len(mapping):
+            raise EightPuzzlePatternDatabaseException(f"{path} is truncated or corrupt")
+        return cls(goal_state, patterns, tables)
+
+    @classmethod
+    def load_or_build(cls, path, goal_state, patterns=None):
+        """
+        Load the pattern database at `path`, building and saving it first if the file
+        does not exist or was built for a different goal state or patterns.
+
+        :param path: The path of the pattern database file.
+        :param goal_state: The goal state of the puzzle.
+        :param patterns: Disjoint tuples of tiles; defaults to `default_patterns(goal_state)`.
+        :return: An EightPuzzlePatternDatabase.
+        """
+        patterns = tuple(tuple(pattern) for pattern in (patterns or cls.default_patterns(goal_state)))
+        if os.path.exists(path):
+            database = cls.load(path)
+            if database.goal_state == tuple(goal_state) and database.patterns == patterns:
+                return database
+        database = cls.build(goal_state, patterns)
+        # Write to a temporary file first so concurrent readers never map a partial table
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        database.save(temporary_path)
+        os.replace(temporary_path, path)
+        return database
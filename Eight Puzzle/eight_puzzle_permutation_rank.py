@@ -0,0 +1,305 @@
+# EightPuzzlePermutationRank: Perfect hashing of sliding-puzzle states by ranking
+# permutations, for tables and closed sets indexed by state instead of hashed.
+# Two rankings of the permutations of range(n) are provided, each with its inverse:
+#   - lexicographic (Lehmer code) rank, whose digits are counted with bit masks, so
+#     ranking takes O(n) word operations;
+#   - the rank of Myrvold and Ruskey (2001), which is not lexicographic but is ranked
+#     and unranked with O(n) swaps.
+# With NumPy installed, the `_batch` variants rank and unrank many permutations at
+# once, with the same results as the pure-Python functions; without it, they raise.
+# A state of an n-cell board is the permutation that maps each cell to the goal
+# position of its tile. For a fixed position of the blank tile, the states that can
+# reach the goal all share one parity of the permutation of the other tiles, and
+# swapping the last two tiles flips both the parity and the lowest bit of their
+# lexicographic rank, so blank * (n - 1)! / 2 + rank // 2 is a perfect index of the
+# n! / 2 states that can reach the goal. EightPuzzleRankedClosedSet keeps one bit per
+# such state: 22,680 bytes for the 3x3 puzzle.
+
+import math
+from eight_puzzle_problem import EightPuzzleProblem
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MAX_BATCH_SIZE = 20  # 20! is the largest factorial that fits in a 64-bit integer
+MAX_CLOSED_SET_STATES = 1 << 32
+
+
+class EightPuzzlePermutationRankException(Exception):
+    pass
+
+
+def lexicographic_rank(permutation):
+    """
+    The lexicographic rank of a permutation of range(n).
+
+    :param permutation: A sequence of the integers 0 to n - 1, each once.
+    :return: An integer in range(factorial(n)).
+    """
+    size = len(permutation)
+    rank = 0
+    used = 0  # A bit for each value already placed
+    for position, value in enumerate(permutation):
+        # The digit is the number of values not yet placed that are smaller
+        rank = rank * (size - position) + value - (used & ((1 << value) - 1)).bit_count()
+        used |= 1 << value
+    return rank
+
+
+def lexicographic_unrank(rank, size):
+    """
+    The permutation of range(size) with the given lexicographic rank; the inverse of
+    `lexicographic_rank`.
+
+    :param rank: An integer in range(factorial(size)).
+    :param size: The number of elements of the permutation.
+    :return: The permutation, as a list.
+    """
+    digits = []
+    for base in range(1, size + 1):
+        rank, digit = divmod(rank, base)
+        digits.append(digit)
+    remaining = list(range(size))
+    return [remaining.pop(digit) for digit in reversed(digits)]
+
+
+def myrvold_ruskey_rank(permutation):
+    """
+    The Myrvold-Ruskey rank of a permutation of range(n), computed with n - 1 swaps.
+
+    :param permutation: A sequence of the integers 0 to n - 1, each once.
+    :return: An integer in range(factorial(n)).
+    """
+    permutation = list(permutation)
+    inverse = [0] * len(permutation)
+    for position, value in enumerate(permutation):
+        inverse[value] = position
+    rank = 0
+    multiplier = 1
+    for size in range(len(permutation), 1, -1):
+        # Swap the last element into the place of the largest value
+        value, position = permutation[size - 1], inverse[size - 1]
+        permutation[size - 1], permutation[position] = size - 1, value
+        inverse[value], inverse[size - 1] = position, size - 1
+        rank += value * multiplier
+        multiplier *= size
+    return rank
+
+
+def myrvold_ruskey_unrank(rank, size):
+    """
+    The permutation of range(size) with the given Myrvold-Ruskey rank; the inverse of
+    `myrvold_ruskey_rank`.
+
+    :param rank: An integer in range(factorial(size)).
+    :param size: The number of elements of the permutation.
+    :return: The permutation, as a list.
+    """
+    permutation = list(range(size))
+    for last in range(size - 1, 0, -1):
+        rank, position = divmod(rank, last + 1)
+        permutation[last], permutation[position] = permutation[position], permutation[last]
+    return permutation
+
+
+def batch_array(values, name):
+    if numpy is None:
+        raise EightPuzzlePermutationRankException(f"{name} needs NumPy, which is not installed")
+    array = numpy.array(values, dtype=numpy.int64)
+    if array.ndim == 2 and array.shape[1] > MAX_BATCH_SIZE:
+        raise EightPuzzlePermutationRankException(f"Ranks of {array.shape[1]} elements do not fit in 64 bits")
+    return array
+
+
+def lexicographic_rank_batch(permutations):
+    """
+    The lexicographic ranks of many permutations of range(n), with NumPy.
+
+    :param permutations: A (count, n) array-like of permutations, with n at most 20.
+    :return: A NumPy array of count ranks.
+    """
+    permutations = batch_array(permutations, "lexicographic_rank_batch")
+    count, size = permutations.shape
+    ranks = numpy.zeros(count, dtype=numpy.int64)
+    for position in range(size):
+        smaller_later = (permutations[:, position + 1:] < permutations[:, position:position + 1]).sum(axis=1)
+        ranks = ranks * (size - position) + smaller_later
+    return ranks
+
+
+def lexicographic_unrank_batch(ranks, size):
+    """
+    The permutations with the given lexicographic ranks, with NumPy.
+
+    :param ranks: An array-like of ranks in range(factorial(size)).
+    :param size: The number of elements of each permutation, at most 20.
+    :return: A (count, size) NumPy array of permutations.
+    """
+    ranks = batch_array(ranks, "lexicographic_unrank_batch")
+    if size > MAX_BATCH_SIZE:
+        raise EightPuzzlePermutationRankException(f"Ranks of {size} elements do not fit in 64 bits")
+    count = len(ranks)
+    digits = numpy.empty((count, size), dtype=numpy.int64)
+    for base in range(1, size + 1):
+        digits[:, size - base] = ranks % base
+        ranks = ranks // base
+    rows = numpy.arange(count)
+    unplaced = numpy.ones((count, size), dtype=bool)
+    permutations = numpy.empty((count, size), dtype=numpy.int64)
+    for position in range(size):
+        # The digit counts the values not yet placed that are smaller than this one
+        values = (numpy.cumsum(unplaced, axis=1) > digits[:, position:position + 1]).argmax(axis=1)
+        permutations[:, position] = values
+        unplaced[rows, values] = False
+    return permutations
+
+
+def myrvold_ruskey_rank_batch(permutations):
+    """
+    The Myrvold-Ruskey ranks of many permutations of range(n), with NumPy.
+
+    :param permutations: A (count, n) array-like of permutations, with n at most 20.
+    :return: A NumPy array of count ranks.
+    """
+    permutations = batch_array(permutations, "myrvold_ruskey_rank_batch")
+    count, size = permutations.shape
+    rows = numpy.arange(count)
+    inverse = numpy.empty_like(permutations)
+    inverse[rows[:, None], permutations] = numpy.arange(size)
+    ranks = numpy.zeros(count, dtype=numpy.int64)
+    multiplier = 1
+    for last in range(size - 1, 0, -1):
+        values, positions = permutations[:, last].copy(), inverse[:, last].copy()
+        permutations[rows, positions] = values
+        permutations[:, last] = last
+        inverse[rows, values] = positions
+        inverse[:, last] = last
+        ranks += values * multiplier
+        multiplier *= last + 1
+    return ranks
+
+
+def myrvold_ruskey_unrank_batch(ranks, size):
+    """
+    The permutations with the given Myrvold-Ruskey ranks, with NumPy.
+
+    :param ranks: An array-like of ranks in range(factorial(size)).
+    :param size: The number of elements of each permutation, at most 20.
+    :return: A (count, size) NumPy array of permutations.
+    """
+    ranks = batch_array(ranks, "myrvold_ruskey_unrank_batch")
+    if size > MAX_BATCH_SIZE:
+        raise EightPuzzlePermutationRankException(f"Ranks of {size} elements do not fit in 64 bits")
+    rows = numpy.arange(len(ranks))
+    permutations = numpy.tile(numpy.arange(size, dtype=numpy.int64), (len(ranks), 1))
+    for last in range(size - 1, 0, -1):
+        positions = ranks % (last + 1)
+        ranks = ranks // (last + 1)
+        values = permutations[rows, positions].copy()
+        permutations[rows, positions] = permutations[:, last]
+        permutations[:, last] = values
+    return permutations
+
+
+class EightPuzzlePermutationRanker:
+    """
+    Ranks of the states of a board, relative to one goal state.
+    """
+
+    def __init__(self, goal_state):
+        """
+        :param goal_state: The goal state, whose tiles are in the identity permutation.
+        """
+        self.goal_state = tuple(goal_state)
+        self.cells = len(self.goal_state)
+        width = math.isqrt(self.cells)
+        if width < 2 or width * width != self.cells or None not in self.goal_state \
+                or len(set(self.goal_state)) != self.cells:
+            raise EightPuzzlePermutationRankException(f"{goal_state} is not a goal state of a square board")
+        self.goal_positions = {tile: index for index, tile in enumerate(self.goal_state)}
+        self.goal_blank = self.goal_positions[None]
+        self.permutations_per_blank = math.factorial(self.cells - 1) // 2
+        self.size = self.cells * self.permutations_per_blank  # The number of states that can reach the goal
+
+    def permutation(self, state):
+        """
+        The goal position of the tile in each cell of a state.
+        """
+        goal_positions = self.goal_positions
+        return [goal_positions[tile] for tile in state]
+
+    def state(self, permutation):
+        """
+        The state whose cells hold the tiles of the given goal positions.
+        """
+        goal_state = self.goal_state
+        return tuple(goal_state[position] for position in permutation)
+
+    def rank(self, state):
+        """
+        The Myrvold-Ruskey rank of a state, in range(factorial(cells)).
+        """
+        return myrvold_ruskey_rank(self.permutation(state))
+
+    def unrank(self, rank):
+        return self.state(myrvold_ruskey_unrank(rank, self.cells))
+
+    def index(self, state):
+        """
+        The perfect index of a state that can reach the goal, in range(self.size).
+        States that cannot reach the goal share indexes with states that can.
+        """
+        goal_positions, goal_blank = self.goal_positions, self.goal_blank
+        # The goal positions of the tiles, renumbered 0 to cells - 2 around the blank's
+        tiles = []
+        for tile in state:
+            if tile is not None:
+                position = goal_positions[tile]
+                tiles.append(position - 1 if position > goal_blank else position)
+        return state.index(None) * self.permutations_per_blank + (lexicographic_rank(tiles) >> 1)
+
+    def unindex(self, index):
+        """
+        The state that can reach the goal with the given index; the inverse of `index`.
+        """
+        blank, half_rank = divmod(index, self.permutations_per_blank)
+        tiles = lexicographic_unrank(half_rank << 1, self.cells - 1)
+        # Of the two permutations sharing the index, take the one that reaches the goal
+        for _ in range(2):
+            positions = [position + 1 if position >= self.goal_blank else position for position in tiles]
+            positions.insert(blank, self.goal_blank)
+            state = self.state(positions)
+            if EightPuzzleProblem(state, self.goal_state, None).is_solvable():
+                return state
+            tiles[-2], tiles[-1] = tiles[-1], tiles[-2]
+        raise EightPuzzlePermutationRankException(f"No state has index {index}")
+
+
+class EightPuzzleRankedClosedSet:
+    """
+    A set of states that can reach one goal state, kept as one bit per state.
+    """
+
+    def __init__(self, goal_state):
+        self.ranker = EightPuzzlePermutationRanker(goal_state)
+        if self.ranker.size > MAX_CLOSED_SET_STATES:
+            raise EightPuzzlePermutationRankException(
+                f"A bit per state of {self.ranker.size} states is too large for a closed set")
+        self.bits = bytearray((self.ranker.size + 7) // 8)
+        self.count = 0
+
+    def add(self, state):
+        index = self.ranker.index(state)
+        mask = 1 << (index & 7)
+        if not self.bits[index >> 3] & mask:
+            self.bits[index >> 3] |= mask
+            self.count += 1
+
+    def __contains__(self, state):
+        index = self.ranker.index(state)
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def __len__(self):
+        return self.count
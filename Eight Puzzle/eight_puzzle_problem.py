@@ -7,12 +7,38 @@
 # Abstractly, it also represents the complete state space of the problem
 # environment.
 
+import math
+from functools import lru_cache
 from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_transition_model import move_targets
 
 class EightPuzzleProblemException(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def action_targets(width):
+    """
+    For each index of the blank tile on a board of the given width, the actions that
+    can be applied and the index the blank tile moves to, in the order left, right,
+    up, down. Computed once per width.
+
+    :return: A tuple holding a tuple of (action, target) pairs for each index.
+    """
+    actions = (EightPuzzleAgent.move_left, EightPuzzleAgent.move_right,
+               EightPuzzleAgent.move_up, EightPuzzleAgent.move_down)
+    return tuple(
+        tuple((action, targets[blank]) for action, targets in zip(actions, move_targets(width))
+              if targets[blank] is not None)
+        for blank in range(width * width)
+    )
+
+
+@lru_cache(maxsize=None)
+def blank_actions(width):
+    return tuple(tuple(action for action, _ in moves) for moves in action_targets(width))
+
+
 class EightPuzzleProblem:
 
     def __init__(self, initial_state, goal_state, transition_model):
@@ -23,28 +49,42 @@ class EightPuzzleProblem:
     def is_goal(self, state):
         return state == self.goal_state
 
+    def is_solvable(self):
+        # Every move swaps the blank tile with a neighbor, which flips the parity of
+        # the permutation from the initial state to the goal state and moves the blank
+        # tile by one row or column. So the goal can only be reached if the parity of
+        # that permutation matches the parity of the blank tile's distance to its goal
+        # position; on a square board this condition is also sufficient.
+        # Counting the cycles of the permutation takes O(n) time for n cells.
+        initial_state, goal_state = tuple(self.initial_state), tuple(self.goal_state)
+        if len(initial_state) != len(goal_state) or sorted(initial_state, key=str) != sorted(goal_state, key=str):
+            return False
+        if len(set(goal_state)) != len(goal_state) or None not in goal_state:
+            return False
+        width = math.isqrt(len(goal_state))
+        if width * width != len(goal_state):
+            return False
+        goal_index = {tile: index for index, tile in enumerate(goal_state)}
+        permutation = [goal_index[tile] for tile in initial_state]
+        seen = [False] * len(permutation)
+        cycles = 0
+        for start in range(len(permutation)):
+            if not seen[start]:
+                cycles += 1
+                index = start
+                while not seen[index]:
+                    seen[index] = True
+                    index = permutation[index]
+        permutation_parity = (len(permutation) - cycles) % 2
+        blank, goal_blank = initial_state.index(None), goal_index[None]
+        blank_distance = abs(blank // width - goal_blank // width) + abs(blank % width - goal_blank % width)
+        return permutation_parity == blank_distance % 2
+
     def actions(self, state):
-        match state.index(None):
-            case 0:
-                return [EightPuzzleAgent.move_right, EightPuzzleAgent.move_down]
-            case 1:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_right, EightPuzzleAgent.move_down]
-            case 2:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_down]
-            case 3:
-                return [EightPuzzleAgent.move_right, EightPuzzleAgent.move_up, EightPuzzleAgent.move_down]
-            case 4:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_right, EightPuzzleAgent.move_up, EightPuzzleAgent.move_down]
-            case 5:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_up, EightPuzzleAgent.move_down]
-            case 6:
-                return [EightPuzzleAgent.move_right, EightPuzzleAgent.move_up]
-            case 7:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_right, EightPuzzleAgent.move_up]
-            case 8:
-                return [EightPuzzleAgent.move_left, EightPuzzleAgent.move_up]
-            case _:
-                raise EightPuzzleProblemException("Empty tile not found within state.")
+        width = math.isqrt(len(state))
+        if width * width != len(state) or None not in state:
+            raise EightPuzzleProblemException("Empty tile not found within state.")
+        return list(blank_actions(width)[state.index(None)])
 
     def result(self, state, action):
         match action:
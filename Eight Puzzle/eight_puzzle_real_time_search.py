@@ -0,0 +1,96 @@
+# EightPuzzleRealTimeSearch: Real-time-adaptive A* (RTAA*, Koenig and Likhachev 2006)
+# for an EightPuzzleAgent that must act within a fixed amount of computation.
+# Each call to `plan` runs A* from the agent's state for at most `lookahead` node
+# expansions, then returns the actions to the most promising state on the frontier,
+# the one with the lowest f = g + h. Every state expanded learns the heuristic value
+# h(s) = f(best) - g(s), which the base heuristic cannot exceed when it is consistent,
+# so the learned values stay admissible and only grow. They are kept in a dict that
+# persists between plans and between episodes: an agent revisiting a state knows more
+# about it each time, and repeated episodes from one start converge to an optimal
+# path. With a lookahead of one expansion, RTAA* is LRTA* with a one-step lookahead.
+
+import heapq
+import math
+from eight_puzzle_heuristics import EightPuzzleManhattanHeuristic
+from eight_puzzle_problem import EightPuzzleProblem, action_targets
+
+
+class EightPuzzleRealTimeSearchException(Exception):
+    pass
+
+
+class EightPuzzleRealTimeSearch:
+
+    def __init__(self, goal_state, lookahead=1, evaluator=None, learned_heuristic=None):
+        """
+        :param goal_state: The goal state the agent must reach.
+        :param lookahead: The number of node expansions each plan may take, which bounds
+            the computation spent before each action.
+        :param evaluator: The base heuristic from eight_puzzle_heuristics, for states
+            not yet learned. The Manhattan distance by default.
+        :param learned_heuristic: A dict of learned heuristic values to start from and
+            update, such as one kept from earlier episodes. A new dict by default.
+        """
+        if not isinstance(lookahead, int) or lookahead < 1:
+            raise EightPuzzleRealTimeSearchException("The lookahead must be a positive number of expansions")
+        self.goal_state = tuple(goal_state)
+        self.lookahead = lookahead
+        self.evaluator = evaluator if evaluator is not None else EightPuzzleManhattanHeuristic(self.goal_state)
+        if self.evaluator.goal_state != self.goal_state:
+            raise EightPuzzleRealTimeSearchException(f"The evaluator was not built for goal state {goal_state}")
+        self.learned_heuristic = learned_heuristic if learned_heuristic is not None else {}
+        self.moves = action_targets(math.isqrt(len(self.goal_state)))
+
+    def is_goal(self, state):
+        return tuple(state) == self.goal_state
+
+    def heuristic(self, state):
+        learned = self.learned_heuristic.get(state)
+        return learned if learned is not None else self.evaluator.heuristic(state)
+
+    def plan(self, state):
+        """
+        Look ahead from a state and learn from what was seen.
+
+        :param state: The agent's current state, as a tuple.
+        :return: The list of actions to the most promising frontier state, empty at the goal.
+        """
+        state = tuple(state)
+        if not EightPuzzleProblem(state, self.goal_state, None).is_solvable():
+            raise EightPuzzleRealTimeSearchException(f"The goal cannot be reached from {state}")
+        goal_state, moves, heuristic = self.goal_state, self.moves, self.heuristic
+        path_costs = {state: 0}
+        parents = {state: None}
+        expanded = set()
+        expansions = 0
+        frontier = [(heuristic(state), 0, 0, state)]
+        counter = 1
+        while True:
+            f, negated_cost, _, current = heapq.heappop(frontier)
+            if -negated_cost > path_costs[current]:
+                continue  # A stale entry, for a state since reached by a cheaper path
+            if current == goal_state or expansions == self.lookahead:
+                break
+            expanded.add(current)
+            expansions += 1
+            cost = path_costs[current] + 1
+            blank = current.index(None)
+            for action, target in moves[blank]:
+                board = list(current)
+                board[blank], board[target] = board[target], None
+                child = tuple(board)
+                if cost < path_costs.get(child, cost + 1):
+                    path_costs[child] = cost
+                    parents[child] = (current, action)
+                    # Ties go to the deeper state, which is closer to the goal
+                    heapq.heappush(frontier, (cost + heuristic(child), -cost, counter, child))
+                    counter += 1
+        learned_heuristic = self.learned_heuristic
+        for expanded_state in expanded:
+            learned_heuristic[expanded_state] = max(heuristic(expanded_state), f - path_costs[expanded_state])
+        actions = []
+        while parents[current] is not None:
+            current, action = parents[current]
+            actions.append(action)
+        actions.reverse()
+        return actions
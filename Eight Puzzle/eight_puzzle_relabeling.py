@@ -0,0 +1,66 @@
+# EightPuzzleRelabeling: Map any eight-puzzle problem onto a canonical goal state by
+# renaming its tiles. The tile that the goal places in the k-th non-blank cell, in
+# reading order, is renamed k, so every goal becomes 1, 2, ..., n-1 in reading
+# order with the blank tile where the goal has it. For the usual goal with the
+# blank tile first, that is (None, 1, 2, ..., 8).
+# Renaming tiles does not change which cell holds the blank tile, so a move leads
+# to the same cell in the original and the canonical problem, and a solution of the
+# canonical problem is a solution of the original one as it is. Only the states are
+# relabeled. A pattern database or distance oracle built for a canonical goal
+# therefore serves every goal with its blank tile in the same cell.
+
+from functools import lru_cache
+from eight_puzzle_problem import EightPuzzleProblem
+
+
+@lru_cache(maxsize=64)
+def relabeling(goal_state):
+    """
+    The new label of each tile of a goal state.
+
+    :param goal_state: The goal state, as a tuple.
+    :return: A dict mapping each tile to its canonical label, and None to None.
+    """
+    labels = {None: None}
+    label = 0
+    for tile in goal_state:
+        if tile is not None:
+            label += 1
+            labels[tile] = label
+    return labels
+
+
+def canonical_goal_state(goal_state):
+    """
+    The canonical goal state with the blank tile in the same cell as in `goal_state`.
+    """
+    return relabel(goal_state, relabeling(tuple(goal_state)))
+
+
+def relabel(state, labels):
+    return tuple(labels[tile] for tile in state)
+
+
+def can_relabel(initial_state, goal_state):
+    # A problem whose tiles differ from its goal's, or whose goal repeats a tile,
+    # cannot be renamed consistently; it is left as it is and found unsolvable.
+    return (len(initial_state) == len(goal_state) and len(set(goal_state)) == len(goal_state)
+            and None in goal_state and set(initial_state) == set(goal_state))
+
+
+def canonical_problem(problem):
+    """
+    The problem with its tiles renamed so that its goal state is canonical.
+
+    :param problem: An EightPuzzleProblem.
+    :return: A new EightPuzzleProblem sharing the transition model, or `problem`
+        itself if its goal is already canonical or its tiles cannot be renamed.
+    """
+    initial_state, goal_state = tuple(problem.initial_state), tuple(problem.goal_state)
+    if not can_relabel(initial_state, goal_state):
+        return problem
+    labels = relabeling(goal_state)
+    canonical_goal = relabel(goal_state, labels)
+    if canonical_goal == goal_state:
+        return problem
+    return EightPuzzleProblem(relabel(initial_state, labels), canonical_goal, problem.transition_model)
@@ -0,0 +1,87 @@
+# EightPuzzleSearchBudget: The limits of one search by EightPuzzleBestFirstSearchSolver:
+# a deadline, a number of node expansions, and a cancellation token that another
+# thread may trigger. The search charges the budget for each node it expands, and
+# the budget raises EightPuzzleBudgetExceeded once any limit is reached. The clock
+# and the token are read once every CHECK_INTERVAL expansions, so a budget costs
+# little more than a counter. The budget also remembers the path to the expanded
+# node with the lowest heuristic estimate, the best partial solution to return
+# when the search is stopped. A search that keeps a bounded number of nodes, such as
+# SMA*, raises EightPuzzleBudgetExceeded with the MAX_STORED_NODES reason when no
+# solution fits in its memory, whether or not it was given a budget.
+
+import math
+import threading
+import time
+
+
+class EightPuzzleCancellationToken:
+    """
+    A flag that asks the searches holding it to stop. It may be set from any thread.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+
+class EightPuzzleBudgetExceeded(Exception):
+
+    def __init__(self, reason):
+        super().__init__(f"The search budget was exceeded: {reason}")
+        self.reason = reason
+
+
+class EightPuzzleSearchBudget:
+
+    DEADLINE = "deadline"
+    MAX_NODES = "max_nodes"
+    CANCELLED = "cancelled"
+    MAX_STORED_NODES = "max_stored_nodes"
+    CHECK_INTERVAL = 256
+
+    def __init__(self, deadline=None, max_nodes=None, cancellation_token=None):
+        """
+        :param deadline: The time.monotonic() value at which the search stops, or None.
+        :param max_nodes: The number of nodes the search may expand, or None.
+        :param cancellation_token: An optional EightPuzzleCancellationToken, or any
+            object whose `cancelled` attribute becomes true when the search should stop.
+        """
+        self.deadline = deadline
+        self.max_nodes = max_nodes
+        self.cancellation_token = cancellation_token
+        self.nodes_expanded = 0
+        self.best_estimate = math.inf
+        self.partial_actions = []
+
+    def charge(self, estimate, node, actions_to):
+        """
+        Count the expansion of a node, and stop the search if the budget is exhausted.
+
+        :param estimate: The heuristic estimate of the node's distance to the goal.
+        :param node: The node, in whatever form the search keeps it.
+        :param actions_to: A function of the node that returns the actions reaching it.
+            It is only called when the node is the closest to the goal so far.
+        """
+        self.nodes_expanded += 1
+        if estimate < self.best_estimate:
+            self.best_estimate = estimate
+            self.partial_actions = actions_to(node)
+        if self.max_nodes is not None and self.nodes_expanded > self.max_nodes:
+            raise EightPuzzleBudgetExceeded(self.MAX_NODES)
+        if self.nodes_expanded % self.CHECK_INTERVAL == 1:
+            self.check()
+
+    def check(self):
+        """
+        Stop the search if it was cancelled or its deadline has passed.
+        """
+        if self.cancellation_token is not None and self.cancellation_token.cancelled:
+            raise EightPuzzleBudgetExceeded(self.CANCELLED)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise EightPuzzleBudgetExceeded(self.DEADLINE)
@@ -0,0 +1,29 @@
+# EightPuzzleSearchResult: The outcome of solving an eight-puzzle problem. Besides
+# the list of actions that EightPuzzleBestFirstSearchSolver.solution returns, a
+# result says why the search stopped, so that a problem that cannot be solved is
+# not mistaken for one that is already solved. A result may carry the
+# EightPuzzleSearchStatistics collected while it was found. A solution found with
+# an inflated heuristic is at most `suboptimality_bound` times longer than optimal.
+# A search stopped by its budget (see EightPuzzleSearchBudget) has no solution: its
+# actions only lead to the state closest to the goal it found, and
+# `exceeded_budget` says which limit stopped it.
+
+class EightPuzzleSearchResult:
+
+    SOLVED = "solved"
+    UNSOLVABLE = "unsolvable"
+    BUDGET_EXCEEDED = "budget_exceeded"
+
+    def __init__(self, status, actions, statistics=None, suboptimality_bound=1, exceeded_budget=None):
+        self.status = status
+        self.actions = actions
+        self.statistics = statistics
+        self.suboptimality_bound = suboptimality_bound
+        self.exceeded_budget = exceeded_budget
+
+    @property
+    def solved(self):
+        return self.status == self.SOLVED
+
+    def __repr__(self):
+        return f"EightPuzzleSearchResult({self.status!r}, {len(self.actions)} actions)"
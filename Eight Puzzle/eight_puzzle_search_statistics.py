@@ -0,0 +1,94 @@
+# EightPuzzleSearchStatistics: Counters and timings collected while an
+# EightPuzzleBestFirstSearchSolver solves a problem. Pass an instance to
+# EightPuzzleBestFirstSearchSolver.solve to collect them; without one, the solver
+# never reads a clock or updates a counter. Callbacks given as `on_expand` are
+# called with each node as it is expanded.
+# Every search splits its time the same way: computing or updating the heuristic
+# estimates of children is heuristic time, and generating the children is expansion
+# time. Breadth-first search estimates nothing, so its heuristic time stays zero.
+# The memory-bounded searches, RBFS and SMA*, forget parts of the search and come back
+# to them, so they also count the expansions of states expanded before, their
+# overhead over A*, and SMA* counts the nodes it forgets.
+
+
+class EightPuzzleSearchStatistics:
+
+    def __init__(self, on_expand=()):
+        """
+        :param on_expand: Callables that each take the node being expanded.
+        """
+        self.on_expand = tuple(on_expand)
+        self.nodes_expanded = 0
+        self.nodes_generated = 0
+        self.duplicates_pruned = 0
+        self.peak_frontier_size = 0
+        self.peak_explored_size = 0
+        self.iterations = 0  # Depth-first iterations of IDA*
+        self.nodes_reexpanded = 0  # Expansions of states already expanded, by RBFS and SMA*
+        self.nodes_forgotten = 0  # Nodes dropped by SMA* to stay within its memory
+        self.heuristic_time = 0.0
+        self.expansion_time = 0.0
+        self.search_time = 0.0
+        self.solution_depth = None
+
+    def expanded(self, node, frontier_size=0, explored_size=0):
+        """
+        Record the expansion of a node.
+
+        :param node: The node being expanded.
+        :param frontier_size: The number of nodes on the frontier.
+        :param explored_size: The number of explored states.
+        """
+        self.nodes_expanded += 1
+        if frontier_size > self.peak_frontier_size:
+            self.peak_frontier_size = frontier_size
+        if explored_size > self.peak_explored_size:
+            self.peak_explored_size = explored_size
+        for callback in self.on_expand:
+            callback(node)
+
+    @property
+    def effective_branching_factor(self):
+        """
+        The branching factor b* of a uniform tree of the solution's depth d that holds
+        as many nodes as were generated: N + 1 = 1 + b* + b*^2 + ... + b*^d.
+
+        :return: b*, or None if there is no solution of depth 1 or more.
+        """
+        depth, generated = self.solution_depth, self.nodes_generated
+        if not depth or generated < depth:
+            return None
+
+        def tree_size(branching_factor):
+            return sum(branching_factor ** level for level in range(depth + 1))
+
+        # The tree holds at least b*^d nodes, so b* is at most (N + 1)^(1/d); starting
+        # there keeps every power of the search finite for deep solutions.
+        low, high = 1.0, (generated + 1) ** (1 / depth)
+        for _ in range(100):
+            middle = (low + high) / 2
+            if tree_size(middle) < generated + 1:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+
+    def as_dict(self):
+        return {
+            "nodes_expanded": self.nodes_expanded,
+            "nodes_generated": self.nodes_generated,
+            "duplicates_pruned": self.duplicates_pruned,
+            "peak_frontier_size": self.peak_frontier_size,
+            "peak_explored_size": self.peak_explored_size,
+            "iterations": self.iterations,
+            "nodes_reexpanded": self.nodes_reexpanded,
+            "nodes_forgotten": self.nodes_forgotten,
+            "heuristic_time": self.heuristic_time,
+            "expansion_time": self.expansion_time,
+            "search_time": self.search_time,
+            "solution_depth": self.solution_depth,
+            "effective_branching_factor": self.effective_branching_factor,
+        }
+
+    def __repr__(self):
+        return f"EightPuzzleSearchStatistics({self.as_dict()})"
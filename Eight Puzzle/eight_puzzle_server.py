@@ -0,0 +1,443 @@
+# EightPuzzleServer: An asyncio service that solves eight-puzzle problems for
+# clients on a local TCP or Unix socket. Requests and responses are JSON objects,
+# one per line:
+#
+#   {"id": 1, "initial_state": [7, 2, 4, 5, null, 6, 8, 3, 1], "goal_state": [null, 1, 2, 3, 4, 5, 6, 7, 8],
+#    "time_budget": 5, "max_nodes": 100000}
+#   {"id": 1, "status": "solved", "actions": ["move_left", ...], "suboptimality_bound": 1,
+#    "nodes_expanded": 1436, "latency": 0.021}
+#   {"op": "stats"}
+#
+# Solves run on a pool of worker processes, so a slow one never blocks the event
+# loop. At most `max_in_flight` solves run at once; past that, the server stops
+# reading from the connection until a solve finishes, and the client feels the
+# backpressure. Each request may lower the server's time and node budgets; a solve
+# that runs out of either stops with the status "timed_out" or "node_budget_exceeded",
+# and the actions to the closest state to the goal it found as "partial_actions". An
+# SMA* solver whose stored-node cap holds no solution answers "memory_exceeded".
+# Concurrent identical requests share one solve. A client may half-close its side of
+# the connection once it has sent its requests; it still receives every response.
+# When every client waiting on a solve is gone, because its connection was reset or
+# a response to it could not be written, the solve is cancelled through a flag in
+# shared memory that its worker's search budget reads as a cancellation token.
+# A request line longer than `max_request_bytes` is discarded and answered with an error.
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from eight_puzzle_batch_solver import encode_state, decode_state, EightPuzzleBatchSolverException
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase
+from eight_puzzle_problem import EightPuzzleProblem, EightPuzzleProblemException
+from eight_puzzle_search_budget import EightPuzzleSearchBudget
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_transition_model import EightPuzzleTransitionModel, EightPuzzleTransitionException
+
+TIMED_OUT = "timed_out"
+NODE_BUDGET_EXCEEDED = "node_budget_exceeded"
+MEMORY_EXCEEDED = "memory_exceeded"
+CANCELLED = "cancelled"
+ERROR = "error"
+# The response status of each budget that can stop a solve
+BUDGET_STATUSES = {EightPuzzleSearchBudget.DEADLINE: TIMED_OUT, EightPuzzleSearchBudget.MAX_NODES: NODE_BUDGET_EXCEEDED,
+                   EightPuzzleSearchBudget.CANCELLED: CANCELLED,
+                   EightPuzzleSearchBudget.MAX_STORED_NODES: MEMORY_EXCEEDED}
+PERCENTILES = (50, 90, 99)
+OVERSIZED = object()  # Read in place of a request line that was too long
+
+# The solver and cancellation flags of the current worker process, set by initialize_worker
+worker_solver = None
+worker_cancel_flags = None
+
+
+class EightPuzzleServerException(Exception):
+    pass
+
+
+class SharedCancellationFlag:
+    """
+    The cancellation token of a solve in a worker: one flag of the server's array.
+    """
+
+    def __init__(self, flags, slot):
+        self.flags = flags
+        self.slot = slot
+
+    @property
+    def cancelled(self):
+        return bool(self.flags[self.slot])
+
+
+def initialize_worker(solver_options, pattern_database_path, cancel_flags):
+    global worker_solver, worker_cancel_flags
+    if pattern_database_path is not None:
+        solver_options = dict(solver_options, pattern_database=EightPuzzlePatternDatabase.load(pattern_database_path))
+    worker_solver = EightPuzzleBestFirstSearchSolver(**solver_options)
+    worker_cancel_flags = cancel_flags
+
+
+def solve_request(slot, width, initial_state, goal_state, time_budget, max_nodes):
+    """
+    Solve one compact problem with the worker's solver, within the budgets.
+
+    :param slot: The index of the solve's cancellation flag.
+    :param width: The width of the board.
+    :param initial_state: The initial state, as bytes with 0 for the blank tile.
+    :param goal_state: The goal state, in the same form.
+    :param time_budget: The number of seconds the search may run, or None.
+    :param max_nodes: The number of nodes the search may expand, or None.
+    :return: The fields of the response, as a dict.
+    """
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    statistics = EightPuzzleSearchStatistics()
+    try:
+        problem = EightPuzzleProblem(decode_state(initial_state), decode_state(goal_state),
+                                     EightPuzzleTransitionModel(width))
+        result = worker_solver.solve(problem, statistics, deadline, max_nodes,
+                                     SharedCancellationFlag(worker_cancel_flags, slot))
+    except (EightPuzzleSolverException, EightPuzzleProblemException, EightPuzzleTransitionException) as error:
+        return {"status": ERROR, "error": str(error)}
+    if result.status == EightPuzzleSearchResult.BUDGET_EXCEEDED:
+        return {
+            "status": BUDGET_STATUSES[result.exceeded_budget],
+            "actions": [],
+            "partial_actions": [action.__name__ for action in result.actions],
+            "nodes_expanded": statistics.nodes_expanded,
+        }
+    return {
+        "status": result.status,
+        "actions": [action.__name__ for action in result.actions],
+        "suboptimality_bound": result.suboptimality_bound,
+        "nodes_expanded": statistics.nodes_expanded,
+    }
+
+
+def percentile(ordered_values, percent):
+    """
+    The nearest-rank percentile of a sorted list.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(ordered_values)))
+    return ordered_values[rank - 1]
+
+
+class InFlightSolve:
+
+    def __init__(self, future, slot):
+        self.future = future
+        self.slot = slot
+        self.waiters = 0
+
+
+class EightPuzzleServer:
+
+    def __init__(self, workers=None, max_in_flight=32, time_budget=10.0, max_nodes=None,
+                 latency_window=10000, pattern_database_path=None, max_request_bytes=1 << 16, **solver_options):
+        """
+        Initialize the server. Call `start` to open its socket.
+
+        :param workers: The number of worker processes; defaults to the number of CPUs.
+        :param max_in_flight: The number of solves that may be running or queued for
+            the workers at once.
+        :param time_budget: The number of seconds a solve may run, or None for no limit.
+            Requests may ask for less.
+        :param max_nodes: The number of nodes a solve may expand, or None for no limit.
+            Requests may ask for fewer.
+        :param latency_window: The number of recent latencies the percentiles are taken from.
+        :param pattern_database_path: The path of an EightPuzzlePatternDatabase file that
+            each worker maps and gives to its solver.
+        :param max_request_bytes: The length of the longest request line the server reads.
+        :param solver_options: Keyword arguments for EightPuzzleBestFirstSearchSolver.
+        """
+        if max_request_bytes < 2:
+            raise EightPuzzleServerException(f"Invalid request line limit {max_request_bytes}")
+        if max_in_flight < 1:
+            raise EightPuzzleServerException(f"Invalid number of solves in flight {max_in_flight}")
+        if (time_budget is not None and time_budget <= 0) or (max_nodes is not None and max_nodes < 1):
+            raise EightPuzzleServerException(f"Invalid budgets of {time_budget} seconds and {max_nodes} nodes")
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight
+        self.max_request_bytes = max_request_bytes
+        self.time_budget = time_budget
+        self.max_nodes = max_nodes
+        self.pattern_database_path = pattern_database_path
+        self.solver_options = solver_options
+        # Fail early, in the calling process, on options the solver rejects
+        EightPuzzleBestFirstSearchSolver(**solver_options)
+        self.cancel_flags = multiprocessing.Array("b", max_in_flight, lock=False)
+        self.latencies = deque(maxlen=latency_window)
+        self.counts = Counter()
+        self.solves = {}  # In-flight solves, by request key
+        self.connections = {}  # The writer of each open connection, by handler task
+        self.free_slots = None
+        self.executor = None
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Start the worker processes and listen for clients.
+
+        :param host: The address to listen on with TCP.
+        :param port: The TCP port; 0 picks a free one (see `address`).
+        :param path: The path of a Unix socket to listen on instead of TCP.
+        :return: The asyncio server.
+        """
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=initialize_worker,
+                                            initargs=(self.solver_options, self.pattern_database_path,
+                                                      self.cancel_flags))
+        # Start the workers before any socket is open, so that a forked worker holds no
+        # client connection and closing one reaches the client.
+        await asyncio.get_running_loop().run_in_executor(self.executor, os.getpid)
+        self.free_slots = asyncio.Queue()
+        for slot in range(self.max_in_flight):
+            self.free_slots.put_nowait(slot)
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_connection, path=path,
+                                                          limit=self.max_request_bytes)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port, limit=self.max_request_bytes)
+        return self.server
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        await self.server.serve_forever()
+
+    async def close(self):
+        """
+        Stop listening, cancel the solves in flight, and stop the workers.
+        """
+        if self.server is not None:
+            self.server.close()
+            for task, writer in self.connections.items():
+                writer.close()
+                task.cancel()  # Also stops waiting for the replies of half-closed connections
+            await asyncio.gather(*self.connections, return_exceptions=True)
+            await self.server.wait_closed()
+        for solve in self.solves.values():
+            self.cancel_flags[solve.slot] = 1
+        if self.executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exception):
+        await self.close()
+
+    async def handle_connection(self, reader, writer):
+        replies = set()
+        write_lock = asyncio.Lock()
+        self.connections[asyncio.current_task()] = writer
+        reset = False
+        try:
+            while True:
+                line = await self.read_request(reader)
+                if not line:
+                    break  # The client has sent all its requests, but may still read replies
+                request = None
+                try:
+                    if line is OVERSIZED:
+                        raise EightPuzzleServerException(f"A request line is longer than {self.max_request_bytes} bytes")
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise EightPuzzleServerException("A request must be a JSON object")
+                    if request.get("op", "solve") == "stats":
+                        await self.send(writer, write_lock, dict(self.statistics(), id=request.get("id")))
+                        continue
+                    reply = await self.submit(request, writer, write_lock)
+                except (ValueError, EightPuzzleServerException, EightPuzzleBatchSolverException) as error:
+                    self.counts[ERROR] += 1
+                    request_id = request.get("id") if isinstance(request, dict) else None
+                    await self.send(writer, write_lock, {"id": request_id, "status": ERROR, "error": str(error)})
+                    continue
+                replies.add(reply)
+                reply.add_done_callback(replies.discard)
+        except ConnectionError:
+            reset = True
+        finally:
+            try:
+                await self.finish_replies(replies, writer, reset)
+            finally:
+                writer.close()
+                del self.connections[asyncio.current_task()]
+
+    @staticmethod
+    async def read_request(reader):
+        """
+        Read one request line. A line longer than the reader's limit is read to its end
+        and dropped.
+
+        :return: The line, b"" at the end of the stream, or OVERSIZED.
+        """
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            return error.partial  # The last line, if it has no newline
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+        while True:
+            # Drop what is buffered of the line, then look for its end again
+            await reader.readexactly(consumed)
+            try:
+                await reader.readuntil(b"\n")
+                return OVERSIZED
+            except asyncio.IncompleteReadError:
+                return OVERSIZED
+            except asyncio.LimitOverrunError as error:
+                consumed = error.consumed
+
+    @staticmethod
+    async def finish_replies(replies, writer, reset):
+        """
+        Send the replies still pending on a connection, and cancel them, stopping the
+        solves nobody else is waiting on, once nobody can read them: the connection was
+        reset, a reply could not be written, or the connection is closing.
+        """
+        pending = set(replies)
+        try:
+            while pending and not reset and not writer.transport.is_closing():
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                reset = any(not reply.cancelled() and reply.exception() is not None for reply in done)
+        finally:
+            for reply in pending:
+                reply.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def submit(self, request, writer, write_lock):
+        """
+        Start or join the solve of a request, and schedule its response.
+
+        :return: The task that sends the response.
+        """
+        started = time.perf_counter()
+        key = self.request_key(request)
+        solve = self.solves.get(key)
+        if solve is None:
+            # Wait for room before reading further requests from this client
+            slot = await self.free_slots.get()
+            solve = self.solves.get(key)
+            if solve is None:
+                solve = self.start_solve(key, slot)
+            else:
+                self.free_slots.put_nowait(slot)
+                self.counts["deduplicated"] += 1
+        else:
+            self.counts["deduplicated"] += 1
+        solve.waiters += 1
+        return asyncio.create_task(self.reply(key, solve, request.get("id"), started, writer, write_lock))
+
+    def request_key(self, request):
+        initial_state, goal_state = request.get("initial_state"), request.get("goal_state")
+        if not isinstance(initial_state, list) or not isinstance(goal_state, list):
+            raise EightPuzzleServerException("A solve request needs an initial_state and a goal_state")
+        width = math.isqrt(len(goal_state))
+        if width < 2 or width * width != len(goal_state) or len(initial_state) != len(goal_state):
+            raise EightPuzzleServerException(f"States {initial_state} and {goal_state} are not of one square board")
+        if any(not (tile is None or type(tile) is int) for tile in initial_state + goal_state) \
+                or sorted(initial_state, key=str) != sorted(goal_state, key=str):
+            raise EightPuzzleServerException(f"States {initial_state} and {goal_state} do not have the same tiles")
+        time_budget = self.budget(request.get("time_budget"), self.time_budget, "time_budget")
+        max_nodes = self.budget(request.get("max_nodes"), self.max_nodes, "max_nodes")
+        return width, encode_state(initial_state), encode_state(goal_state), time_budget, max_nodes
+
+    @staticmethod
+    def budget(requested, limit, name):
+        if requested is None:
+            return limit
+        if type(requested) not in (int, float) or requested <= 0:
+            raise EightPuzzleServerException(f"Invalid {name} {requested}")
+        return requested if limit is None else min(requested, limit)
+
+    def start_solve(self, key, slot):
+        self.cancel_flags[slot] = 0
+        future = asyncio.wrap_future(self.executor.submit(solve_request, slot, *key))
+        solve = InFlightSolve(future, slot)
+        self.solves[key] = solve
+        future.add_done_callback(lambda _: self.finish_solve(key, solve))
+        return solve
+
+    def finish_solve(self, key, solve):
+        if self.solves.get(key) is solve:
+            del self.solves[key]
+        if not solve.future.cancelled():
+            solve.future.exception()  # Retrieved here, so an unawaited failure is not reported
+        self.free_slots.put_nowait(solve.slot)
+
+    async def reply(self, key, solve, request_id, started, writer, write_lock):
+        try:
+            response = await asyncio.shield(solve.future)
+        except asyncio.CancelledError:
+            solve.waiters -= 1
+            if solve.waiters == 0 and not solve.future.done():
+                self.cancel_flags[solve.slot] = 1
+                # Later identical requests start a new solve instead of joining this one
+                if self.solves.get(key) is solve:
+                    del self.solves[key]
+                self.counts[CANCELLED] += 1
+            raise
+        except Exception as error:
+            solve.waiters -= 1
+            response = {"status": ERROR, "error": f"The solve failed: {error!r}"}
+        else:
+            solve.waiters -= 1
+        latency = time.perf_counter() - started
+        self.latencies.append(latency)
+        self.counts[response["status"]] += 1
+        await self.send(writer, write_lock, dict(response, id=request_id, latency=latency))
+
+    @staticmethod
+    async def send(writer, write_lock, response):
+        async with write_lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    def statistics(self):
+        """
+        The counts of responses by status, the solves in flight, and the latency
+        percentiles of recent responses, in seconds.
+        """
+        ordered = sorted(self.latencies)
+        latency = {f"p{percent}": percentile(ordered, percent) if ordered else None for percent in PERCENTILES}
+        return {
+            "status": "stats",
+            "counts": dict(self.counts),
+            # Cancelled solves hold their slot until their worker stops
+            "in_flight": self.max_in_flight - self.free_slots.qsize(),
+            "latency": latency,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve eight-puzzle solves as newline-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8642)
+    parser.add_argument("--unix-socket", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--max-in-flight", type=int, default=32)
+    parser.add_argument("--time-budget", type=float, default=10.0)
+    parser.add_argument("--max-nodes", type=int)
+    parser.add_argument("--algorithm", default=EightPuzzleBestFirstSearchSolver.A_STAR)
+    arguments = parser.parse_args()
+
+    async def serve():
+        server = EightPuzzleServer(workers=arguments.workers, max_in_flight=arguments.max_in_flight,
+                                   time_budget=arguments.time_budget, max_nodes=arguments.max_nodes,
+                                   algorithm=arguments.algorithm)
+        async with server:
+            await server.start(arguments.host, arguments.port, arguments.unix_socket)
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# EightPuzzleSolutionCache: Remember the results of solved eight-puzzle problems.
+# Problems are keyed by their canonical (initial, goal) pair (see
+# eight_puzzle_relabeling), so problems that differ only in the names of their
+# tiles share an entry, and a solution found for one is a solution for all.
+# Recently used results are kept in memory, at most `capacity` of them, and
+# evicted least recently used first. With a `path`, every result is also written
+# to a dbm file, so results survive the process and are shared by later runs.
+# Keys and results are stored in the compact byte form of the batch solver.
+
+import dbm
+from collections import OrderedDict
+from eight_puzzle_batch_solver import encode_state, encode_actions, decode_actions
+from eight_puzzle_relabeling import canonical_problem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+
+STATUSES = (EightPuzzleSearchResult.SOLVED, EightPuzzleSearchResult.UNSOLVABLE)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+class EightPuzzleSolutionCache:
+
+    def __init__(self, capacity=4096, path=None):
+        """
+        :param capacity: The number of results kept in memory.
+        :param path: The path of a dbm file to keep every result in, created if missing.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.database = dbm.open(path, "c") if path is not None else None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        if self.database is not None:
+            self.database.close()
+            self.database = None
+
+    @staticmethod
+    def key(problem):
+        problem = canonical_problem(problem)
+        return encode_state(problem.initial_state) + encode_state(problem.goal_state)
+
+    def get(self, problem):
+        """
+        The cached result of a problem.
+
+        :param problem: An EightPuzzleProblem.
+        :return: A new EightPuzzleSearchResult, or None if the problem is not cached.
+        """
+        key = self.key(problem)
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        elif self.database is not None and key in self.database:
+            value = self.database[key]
+            self.remember(key, value)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        status = STATUSES[value[0]]
+        # Only optimal solutions are cached; an unsolvable problem has no bound
+        suboptimality_bound = 1 if status == EightPuzzleSearchResult.SOLVED else None
+        return EightPuzzleSearchResult(status, decode_actions(value[1:]), suboptimality_bound=suboptimality_bound)
+
+    def put(self, problem, result):
+        """
+        Cache the result of a problem.
+
+        :param problem: An EightPuzzleProblem.
+        :param result: The EightPuzzleSearchResult of solving it.
+        """
+        if result.status not in STATUS_CODES:
+            return  # Only final results are worth remembering
+        key = self.key(problem)
+        value = bytes([STATUS_CODES[result.status]]) + encode_actions(result.actions)
+        self.remember(key, value)
+        if self.database is not None:
+            self.database[key] = value
+
+    def remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
@@ -0,0 +1,53 @@
+# EightPuzzleTableFile: The file format of the tables compiled for one goal state of
+# the 3x3 puzzle and indexed by EightPuzzlePermutationRanker.index, such as the
+# distances of EightPuzzleDistanceOracle and the actions of EightPuzzleReflexPolicy.
+# A file holds a header (a four-byte magic naming the kind of table, a version, and
+# the goal state with the blank tile as 0) followed by the table. Files are written
+# under a temporary name and renamed, so readers never map a partially written
+# table, and are mapped read-only, so every process that loads one shares its pages.
+
+import mmap
+import os
+import struct
+
+HEADER = struct.Struct("<4sB9B")  # magic, version, goal state (blank tile as 0)
+
+
+def save_table(path, magic, version, goal_state, table):
+    """
+    Write a goal state and its table to a file that `load_table` can map.
+
+    :param path: The path of the file to write.
+    :param magic: The four bytes that name the kind of table.
+    :param version: The version of the table's layout.
+    :param goal_state: The goal state the table was compiled for.
+    :param table: The table, as a bytes-like object.
+    """
+    goal = [0 if tile is None else tile for tile in goal_state]
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(HEADER.pack(magic, version, *goal))
+        file.write(table)
+    os.replace(temporary_path, path)
+
+
+def load_table(path, magic, version, table_size):
+    """
+    Map a file written by `save_table` into memory, read-only.
+
+    :param path: The path of the file to load.
+    :param magic: The four bytes that name the kind of table expected.
+    :param version: The version of the table's layout expected.
+    :param table_size: The number of bytes of the table expected.
+    :return: A pair of the goal state and a read-only view of the table, or None if
+        the file does not hold a table of that kind, version and size.
+    """
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapping) != HEADER.size + table_size:
+        return None
+    file_magic, file_version, *goal = HEADER.unpack_from(mapping, 0)
+    if file_magic != magic or file_version != version:
+        return None
+    goal_state = tuple(None if tile == 0 else tile for tile in goal)
+    return goal_state, memoryview(mapping)[HEADER.size:]
@@ -1,74 +1,68 @@
 # EightPuzzleTransitionModel: An encapsulation of the "movement rules" of the
 # classic eight-puzzle. Given a puzzle state and a move, produce the new puzzle
-# state.
+# state. The board width is configurable, so the same rules cover the 15-puzzle
+# (width 4) and the 24-puzzle (width 5).
+
+from functools import lru_cache
 
 
 class EightPuzzleTransitionException(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def move_targets(width):
+    """
+    For each direction, the index the blank tile moves to from each index of a board
+    of the given width, or None if it cannot move. Computed once per width.
+
+    :return: A tuple of the left, right, up and down targets.
+    """
+    cells = width * width
+    return (
+        tuple(index - 1 if index % width > 0 else None for index in range(cells)),
+        tuple(index + 1 if index % width < width - 1 else None for index in range(cells)),
+        tuple(index - width if index >= width else None for index in range(cells)),
+        tuple(index + width if index < cells - width else None for index in range(cells)),
+    )
+
+
 class EightPuzzleTransitionModel:
 
+    def __init__(self, width=3):
+        self.width = width
+        self.cells = width * width
+        self.left_targets, self.right_targets, self.up_targets, self.down_targets = move_targets(width)
+
     def can_move_left(self, puzzle_state):
-        return puzzle_state.index(None) in (1, 2, 4, 5, 7, 8)
+        return self.left_targets[puzzle_state.index(None)] is not None
 
     def can_move_right(self, puzzle_state):
-        return puzzle_state.index(None) in (0, 1, 3, 4, 6, 7)
+        return self.right_targets[puzzle_state.index(None)] is not None
 
     def can_move_up(self, puzzle_state):
-        return puzzle_state.index(None) in (3, 4, 5, 6, 7, 8)
+        return self.up_targets[puzzle_state.index(None)] is not None
 
     def can_move_down(self, puzzle_state):
-        return puzzle_state.index(None) in (0, 1, 2, 3, 4, 5)
+        return self.down_targets[puzzle_state.index(None)] is not None
 
     def move_left(self, puzzle_state):
-        if not self.can_move_left(puzzle_state):
-            raise EightPuzzleTransitionException(f"Cannot move left for state {puzzle_state}")
-        index_of_blank_tile = puzzle_state.index(None)
-        new_state = [None] * 9
-        for i in range(len(puzzle_state)):
-            if i == index_of_blank_tile:
-                new_state[i] = puzzle_state[i - 1]
-                new_state[i - 1] = None
-            else:
-                new_state[i] = puzzle_state[i]
-        return tuple(new_state)
+        return self.move_blank(puzzle_state, self.left_targets, "left")
 
     def move_right(self, puzzle_state):
-        if not self.can_move_right(puzzle_state):
-            raise EightPuzzleTransitionException(f"Cannot move right for state {puzzle_state}")
-        index_to_right_of_blank_tile = puzzle_state.index(None) + 1
-        new_state = [None] * 9
-        for i in range(len(puzzle_state)):
-            if i == index_to_right_of_blank_tile:
-                new_state[i] = None
-                new_state[i - 1] = puzzle_state[i]
-            else:
-                new_state[i] = puzzle_state[i]
-        return tuple(new_state)
+        return self.move_blank(puzzle_state, self.right_targets, "right")
 
     def move_up(self, puzzle_state):
-        if not self.can_move_up(puzzle_state):
-            raise EightPuzzleTransitionException(f"Cannot move up for state {puzzle_state}")
-        index_of_blank_tile = puzzle_state.index(None)
-        new_state = [None] * 9
-        for i in range(len(puzzle_state)):
-            if i == index_of_blank_tile:
-                new_state[i] = puzzle_state[i - 3]
-                new_state[i - 3] = None
-            else:
-                new_state[i] = puzzle_state[i]
-        return tuple(new_state)
+        return self.move_blank(puzzle_state, self.up_targets, "up")
 
     def move_down(self, puzzle_state):
-        if not self.can_move_down(puzzle_state):
-            raise EightPuzzleTransitionException(f"Cannot move down for state {puzzle_state}")
-        index_below_blank_tile = puzzle_state.index(None) + 3
-        new_state = [None] * 9
-        for i in range(len(puzzle_state)):
-            if i == index_below_blank_tile:
-                new_state[i] = None
-                new_state[i - 3] = puzzle_state[i]
-            else:
-                new_state[i] = puzzle_state[i]
+        return self.move_blank(puzzle_state, self.down_targets, "down")
+
+    def move_blank(self, puzzle_state, targets, direction):
+        blank = puzzle_state.index(None)
+        target = targets[blank] if len(puzzle_state) == self.cells else None
+        if target is None:
+            raise EightPuzzleTransitionException(f"Cannot move {direction} for state {puzzle_state}")
+        new_state = list(puzzle_state)
+        new_state[blank], new_state[target] = puzzle_state[target], None
         return tuple(new_state)
@@ -0,0 +1,129 @@
+# EightPuzzleReflexPolicy: A compiled table of optimal actions for the 3x3 puzzle,
+# for a model-based reflex agent that never searches. One breadth-first search
+# backward from the goal state reaches each of the 9!/2 = 181,440 states that can
+# reach the goal from a neighbor one move closer to it, and the move back to that
+# neighbor is an optimal action for the state. The action is stored in two bits
+# (left, right, up or down), four states to a byte, so the whole table takes 45,360
+# bytes.
+# States are indexed as in a distance oracle, by EightPuzzlePermutationRanker, and a
+# policy is saved and mapped in the format of eight_puzzle_table_file, so every agent
+# of every process that loads the same file shares one copy of the table. Both
+# modules live in the parent directory.
+
+import math
+import os
+import sys
+from collections import deque
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eight_puzzle_permutation_rank import EightPuzzlePermutationRanker
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_table_file import save_table, load_table
+from eight_puzzle_transition_model import move_targets
+
+MAGIC = b"EPRP"
+VERSION = 2  # Version 1 indexed states by their tiles rather than their goal positions
+WIDTH = 3
+CELLS = WIDTH * WIDTH
+TABLE_SIZE = CELLS * math.factorial(CELLS - 1) // 2 // 4  # Four two-bit actions per byte
+
+LEFT, RIGHT, UP, DOWN = range(4)
+# The index the blank tile moves to for each action, or None if it cannot move.
+TARGETS = move_targets(WIDTH)
+INVERSE = (RIGHT, LEFT, DOWN, UP)
+
+
+class EightPuzzleReflexPolicyException(Exception):
+    pass
+
+
+class EightPuzzleReflexPolicy:
+
+    def __init__(self, goal_state, table):
+        """
+        Initialize the policy from an already-compiled table. Use `compile` or `load`
+        to create one.
+
+        :param goal_state: The goal state the table was compiled for.
+        :param table: TABLE_SIZE bytes of two-bit actions, indexed by `index(state)`.
+        """
+        self.goal_state = tuple(goal_state)
+        self.table = table
+        self.ranker = EightPuzzlePermutationRanker(self.goal_state)
+
+    def index(self, state):
+        """
+        The index of a state within the table.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: An integer in range(4 * TABLE_SIZE).
+        """
+        return self.ranker.index(state)
+
+    def action(self, state):
+        """
+        An optimal action from a state that is not the goal state.
+
+        :param state: A state of the puzzle, as a tuple or list.
+        :return: LEFT, RIGHT, UP or DOWN, the direction the blank tile moves in.
+        """
+        if not EightPuzzleProblem(state, self.goal_state, None).is_solvable():
+            raise EightPuzzleReflexPolicyException(f"The goal state cannot be reached from {state}")
+        index = self.index(state)
+        return (self.table[index >> 2] >> ((index & 3) << 1)) & 3
+
+    @classmethod
+    def compile(cls, goal_state):
+        """
+        Compile the optimal action of every state that can reach the goal state, by
+        breadth-first search from it.
+
+        :param goal_state: The goal state of the puzzle.
+        :return: A new EightPuzzleReflexPolicy.
+        """
+        goal_state = tuple(goal_state)
+        if len(goal_state) != CELLS or sorted(goal_state, key=lambda tile: tile or 0) != [None, *range(1, CELLS)]:
+            raise EightPuzzleReflexPolicyException(f"{goal_state} is not a state of the 3x3 puzzle")
+        state_index = EightPuzzlePermutationRanker(goal_state).index
+        table = bytearray(TABLE_SIZE)
+        reached = {goal_state}
+        frontier = deque([(goal_state, goal_state.index(None))])
+        while frontier:
+            state, blank = frontier.popleft()
+            for direction, targets in enumerate(TARGETS):
+                target = targets[blank]
+                if target is None:
+                    continue
+                board = list(state)
+                board[blank], board[target] = board[target], None
+                child = tuple(board)
+                if child in reached:
+                    continue
+                reached.add(child)
+                # The child is one move farther from the goal; moving back is optimal
+                index = state_index(child)
+                table[index >> 2] |= INVERSE[direction] << ((index & 3) << 1)
+                frontier.append((child, target))
+        return cls(goal_state, table)
+
+    def save(self, path):
+        """
+        Write the goal state and table to a file that `load` can map.
+
+        :param path: The path of the file to write.
+        """
+        save_table(path, MAGIC, VERSION, self.goal_state, self.table)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Map a file written by `save` into memory, read-only.
+
+        :param path: The path of the file to load.
+        :return: A new EightPuzzleReflexPolicy.
+        """
+        loaded = load_table(path, MAGIC, VERSION, TABLE_SIZE)
+        if loaded is None:
+            raise EightPuzzleReflexPolicyException(f"{path} is not a reflex policy file")
+        return cls(*loaded)
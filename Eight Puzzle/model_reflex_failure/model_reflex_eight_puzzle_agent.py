@@ -1,16 +1,36 @@
-# ModelReflexEightPuzzleAgent: A basic, incomplete model-based reflex agent that
-# tries to produce actions for solving an eight-puzzle problem.
+# ModelReflexEightPuzzleAgent: A model-based reflex agent that produces actions for
+# solving an eight-puzzle problem.
 # See the tests in test_model_reflex_eight_puzzle_agent.py.
+# Each action is read from a compiled EightPuzzleReflexPolicy, a table of optimal
+# actions for every state, so the agent never searches: picking a move takes the
+# same few operations from any state. Agents without a policy share one compiled
+# for their goal state.
 # YOUR NAME
 
+from functools import lru_cache
+from eight_puzzle_reflex_policy import EightPuzzleReflexPolicy, EightPuzzleReflexPolicyException
+
+
+@lru_cache(maxsize=None)
+def compiled_policy(goal_state):
+    return EightPuzzleReflexPolicy.compile(goal_state)
+
 
 class ModelReflexEightPuzzleAgent:
 
-    def __init__(self, initial_state, goal_state, action_cost, transition_model):
+    def __init__(self, initial_state, goal_state, action_cost, transition_model, policy=None):
+        """
+        :param policy: An EightPuzzleReflexPolicy for the goal state, such as one mapped
+            with EightPuzzleReflexPolicy.load. Without one, a policy is compiled the
+            first time one is needed.
+        """
+        if policy is not None and policy.goal_state != tuple(goal_state):
+            raise EightPuzzleReflexPolicyException(f"The policy was not compiled for goal state {goal_state}")
         self.initial_state = initial_state
         self.goal_state = goal_state
         self.action_cost = action_cost
         self.transition_model = transition_model
+        self.policy = policy
         self.current_state = self.initial_state
         self.total_cost = 0
 
@@ -27,12 +47,23 @@ class ModelReflexEightPuzzleAgent:
         self.current_state = self.transition_model.move_left(self.current_state)
         self.total_cost += 1
 
+    def move_right(self):
+        self.current_state = self.transition_model.move_right(self.current_state)
+        self.total_cost += 1
+
     def move_up(self):
         self.current_state = self.transition_model.move_up(self.current_state)
         self.total_cost += 1
 
+    def move_down(self):
+        self.current_state = self.transition_model.move_down(self.current_state)
+        self.total_cost += 1
+
     def action(self):
         if self.current_state == self.goal_state:
             return self.noop
-        else:
-            return self.move_left
+        if self.policy is None:
+            self.policy = compiled_policy(tuple(self.goal_state))
+        # The policy's actions are LEFT, RIGHT, UP and DOWN, in this order
+        moves = (self.move_left, self.move_right, self.move_up, self.move_down)
+        return moves[self.policy.action(self.current_state)]
@@ -0,0 +1,145 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_reflex_policy
+
+import os
+import random
+import tempfile
+import unittest
+from collections import deque
+from eight_puzzle_reflex_policy import (EightPuzzleReflexPolicy, EightPuzzleReflexPolicyException, TABLE_SIZE,
+                                        TARGETS, LEFT, UP)
+from model_reflex_eight_puzzle_agent import ModelReflexEightPuzzleAgent
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class SwappingTransitionModel:
+    """
+    The movement rules of the eight-puzzle, for agents to follow the policy with.
+    """
+
+    def move(self, puzzle_state, direction):
+        blank = puzzle_state.index(None)
+        target = TARGETS[direction][blank]
+        board = list(puzzle_state)
+        board[blank], board[target] = board[target], None
+        return tuple(board)
+
+    def move_left(self, puzzle_state):
+        return self.move(puzzle_state, 0)
+
+    def move_right(self, puzzle_state):
+        return self.move(puzzle_state, 1)
+
+    def move_up(self, puzzle_state):
+        return self.move(puzzle_state, 2)
+
+    def move_down(self, puzzle_state):
+        return self.move(puzzle_state, 3)
+
+
+def distances_from(goal_state):
+    """
+    The number of moves from every state to the goal, by breadth-first search.
+    """
+    model = SwappingTransitionModel()
+    distances = {goal_state: 0}
+    frontier = deque([goal_state])
+    while frontier:
+        state = frontier.popleft()
+        blank = state.index(None)
+        for direction, targets in enumerate(TARGETS):
+            if targets[blank] is not None:
+                child = model.move(state, direction)
+                if child not in distances:
+                    distances[child] = distances[state] + 1
+                    frontier.append(child)
+    return distances
+
+
+class TestEightPuzzleReflexPolicy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.policy = EightPuzzleReflexPolicy.compile(GOAL_STATE)
+        cls.distances = distances_from(GOAL_STATE)
+
+    """
+    Compiling
+    """
+
+    def test_table_size(self):
+        """
+        Two bits per state that can reach the goal fit in 45,360 bytes.
+        """
+        self.assertEqual(45360, TABLE_SIZE)
+        self.assertEqual(TABLE_SIZE, len(self.policy.table))
+
+    def test_every_action_is_optimal(self):
+        """
+        From every state, the policy's action leads to a state one move closer to the goal.
+        """
+        model = SwappingTransitionModel()
+        for state, distance in self.distances.items():
+            if distance:
+                self.assertEqual(distance - 1, self.distances[model.move(state, self.policy.action(state))])
+
+    def test_unreachable_goal(self):
+        """
+        A state that cannot reach the goal has no action.
+        """
+        with self.assertRaises(EightPuzzleReflexPolicyException):
+            self.policy.action((None, 2, 1, 3, 4, 5, 6, 7, 8))
+        with self.assertRaises(EightPuzzleReflexPolicyException):
+            EightPuzzleReflexPolicy.compile((None, 1, 2, 3))
+
+    """
+    Loading
+    """
+
+    def test_save_and_load(self):
+        """
+        A saved policy is mapped with the same goal state and actions.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.policy")
+            self.policy.save(path)
+            loaded = EightPuzzleReflexPolicy.load(path)
+            self.assertEqual(GOAL_STATE, loaded.goal_state)
+            self.assertEqual(bytes(self.policy.table), bytes(loaded.table))
+            self.assertEqual(UP, loaded.action((3, 1, 2, None, 4, 5, 6, 7, 8)))
+            with open(path, "r+b") as file:
+                file.write(b"JUNK")
+            with self.assertRaises(EightPuzzleReflexPolicyException):
+                EightPuzzleReflexPolicy.load(path)
+
+    """
+    Agents
+    """
+
+    def test_agent_solves_optimally(self):
+        """
+        An agent following the policy reaches the goal in the fewest moves.
+        """
+        random.seed(21)
+        states = random.sample(sorted(self.distances, key=str), 20)
+        states.append((8, None, 6, 5, 4, 7, 2, 3, 1))
+        for state in states:
+            agent = ModelReflexEightPuzzleAgent(state, GOAL_STATE, 1, SwappingTransitionModel(), self.policy)
+            while not agent.in_goal_state():
+                agent.action()()
+            self.assertEqual(self.distances[state], agent.total_cost)
+
+    def test_agent_rejects_policy_for_another_goal(self):
+        """
+        An agent cannot follow a policy compiled for another goal state.
+        """
+        with self.assertRaises(EightPuzzleReflexPolicyException):
+            ModelReflexEightPuzzleAgent(None, (1, 2, 3, 4, 5, 6, 7, 8, None), 1, None, self.policy)
+        agent = ModelReflexEightPuzzleAgent((1, None, 2, 3, 4, 5, 6, 7, 8), GOAL_STATE, 1, None, self.policy)
+        self.assertEqual(agent.move_left, agent.action())
+        self.assertEqual(LEFT, self.policy.action(agent.current_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_batch_solver
+
+import itertools
+import random
+import unittest
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_batch_solver import EightPuzzleBatchSolver, encode_state, decode_state, encode_actions, decode_actions
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_budget import EightPuzzleSearchBudget
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def random_problems(count, seed):
+    generator = random.Random(seed)
+    transition_model = EightPuzzleTransitionModel()
+    problems = []
+    for _ in range(count):
+        state = GOAL_STATE
+        for _ in range(generator.randint(0, 30)):
+            problem = EightPuzzleProblem(state, GOAL_STATE, transition_model)
+            state = problem.result(state, generator.choice(problem.actions(state)))
+        problems.append(EightPuzzleProblem(state, GOAL_STATE, transition_model))
+    return problems
+
+
+class TestEightPuzzleBatchSolver(unittest.TestCase):
+
+    """
+    Compact encoding
+    """
+
+    def test_state_round_trip(self):
+        """
+        A state is sent as bytes with 0 for the blank tile.
+        """
+        state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+        self.assertEqual(9, len(encode_state(state)))
+        self.assertEqual(state, decode_state(encode_state(state)))
+
+    def test_actions_round_trip(self):
+        """
+        Actions are sent as one byte each.
+        """
+        actions = [EightPuzzleAgent.move_left, EightPuzzleAgent.move_down, EightPuzzleAgent.move_up, EightPuzzleAgent.move_right]
+        self.assertEqual(b"\x00\x03\x02\x01", encode_actions(actions))
+        self.assertEqual(actions, decode_actions(encode_actions(actions)))
+
+    """
+    solve_many
+    """
+
+    def test_matches_single_solver(self):
+        """
+        The batch solver's results match solving each problem on its own.
+        """
+        problems = random_problems(12, seed=5)
+        solver = EightPuzzleBestFirstSearchSolver()
+        batch_solver = EightPuzzleBatchSolver(workers=2, chunk_size=3)
+        results = dict(batch_solver.solve_many(problems))
+        self.assertEqual(set(range(len(problems))), set(results))
+        for index, problem in enumerate(problems):
+            self.assertEqual(EightPuzzleSearchResult.SOLVED, results[index].status)
+            self.assertEqual(len(solver.solution(problem)), len(results[index].actions))
+
+    def test_ordered(self):
+        """
+        With ordered=True, results come in the order of the problems.
+        """
+        problems = random_problems(10, seed=6)
+        batch_solver = EightPuzzleBatchSolver(workers=2, chunk_size=2)
+        indexes = [index for index, _ in batch_solver.solve_many(iter(problems), ordered=True)]
+        self.assertEqual(list(range(10)), indexes)
+
+    def test_ordered_results_wait_in_a_bounded_buffer(self):
+        """
+        While an early problem is slow, later results wait in a bounded buffer, and the
+        stream is not read further ahead.
+        """
+        consumed = []
+
+        def stream():
+            transition_model = EightPuzzleTransitionModel()
+            problem = EightPuzzleProblem((8, None, 6, 5, 4, 7, 2, 3, 1), GOAL_STATE, transition_model)
+            while True:
+                consumed.append(problem)
+                yield problem
+                problem = EightPuzzleProblem((1, None, 2, 3, 4, 5, 6, 7, 8), GOAL_STATE, transition_model)
+
+        batch_solver = EightPuzzleBatchSolver(workers=2, chunk_size=1,
+                                              algorithm=EightPuzzleBestFirstSearchSolver.RECURSIVE_BEST_FIRST)
+        results = batch_solver.solve_many(stream(), ordered=True)
+        index, result = next(results)
+        self.assertEqual(0, index)
+        self.assertEqual(31, len(result.actions))
+        # At most four results wait and four chunks are in flight
+        self.assertLessEqual(len(consumed), 8)
+        self.assertEqual([1, 2, 3], [index for index, _ in itertools.islice(results, 3)])
+        results.close()
+
+    def test_results_keep_their_suboptimality_bound(self):
+        """
+        The bound of a weighted search's solution survives the trip back from a worker.
+        """
+        problems = [EightPuzzleProblem((7, 2, 4, 5, None, 6, 8, 3, 1), GOAL_STATE, EightPuzzleTransitionModel()),
+                    EightPuzzleProblem((None, 2, 1, 3, 4, 5, 6, 7, 8), GOAL_STATE, EightPuzzleTransitionModel())]
+        batch_solver = EightPuzzleBatchSolver(workers=2, chunk_size=1, weight=3)
+        results = dict(batch_solver.solve_many(problems))
+        self.assertEqual(3, results[0].suboptimality_bound)
+        self.assertLessEqual(len(results[0].actions), 26 * 3)
+        self.assertIsNone(results[1].suboptimality_bound)
+
+    def test_single_worker_and_unsolvable_problem(self):
+        """
+        One worker solves in the calling process, and unsolvable problems are reported.
+        """
+        problems = [EightPuzzleProblem((None, 2, 1, 3, 4, 5, 6, 7, 8), GOAL_STATE, EightPuzzleTransitionModel())]
+        batch_solver = EightPuzzleBatchSolver(workers=1, algorithm=EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR)
+        [(index, result)] = batch_solver.solve_many(problems)
+        self.assertEqual(0, index)
+        self.assertEqual(EightPuzzleSearchResult.UNSOLVABLE, result.status)
+
+    def test_single_worker_solvers_are_separate(self):
+        """
+        Batch solvers that solve in the calling process each keep their own solver.
+        """
+        problem = EightPuzzleProblem((7, 2, 4, 5, None, 6, 8, 3, 1), GOAL_STATE, EightPuzzleTransitionModel())
+        weighted = EightPuzzleBatchSolver(workers=1, chunk_size=1, weight=3).solve_many([problem, problem])
+        self.assertEqual(3, next(weighted)[1].suboptimality_bound)
+        [(_, result)] = EightPuzzleBatchSolver(workers=1).solve_many([problem])
+        self.assertEqual(1, result.suboptimality_bound)
+        self.assertEqual(3, next(weighted)[1].suboptimality_bound)
+
+    def test_memory_bounded_search_out_of_room(self):
+        """
+        A problem with no solution in SMA*'s memory is reported without ending the stream.
+        """
+        transition_model = EightPuzzleTransitionModel()
+        problems = [EightPuzzleProblem((1, 2, 3, None, 4, 5, 6, 7, 8), GOAL_STATE, transition_model),
+                    EightPuzzleProblem((1, None, 2, 3, 4, 5, 6, 7, 8), GOAL_STATE, transition_model)]
+        batch_solver = EightPuzzleBatchSolver(workers=1, chunk_size=1,
+                                              algorithm=EightPuzzleBestFirstSearchSolver.SIMPLIFIED_MEMORY_BOUNDED_A_STAR,
+                                              max_stored_nodes=10)
+        results = dict(batch_solver.solve_many(problems))
+        self.assertEqual(EightPuzzleSearchResult.BUDGET_EXCEEDED, results[0].status)
+        self.assertEqual(EightPuzzleSearchBudget.MAX_STORED_NODES, results[0].exceeded_budget)
+        self.assertEqual([EightPuzzleAgent.move_left], results[1].actions)
+
+    def test_rejects_bad_solver_options(self):
+        """
+        Solver options are checked when the batch solver is made.
+        """
+        with self.assertRaises(EightPuzzleSolverException):
+            EightPuzzleBatchSolver(workers=2, algorithm="depth_first")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,16 @@
 
 import unittest
 import time
-from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from concurrent.futures import ThreadPoolExecutor
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
 from eight_puzzle_agent import EightPuzzleAgent
 from eight_puzzle_transition_model import EightPuzzleTransitionModel
 from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_budget import EightPuzzleCancellationToken, EightPuzzleSearchBudget
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_heuristics import EightPuzzleManhattanHeuristic
+from eight_puzzle_packed_problem import EightPuzzlePackedProblem
 
 
 class TestEightPuzzleBestFirstSearchSolver(unittest.TestCase):
@@ -88,6 +94,443 @@ class TestEightPuzzleBestFirstSearchSolver(unittest.TestCase):
           expected = [EightPuzzleAgent.move_up, EightPuzzleAgent.move_up]
           self.assertEqual(expected, solver.solution(problem))
 
+    """
+    Iterative-deepening A*
+    """
+
+    def test_unknown_algorithm(self):
+        """
+        An EightPuzzleBestFirstSearchSolver rejects an unknown search algorithm.
+        """
+        with self.assertRaises(EightPuzzleSolverException):
+            EightPuzzleBestFirstSearchSolver("depth_first")
+
+    def test_ida_star_initial_state_goal_state(self):
+          """
+          The IDA* solution for (None, 1, 2, 3, 4, 5, 6, 7, 8) is an empty list of actions.
+          """
+          initial_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR)
+          self.assertEqual([], solver.solution(problem))
+
+    def test_ida_star_1_2_None_3_4_5_6_7_8(self):
+          """
+          The IDA* solution for (1, 2, None, 3, 4, 5, 6, 7, 8) is [move_left, move_left].
+          """
+          initial_state = (1, 2, None, 3, 4, 5, 6, 7, 8)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR)
+          expected = [EightPuzzleAgent.move_left, EightPuzzleAgent.move_left]
+          self.assertEqual(expected, solver.solution(problem))
+
+    def test_ida_star_matches_a_star(self):
+          """
+          IDA* finds a solution as short as A* that reaches the goal state.
+          """
+          initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          transition_model = EightPuzzleTransitionModel()
+          problem = EightPuzzleProblem(initial_state, goal_state, transition_model)
+          a_star = EightPuzzleBestFirstSearchSolver().solution(problem)
+          ida_star = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR).solution(problem)
+          self.assertEqual(len(a_star), len(ida_star))
+          state = initial_state
+          for action in ida_star:
+              state = problem.result(state, action)
+          self.assertEqual(goal_state, state)
+
+    """
+    Packed states
+    """
+
+    def test_packed_matches_tuple_solution(self):
+          """
+          Searching over packed states produces a solution as short as searching over
+          tuples, that reaches the goal state.
+          """
+          initial_state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          expected = EightPuzzleBestFirstSearchSolver().solution(problem)
+          actions = EightPuzzleBestFirstSearchSolver(packed=True).solution(problem)
+          self.assertEqual(len(expected), len(actions))
+          state = initial_state
+          for action in actions:
+              state = problem.result(state, action)
+          self.assertEqual(goal_state, state)
+
+    def test_compact_nodes_match_tuple_solution(self):
+          """
+          Searching with a node pool produces a solution as short as searching with
+          node objects, for boards that fit in 64 bits and boards that do not.
+          """
+          examples = [
+              ((8, None, 6, 5, 4, 7, 2, 3, 1), (None, 1, 2, 3, 4, 5, 6, 7, 8), 3),
+              ((1, 5, 2, 3, 4, 9, 7, 11, 8, None, 6, 15, 12, 10, 13, 14),
+               (None, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), 4),
+          ]
+          for initial_state, goal_state, width in examples:
+              problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel(width))
+              expected = EightPuzzleBestFirstSearchSolver().solution(problem)
+              actions = EightPuzzleBestFirstSearchSolver(compact_nodes=True).solution(problem)
+              self.assertEqual(len(expected), len(actions))
+              state = initial_state
+              for action in actions:
+                  state = problem.result(state, action)
+              self.assertEqual(goal_state, state)
+
+    """
+    Weighted and anytime search
+    """
+
+    def test_weighted_a_star_is_bounded(self):
+          """
+          Weighted A* finds a solution at most `weight` times longer than optimal and
+          reports the weight as its bound.
+          """
+          initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          for algorithm in (EightPuzzleBestFirstSearchSolver.A_STAR, EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR):
+              for weight in (1, 1.5, 3):
+                  result = EightPuzzleBestFirstSearchSolver(algorithm, weight=weight).solve(problem)
+                  self.assertTrue(result.solved)
+                  self.assertEqual(weight, result.suboptimality_bound)
+                  self.assertLessEqual(len(result.actions), 31 * weight)
+
+    def test_anytime_search_improves_to_optimal(self):
+          """
+          ARA* yields solutions that never get longer and bounds that never grow, and
+          ends with an optimal solution and a bound of 1.
+          """
+          initial_state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ANYTIME_REPAIRING_A_STAR, weight=5)
+          solutions = list(solver.anytime_search(problem))
+          lengths = [len(actions) for actions, _ in solutions]
+          bounds = [bound for _, bound in solutions]
+          self.assertEqual(sorted(lengths, reverse=True), lengths)
+          self.assertEqual(sorted(bounds, reverse=True), bounds)
+          self.assertGreater(lengths[0], 26)
+          self.assertEqual((26, 1), (lengths[-1], bounds[-1]))
+          for length, bound in zip(lengths, bounds):
+              self.assertLessEqual(length, 26 * bound)
+
+    def test_anytime_search_stops_at_budget(self):
+          """
+          With a node budget, ARA* returns its first solution and reports its bound.
+          """
+          initial_state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ANYTIME_REPAIRING_A_STAR,
+                                                    weight=5, node_budget=1)
+          result = solver.solve(problem)
+          self.assertTrue(result.solved)
+          self.assertGreater(result.suboptimality_bound, 1)
+          self.assertLessEqual(len(result.actions), 26 * result.suboptimality_bound)
+
+    def test_one_solver_on_many_threads(self):
+          """
+          Searches on several threads that share one solver do not disturb each other.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          transition_model = EightPuzzleTransitionModel()
+          instances = [((7, 2, 4, 5, None, 6, 8, 3, 1), 26), ((1, None, 2, 3, 4, 5, 6, 7, 8), 1),
+                       ((8, 6, 7, 2, 5, 4, 3, None, 1), 27), ((1, 2, 3, None, 4, 5, 6, 7, 8), 13)] * 3
+          for algorithm in (EightPuzzleBestFirstSearchSolver.A_STAR, EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR):
+              solver = EightPuzzleBestFirstSearchSolver(algorithm)
+              problems = [EightPuzzleProblem(state, goal_state, transition_model) for state, _ in instances]
+              with ThreadPoolExecutor(max_workers=4) as executor:
+                  results = list(executor.map(solver.solve, problems))
+              self.assertEqual([length for _, length in instances], [len(result.actions) for result in results])
+              self.assertEqual([1] * len(instances), [result.suboptimality_bound for result in results])
+
+    def test_rejects_invalid_weights(self):
+          """
+          A weight below 1, or a fractional weight for integer frontiers, is rejected.
+          """
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(weight=0.5)
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(weight=1.5, frontier=EightPuzzleBestFirstSearchSolver.BUCKET_FRONTIER)
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(weight=1.5, compact_nodes=True)
+
+    def test_bidirectional_searches_find_optimal_solutions(self):
+          """
+          Bidirectional breadth-first search and MM stitch optimal solutions that reach the goal.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          transition_model = EightPuzzleTransitionModel()
+          for algorithm in (EightPuzzleBestFirstSearchSolver.BIDIRECTIONAL_BREADTH_FIRST,
+                            EightPuzzleBestFirstSearchSolver.MEET_IN_THE_MIDDLE):
+              solver = EightPuzzleBestFirstSearchSolver(algorithm)
+              for initial_state, length in (((8, None, 6, 5, 4, 7, 2, 3, 1), 31),
+                                            ((7, 2, 4, 5, None, 6, 8, 3, 1), 26),
+                                            ((1, None, 2, 3, 4, 5, 6, 7, 8), 1),
+                                            (goal_state, 0)):
+                  problem = EightPuzzleProblem(initial_state, goal_state, transition_model)
+                  actions = solver.solution(problem)
+                  self.assertEqual(length, len(actions))
+                  state = initial_state
+                  for action in actions:
+                      state = problem.result(state, action)
+                  self.assertEqual(goal_state, state)
+
+    def test_bidirectional_search_of_unsolvable_problem(self):
+          """
+          A bidirectional search of an unsolvable problem finds no solution.
+          """
+          initial_state = (None, 1, 2, 3, 4, 5, 6, 8, 7)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.MEET_IN_THE_MIDDLE)
+          self.assertEqual([], solver.search(problem))
+
+    """
+    Unsolvable problems
+    """
+
+    def test_unsolvable_problem(self):
+          """
+          An unsolvable problem returns immediately with an unsolvable result and no actions.
+          """
+          initial_state = (None, 2, 1, 3, 4, 5, 6, 7, 8)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+              result = EightPuzzleBestFirstSearchSolver(algorithm).solve(problem)
+              self.assertEqual(EightPuzzleSearchResult.UNSOLVABLE, result.status)
+              self.assertFalse(result.solved)
+              self.assertEqual([], result.actions)
+
+    def test_solved_result(self):
+          """
+          A solved problem has a solved result holding the solution.
+          """
+          initial_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, initial_state, EightPuzzleTransitionModel())
+          result = EightPuzzleBestFirstSearchSolver().solve(problem)
+          self.assertEqual(EightPuzzleSearchResult.SOLVED, result.status)
+          self.assertEqual([], result.actions)
+
+    """
+    Expansion
+    """
+
+    def test_expand_skips_the_undo_move(self):
+          """
+          Expanding a child never generates its parent again, for tuple and packed states.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          initial_state = (1, 2, 5, 3, 4, None, 6, 7, 8)
+          solver = EightPuzzleBestFirstSearchSolver()
+          for problem in (EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel()),
+                          EightPuzzlePackedProblem(initial_state, goal_state)):
+              root = solver.root_node(problem)
+              children = solver.expand(root, problem)
+              self.assertEqual(3, len(children))
+              for child in children:
+                  grandchildren = solver.expand(child, problem)
+                  self.assertNotIn(root.state, [grandchild.state for grandchild in grandchildren])
+                  self.assertEqual(len(problem.actions(child.state)) - 1, len(grandchildren))
+
+    def test_expand_updates_evaluations(self):
+          """
+          Children with kept evaluations hold the estimate of their own state.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem((1, 4, 2, 3, None, 5, 6, 7, 8), goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver()
+          evaluator = solver.incremental_evaluator(problem)
+          children = solver.expand(solver.root_node(problem, evaluator), problem, evaluator)
+          estimates = [evaluator.estimate(child.evaluation) for child in children]
+          self.assertEqual(4, len(children))
+          self.assertEqual(estimates, [solver.heuristic(child.state, problem) for child in children])
+
+    def test_iterative_deepening_orders_children_by_estimate(self):
+          """
+          IDA* searches the children of each node lowest estimate first.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem((7, 2, 4, 5, None, 6, 8, 3, 1), goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR)
+          expanded = []
+          statistics = EightPuzzleSearchStatistics(on_expand=[expanded.append])
+          self.assertEqual(26, len(solver.solve(problem, statistics).actions))
+          # The children of a node expanded at depth d are the nodes expanded at depth d + 1
+          # until the search comes back to depth d or above
+          for position, parent in enumerate(expanded):
+              estimates = []
+              for node in expanded[position + 1:]:
+                  if node.path_cost <= parent.path_cost:
+                      break
+                  if node.path_cost == parent.path_cost + 1:
+                      estimates.append(solver.heuristic(node.state, problem))
+              self.assertEqual(sorted(estimates), estimates)
+
+    """
+    Ranked closed set
+    """
+
+    def test_ranked_closed_set(self):
+          """
+          A* with a ranked closed set finds solutions as long as with a set of tuples.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          solver = EightPuzzleBestFirstSearchSolver(ranked_closed_set=True)
+          for initial_state, length in (((8, None, 6, 5, 4, 7, 2, 3, 1), 31), ((1, 2, None, 3, 4, 5, 6, 7, 8), 2)):
+              problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+              self.assertEqual(length, len(solver.solution(problem)))
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR,
+                                               ranked_closed_set=True)
+
+    """
+    Budgets
+    """
+
+    def test_node_budget(self):
+          """
+          Every algorithm stops after max_nodes expansions with the path to the closest state it found.
+          """
+          initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          heuristic = EightPuzzleManhattanHeuristic(goal_state).heuristic
+          solvers = [EightPuzzleBestFirstSearchSolver(algorithm) for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS]
+          solvers += [EightPuzzleBestFirstSearchSolver(packed=True), EightPuzzleBestFirstSearchSolver(compact_nodes=True)]
+          for solver in solvers:
+              result = solver.solve(problem, max_nodes=200)
+              self.assertEqual(EightPuzzleSearchResult.BUDGET_EXCEEDED, result.status)
+              self.assertEqual(EightPuzzleSearchBudget.MAX_NODES, result.exceeded_budget)
+              self.assertFalse(result.solved)
+              self.assertIsNone(result.suboptimality_bound)
+              state = initial_state
+              for action in result.actions:
+                  state = problem.result(state, action)
+              self.assertLess(heuristic(state), heuristic(initial_state))
+
+    def test_deadline_and_cancellation(self):
+          """
+          A search past its deadline, or with a cancelled token, stops at once.
+          """
+          initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver()
+          result = solver.solve(problem, deadline=time.monotonic())
+          self.assertEqual(EightPuzzleSearchBudget.DEADLINE, result.exceeded_budget)
+          token = EightPuzzleCancellationToken()
+          token.cancel()
+          result = solver.solve(problem, cancellation_token=token)
+          self.assertEqual(EightPuzzleSearchBudget.CANCELLED, result.exceeded_budget)
+          self.assertEqual([], result.actions)
+
+    def test_sufficient_budget(self):
+          """
+          A search that finishes within its budget returns its solution.
+          """
+          initial_state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          result = EightPuzzleBestFirstSearchSolver().solve(problem, deadline=time.monotonic() + 60, max_nodes=10 ** 6,
+                                                            cancellation_token=EightPuzzleCancellationToken())
+          self.assertEqual(EightPuzzleSearchResult.SOLVED, result.status)
+          self.assertEqual(26, len(result.actions))
+
+    def test_anytime_search_keeps_its_solution(self):
+          """
+          ARA* stopped by its budget after finding a solution returns that solution and its bound.
+          """
+          initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.ANYTIME_REPAIRING_A_STAR, weight=5)
+          result = solver.solve(problem, max_nodes=300)
+          self.assertEqual(EightPuzzleSearchResult.SOLVED, result.status)
+          self.assertGreater(result.suboptimality_bound, 1)
+          self.assertLessEqual(len(result.actions), 31 * result.suboptimality_bound)
+
+    """
+    Memory-bounded search
+    """
+
+    def test_memory_bounded_searches_are_optimal(self):
+          """
+          RBFS, and SMA* within a small memory, find optimal solutions and count their re-expansions
+          and the nodes they hold.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          for initial_state, length in (((7, 2, 4, 5, None, 6, 8, 3, 1), 26), ((8, 6, 7, 2, 5, 4, 3, None, 1), 27)):
+              problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+              solvers = [EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.RECURSIVE_BEST_FIRST),
+                         EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.SIMPLIFIED_MEMORY_BOUNDED_A_STAR,
+                                                          max_stored_nodes=200)]
+              for solver in solvers:
+                  statistics = EightPuzzleSearchStatistics()
+                  actions = solver.solve(problem, statistics).actions
+                  self.assertEqual(length, len(actions))
+                  state = initial_state
+                  for action in actions:
+                      state = problem.result(state, action)
+                  self.assertEqual(goal_state, state)
+                  self.assertGreater(statistics.nodes_reexpanded, 0)
+                  self.assertLessEqual(statistics.peak_explored_size, 200)
+                  if solver.algorithm == EightPuzzleBestFirstSearchSolver.RECURSIVE_BEST_FIRST:
+                      # RBFS holds the siblings of every node on its path, at most three per move
+                      self.assertGreater(statistics.peak_explored_size, length)
+                      self.assertLessEqual(statistics.peak_explored_size, 2 + 3 * length)
+              self.assertGreater(statistics.nodes_forgotten, 0)
+
+    def test_memory_bounded_search_needs_room(self):
+          """
+          SMA* stops with a budget result when no solution fits in its memory, and only SMA*
+          takes a node count.
+          """
+          initial_state = (1, 2, 3, None, 4, 5, 6, 7, 8)
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+          problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.SIMPLIFIED_MEMORY_BOUNDED_A_STAR,
+                                                    max_stored_nodes=14)
+          self.assertEqual(13, len(solver.solution(problem)))
+          solver = EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.SIMPLIFIED_MEMORY_BOUNDED_A_STAR,
+                                                    max_stored_nodes=10)
+          result = solver.solve(problem)
+          self.assertEqual(EightPuzzleSearchResult.BUDGET_EXCEEDED, result.status)
+          self.assertEqual(EightPuzzleSearchBudget.MAX_STORED_NODES, result.exceeded_budget)
+          self.assertEqual([], solver.solution(problem))
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(max_stored_nodes=1000)
+          with self.assertRaises(EightPuzzleSolverException):
+              EightPuzzleBestFirstSearchSolver(EightPuzzleBestFirstSearchSolver.SIMPLIFIED_MEMORY_BOUNDED_A_STAR,
+                                               max_stored_nodes=1)
+
+    """
+    Larger puzzles
+    """
+
+    def test_fifteen_puzzle(self):
+          """
+          A* and IDA* solve a 4x4 puzzle with the same number of actions.
+          """
+          goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
+          initial_state = (1, 5, 2, 3, 4, 9, 7, 11, 8, None, 6, 15, 12, 10, 13, 14)
+          transition_model = EightPuzzleTransitionModel(4)
+          problem = EightPuzzleProblem(initial_state, goal_state, transition_model)
+          for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+              actions = EightPuzzleBestFirstSearchSolver(algorithm).solution(problem)
+              self.assertEqual(11, len(actions))
+              state = initial_state
+              for action in actions:
+                  state = problem.result(state, action)
+              self.assertEqual(goal_state, state)
+
 
 def fake_value():
     return f"FAKE {time.time()}"
@@ -0,0 +1,152 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_distance_oracle
+
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_distance_oracle import (EightPuzzleDistanceOracle, EightPuzzleDistanceOracleException,
+                                          TABLE_SIZE, UNREACHABLE)
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzleDistanceOracle(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+
+    """
+    Building
+    """
+
+    def test_labels_every_reachable_state(self):
+        """
+        All 9!/2 states that can reach the goal are labeled, and the farthest is 31 moves away.
+        """
+        distances = Counter(self.oracle.table)
+        self.assertEqual(TABLE_SIZE, 181440)
+        self.assertNotIn(UNREACHABLE, distances)
+        self.assertEqual(31, max(distances))
+        self.assertEqual(1, distances[0])
+
+    def test_index_is_perfect(self):
+        """
+        Distinct states that can reach the goal have distinct indexes.
+        """
+        state = GOAL_STATE
+        self.assertNotEqual(self.oracle.index(state), self.oracle.index((1, None, 2, 3, 4, 5, 6, 7, 8)))
+        self.assertEqual(0, self.oracle.table[self.oracle.index(state)])
+
+    def test_states_at_distance(self):
+        """
+        The states listed at a distance are exactly those the oracle puts there.
+        """
+        hardest = list(self.oracle.states_at_distance(31))
+        self.assertEqual(2, len(hardest))
+        for state in hardest + list(self.oracle.states_at_distance(5)):
+            self.assertEqual(sorted(state, key=lambda tile: tile or 0), list(GOAL_STATE))
+        self.assertEqual([31, 31], [self.oracle.distance(state) for state in hardest])
+        self.assertEqual([GOAL_STATE], list(self.oracle.states_at_distance(0)))
+
+    """
+    distance and solution
+    """
+
+    def test_unreachable_state(self):
+        """
+        A state with the wrong parity has no distance and no solution.
+        """
+        state = (None, 2, 1, 3, 4, 5, 6, 7, 8)
+        self.assertIsNone(self.oracle.distance(state))
+        problem = EightPuzzleProblem(state, GOAL_STATE, EightPuzzleTransitionModel())
+        self.assertIsNone(self.oracle.solution(problem))
+
+    def test_matches_a_star(self):
+        """
+        The oracle's distances and solutions match the length of A* solutions.
+        """
+        transition_model = EightPuzzleTransitionModel()
+        generator = random.Random(3)
+        for _ in range(10):
+            state = GOAL_STATE
+            for _ in range(generator.randint(5, 40)):
+                problem = EightPuzzleProblem(state, GOAL_STATE, transition_model)
+                state = problem.result(state, generator.choice(problem.actions(state)))
+            problem = EightPuzzleProblem(state, GOAL_STATE, transition_model)
+            expected = len(EightPuzzleBestFirstSearchSolver().solution(problem))
+            self.assertEqual(expected, self.oracle.distance(state))
+            actions = self.oracle.solution(problem)
+            self.assertEqual(expected, len(actions))
+            for action in actions:
+                state = problem.result(state, action)
+            self.assertEqual(GOAL_STATE, state)
+
+    def test_rejects_other_goal_state(self):
+        """
+        The oracle cannot solve a problem with a different goal state.
+        """
+        problem = EightPuzzleProblem(GOAL_STATE, (1, 2, 3, 4, 5, 6, 7, 8, None), EightPuzzleTransitionModel())
+        with self.assertRaises(EightPuzzleDistanceOracleException):
+            self.oracle.solution(problem)
+
+    """
+    Solver
+    """
+
+    def test_solver_uses_oracle(self):
+        """
+        A solver with an oracle file produces an optimal solution.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.oracle")
+            self.oracle.save(path)
+            solver = EightPuzzleBestFirstSearchSolver(distance_oracle_path=path)
+            self.assertIsNotNone(solver.distance_oracle)
+            problem = EightPuzzleProblem((8, None, 6, 5, 4, 7, 2, 3, 1), GOAL_STATE, EightPuzzleTransitionModel())
+            self.assertEqual(31, len(solver.solution(problem)))
+
+    def test_solver_falls_back_to_search(self):
+        """
+        Without an oracle file, the solver searches, or raises if asked not to fall back.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "missing.oracle")
+            solver = EightPuzzleBestFirstSearchSolver(distance_oracle_path=path)
+            problem = EightPuzzleProblem((1, 2, None, 3, 4, 5, 6, 7, 8), GOAL_STATE, EightPuzzleTransitionModel())
+            self.assertEqual(2, len(solver.solution(problem)))
+            with self.assertRaises(EightPuzzleSolverException):
+                EightPuzzleBestFirstSearchSolver(distance_oracle_path=path, fall_back_to_search=False)
+
+    def test_load_or_build(self):
+        """
+        load_or_build maps a saved oracle with the same distances.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.oracle")
+            self.oracle.save(path)
+            loaded = EightPuzzleDistanceOracle.load_or_build(path, GOAL_STATE)
+            self.assertEqual(bytes(self.oracle.table), bytes(loaded.table))
+
+    def test_load_or_build_replaces_other_files(self):
+        """
+        load_or_build rebuilds a file that is not an oracle of the current version.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.oracle")
+            with open(path, "wb") as file:
+                file.write(b"EPDO\x01" + bytes(9 + TABLE_SIZE))
+            with self.assertRaises(EightPuzzleDistanceOracleException):
+                EightPuzzleDistanceOracle.load(path)
+            loaded = EightPuzzleDistanceOracle.load_or_build(path, GOAL_STATE)
+            self.assertEqual(bytes(self.oracle.table), bytes(loaded.table))
+            self.assertEqual(GOAL_STATE, EightPuzzleDistanceOracle.load(path).goal_state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_external_search
+
+import os
+import random
+import tempfile
+import unittest
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_external_search import (EightPuzzleExternalBreadthFirstSearch,
+                                          EightPuzzleExternalBreadthFirstSearchException)
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzleExternalBreadthFirstSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        # A small buffer spills many runs per layer, so the merges are exercised
+        cls.search = EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, cls.directory.name, buffer_size=5000)
+        cls.layer_sizes = cls.search.run()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    """
+    Layers
+    """
+
+    def test_layers_cover_reachable_states(self):
+        """
+        The layers hold all 9!/2 states that can reach the goal, and the farthest two are 31 moves away.
+        """
+        self.assertEqual(181440, sum(self.layer_sizes))
+        self.assertEqual(32, len(self.layer_sizes))
+        self.assertEqual(2, self.layer_sizes[31])
+        self.assertTrue(self.search.complete)
+
+    def test_layers_are_sorted_and_disjoint(self):
+        """
+        Each layer file is strictly ascending, and no state appears in two layers.
+        """
+        seen = set()
+        for depth in range(len(self.layer_sizes)):
+            states = list(self.search.layer(depth))
+            self.assertEqual(states, sorted(set(states)))
+            self.assertTrue(seen.isdisjoint(states))
+            seen.update(states)
+
+    def test_distances_match_oracle(self):
+        """
+        The distance of a state is its layer, as labeled by the in-memory oracle.
+        """
+        oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+        random.seed(17)
+        for _ in range(50):
+            tiles = [None, 1, 2, 3, 4, 5, 6, 7, 8]
+            random.shuffle(tiles)
+            self.assertEqual(oracle.distance(tiles), self.search.distance(tiles))
+
+    def test_no_partial_files_left(self):
+        """
+        Only the layers and the manifest remain once the search is complete.
+        """
+        names = os.listdir(self.directory.name)
+        self.assertEqual(33, len(names))
+        self.assertFalse(any(name.endswith(".tmp") for name in names))
+
+    """
+    Resuming
+    """
+
+    def test_resume_after_interruption(self):
+        """
+        A search stopped part way continues from its manifest, discarding partial files, to the same layers.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory).run(max_depth=12)
+            # Leftovers of a crash while building layer 13
+            for name in ("run_0013_000000.tmp", "layer_0013.bin.tmp", "layer_0013.bin"):
+                with open(os.path.join(directory, name), "wb") as file:
+                    file.write(b"\xff" * 10)
+            search = EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory)
+            self.assertEqual(self.layer_sizes[:13], search.layer_sizes)
+            self.assertEqual(self.layer_sizes, search.run())
+
+    def test_manifest_of_another_search(self):
+        """
+        A directory holding the layers of another goal state is not reused.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory).run(max_depth=2)
+            with self.assertRaises(EightPuzzleExternalBreadthFirstSearchException):
+                EightPuzzleExternalBreadthFirstSearch((1, 2, 3, 4, 5, 6, 7, 8, None), directory)
+
+    """
+    Patterns
+    """
+
+    def test_pattern_space(self):
+        """
+        With a pattern of three tiles, the abstract space has 9 * 8 * 7 * 6 states.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            search = EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory, pattern=(1, 2, 3))
+            self.assertEqual(3024, sum(search.run()))
+            self.assertEqual(0, search.distance((None, 1, 2, 3, 8, 7, 6, 5, 4)))
+
+    def test_invalid_arguments(self):
+        """
+        Invalid goal states, patterns and buffer sizes are rejected.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(EightPuzzleExternalBreadthFirstSearchException):
+                EightPuzzleExternalBreadthFirstSearch((1, 2, 3), directory)
+            with self.assertRaises(EightPuzzleExternalBreadthFirstSearchException):
+                EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory, pattern=(9,))
+            with self.assertRaises(EightPuzzleExternalBreadthFirstSearchException):
+                EightPuzzleExternalBreadthFirstSearch(GOAL_STATE, directory, buffer_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
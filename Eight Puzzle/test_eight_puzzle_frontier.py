@@ -0,0 +1,102 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_frontier
+
+import math
+import unittest
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_frontier import EightPuzzleHeapFrontier, EightPuzzleBucketFrontier, EightPuzzleFrontierException
+from eight_puzzle_node import EightPuzzleNode
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+FRONTIERS = (EightPuzzleHeapFrontier, EightPuzzleBucketFrontier)
+
+
+class TestEightPuzzleFrontier(unittest.TestCase):
+
+    """
+    Ordering
+    """
+
+    def test_pops_lowest_cost_first(self):
+        """
+        A frontier pops nodes in order of cost.
+        """
+        for frontier_class in FRONTIERS:
+            frontier = frontier_class()
+            for state, cost in (("a", 5), ("b", 2), ("c", 9), ("d", 2)):
+                frontier.add(EightPuzzleNode(state, None, None, 0), cost)
+            costs = {"a": 5, "b": 2, "c": 9, "d": 2}
+            popped = [frontier.pop().state for _ in range(4)]
+            self.assertEqual(sorted(costs.values()), [costs[state] for state in popped])
+            self.assertEqual(0, len(frontier))
+
+    def test_prefers_deeper_nodes_on_ties(self):
+        """
+        Among nodes of equal cost, the heap frontier pops the deeper node first.
+        """
+        frontier = EightPuzzleHeapFrontier()
+        frontier.add(EightPuzzleNode("shallow", None, None, 1), 10)
+        frontier.add(EightPuzzleNode("deep", None, None, 7), 10)
+        self.assertEqual("deep", frontier.pop().state)
+
+    def test_pop_empty(self):
+        """
+        Popping an empty frontier raises an exception.
+        """
+        for frontier_class in FRONTIERS:
+            with self.assertRaises(EightPuzzleFrontierException):
+                frontier_class().pop()
+
+    """
+    Duplicates
+    """
+
+    def test_cheaper_node_replaces_state(self):
+        """
+        Adding a cheaper node for a state replaces the old node, which is never popped.
+        """
+        for frontier_class in FRONTIERS:
+            frontier = frontier_class()
+            expensive = EightPuzzleNode("a", None, None, 8)
+            cheap = EightPuzzleNode("a", None, None, 3)
+            frontier.add(expensive, 10)
+            self.assertEqual(8, frontier.best_path_cost("a"))
+            frontier.add(cheap, 5)
+            self.assertEqual(3, frontier.best_path_cost("a"))
+            self.assertEqual(1, len(frontier))
+            self.assertIs(cheap, frontier.pop())
+            self.assertEqual(0, len(frontier))
+            self.assertEqual(math.inf, frontier.best_path_cost("a"))
+
+    def test_bucket_rejects_fractional_cost(self):
+        """
+        A bucket frontier only holds integer costs.
+        """
+        with self.assertRaises(EightPuzzleFrontierException):
+            EightPuzzleBucketFrontier().add(EightPuzzleNode("a", None, None, 0), 2.5)
+
+    """
+    Solver
+    """
+
+    def test_solver_frontiers_find_optimal_solutions(self):
+        """
+        A* finds an optimal solution with either frontier.
+        """
+        goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+        problem = EightPuzzleProblem((8, 6, 7, 2, 5, 4, 3, None, 1), goal_state, EightPuzzleTransitionModel())
+        for frontier in EightPuzzleBestFirstSearchSolver.FRONTIERS:
+            solver = EightPuzzleBestFirstSearchSolver(frontier=frontier)
+            self.assertEqual(27, len(solver.solution(problem)))
+
+    def test_solver_rejects_unknown_frontier(self):
+        """
+        The solver rejects an unknown frontier.
+        """
+        with self.assertRaises(EightPuzzleSolverException):
+            EightPuzzleBestFirstSearchSolver(frontier="stack")
+
+
+if __name__ == '__main__':
+    unittest.main()
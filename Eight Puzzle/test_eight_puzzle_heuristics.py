@@ -0,0 +1,166 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_heuristics
+
+import random
+import unittest
+from functools import lru_cache
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_heuristics import (EightPuzzleManhattanHeuristic, EightPuzzleLinearConflictHeuristic,
+                                     EightPuzzleWalkingDistanceHeuristic, EightPuzzleMaxHeuristic,
+                                     EightPuzzlePackedManhattanHeuristic, EightPuzzleHeuristicException,
+                                     walking_distance_table)
+from eight_puzzle_packed_problem import EightPuzzlePackedProblem
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase
+from eight_puzzle_problem import EightPuzzleProblem, action_targets
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+OTHER_GOAL_STATE = (3, 8, None, 1, 4, 6, 2, 7, 5)
+
+
+def evaluators(goal_state):
+    return [
+        EightPuzzleManhattanHeuristic(goal_state),
+        EightPuzzleLinearConflictHeuristic(goal_state),
+        EightPuzzleWalkingDistanceHeuristic(goal_state),
+        EightPuzzleMaxHeuristic([EightPuzzleLinearConflictHeuristic(goal_state),
+                                 EightPuzzleWalkingDistanceHeuristic(goal_state)]),
+        pattern_database(goal_state),
+    ]
+
+
+@lru_cache(maxsize=None)
+def pattern_database(goal_state):
+    return EightPuzzlePatternDatabase.build(goal_state)
+
+
+def random_walk(goal_state, steps, seed):
+    """
+    Yield each board of a seeded random walk from the goal with the tile that moved,
+    its source cell and its target cell.
+    """
+    generator = random.Random(seed)
+    moves = action_targets(3)
+    board = list(goal_state)
+    for _ in range(steps):
+        blank = board.index(None)
+        _, target = generator.choice(moves[blank])
+        tile = board[target]
+        board[blank], board[target] = tile, None
+        yield board, tile, target, blank
+
+
+class TestEightPuzzleHeuristics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+
+    """
+    Estimates
+    """
+
+    def test_goal_is_zero(self):
+        """
+        Every evaluator estimates 0 at the goal state.
+        """
+        for goal_state in (GOAL_STATE, OTHER_GOAL_STATE):
+            for evaluator in evaluators(goal_state):
+                self.assertEqual(0, evaluator.heuristic(goal_state))
+
+    def test_admissible(self):
+        """
+        No evaluator overestimates the exact distance along a long random walk.
+        """
+        for evaluator in evaluators(GOAL_STATE):
+            for board, _, _, _ in random_walk(GOAL_STATE, 3000, seed=1):
+                self.assertLessEqual(evaluator.heuristic(board), self.oracle.distance(board))
+
+    def test_linear_conflict_dominates_manhattan(self):
+        """
+        Linear conflicts only add to the Manhattan distance, in steps of two.
+        """
+        manhattan = EightPuzzleManhattanHeuristic(GOAL_STATE)
+        linear_conflict = EightPuzzleLinearConflictHeuristic(GOAL_STATE)
+        self.assertEqual(4, linear_conflict.heuristic((None, 2, 1, 3, 4, 5, 6, 7, 8)))
+        for board, _, _, _ in random_walk(GOAL_STATE, 1000, seed=2):
+            difference = linear_conflict.heuristic(board) - manhattan.heuristic(board)
+            self.assertGreaterEqual(difference, 0)
+            self.assertEqual(0, difference % 2)
+
+    def test_walking_distance_tables(self):
+        """
+        The walking distance tables hold every arrangement of the tiles among the lines.
+        """
+        self.assertEqual(105, len(walking_distance_table(3, 0)[1]))
+        self.assertEqual(24964, len(walking_distance_table(4, 3)[1]))
+        self.assertEqual(35, max(walking_distance_table(4, 3)[1]))
+
+    def test_max_needs_a_shared_goal(self):
+        """
+        A max heuristic rejects evaluators built for different goals.
+        """
+        with self.assertRaises(EightPuzzleHeuristicException):
+            EightPuzzleMaxHeuristic([EightPuzzleManhattanHeuristic(GOAL_STATE),
+                                     EightPuzzleManhattanHeuristic(OTHER_GOAL_STATE)])
+        with self.assertRaises(EightPuzzleHeuristicException):
+            EightPuzzleMaxHeuristic([])
+
+    """
+    Incremental updates
+    """
+
+    def test_updates_match_full_evaluation(self):
+        """
+        An evaluation updated move by move gives the estimate computed from scratch.
+        """
+        for goal_state in (GOAL_STATE, OTHER_GOAL_STATE):
+            for evaluator in evaluators(goal_state):
+                evaluation = evaluator.evaluation(goal_state)
+                for board, tile, source, target in random_walk(goal_state, 2000, seed=3):
+                    evaluation = evaluator.updated(evaluation, board, tile, source, target)
+                    self.assertEqual(evaluator.heuristic(board), evaluator.estimate(evaluation))
+
+    def test_packed_updates_match_manhattan(self):
+        """
+        The packed Manhattan distance, updated move by move, matches the tuple Manhattan distance.
+        """
+        for goal_state in (GOAL_STATE, OTHER_GOAL_STATE):
+            problem = EightPuzzlePackedProblem(goal_state, goal_state)
+            evaluator = EightPuzzlePackedManhattanHeuristic(problem)
+            manhattan = EightPuzzleManhattanHeuristic(goal_state)
+            evaluation = evaluator.evaluation(problem.goal_state)
+            for board, tile, source, target in random_walk(goal_state, 2000, seed=4):
+                packed_board = problem.transition_model.pack(board)
+                evaluation = evaluator.updated(evaluation, packed_board, tile, source, target)
+                self.assertEqual(manhattan.heuristic(board), evaluator.estimate(evaluation))
+                self.assertEqual(manhattan.heuristic(board), evaluator.heuristic(packed_board))
+
+    """
+    Solving
+    """
+
+    def test_solver_finds_optimal_solutions(self):
+        """
+        A*, IDA* and ARA* find optimal solutions with every evaluator.
+        """
+        initial_state = (8, None, 6, 5, 4, 7, 2, 3, 1)
+        problem = EightPuzzleProblem(initial_state, GOAL_STATE, EightPuzzleTransitionModel())
+        for evaluator in evaluators(GOAL_STATE):
+            for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+                actions = EightPuzzleBestFirstSearchSolver(algorithm, evaluator=evaluator).solution(problem)
+                self.assertEqual(31, len(actions))
+
+    def test_solver_rejects_other_goal(self):
+        """
+        The solver refuses an evaluator built for another goal state.
+        """
+        problem = EightPuzzleProblem(OTHER_GOAL_STATE, GOAL_STATE, EightPuzzleTransitionModel())
+        solver = EightPuzzleBestFirstSearchSolver(evaluator=EightPuzzleWalkingDistanceHeuristic(OTHER_GOAL_STATE))
+        with self.assertRaises(EightPuzzleSolverException):
+            solver.solution(problem)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -53,6 +53,15 @@ class TestEightPuzzleNode(unittest.TestCase):
         node = EightPuzzleNode(None, None, None, "Fake Path Cost")
         self.assertEqual("Fake Path Cost", node.path_cost)
 
+    def test_slots(self):
+        """
+        An EightPuzzleNode has slots for its properties and no `__dict__`.
+        """
+        node = EightPuzzleNode(None, None, None, None)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.depth = 1
+
 def fake_value():
     return f"FAKE {time.time()}"
 
@@ -0,0 +1,75 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_node_pool
+
+import unittest
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_node_pool import EightPuzzleNodePool, EightPuzzleNodePoolException, ROOT
+from eight_puzzle_packed_transition_model import EightPuzzlePackedTransitionModel
+
+ACTIONS = [EightPuzzleAgent.move_down, EightPuzzleAgent.move_right, EightPuzzleAgent.move_up,
+           EightPuzzleAgent.move_left, EightPuzzleAgent.move_down]
+
+
+class TestEightPuzzleNodePool(unittest.TestCase):
+
+    """
+    Storage
+    """
+
+    def test_stores_fields(self):
+        """
+        A node's state, parent, action and path cost are read back by its index.
+        """
+        pool = EightPuzzleNodePool(EightPuzzlePackedTransitionModel())
+        root = pool.add(123, ROOT, None, 0)
+        child = pool.add(456, root, EightPuzzleAgent.move_up, 1)
+        self.assertEqual((0, 1), (root, child))
+        self.assertEqual(456, pool.state(child))
+        self.assertEqual(root, pool.parent(child))
+        self.assertIs(EightPuzzleAgent.move_up, pool.action(child))
+        self.assertIsNone(pool.action(root))
+        self.assertEqual(1, pool.path_cost(child))
+        self.assertEqual(2, len(pool))
+
+    def test_actions_to_walks_parents(self):
+        """
+        The actions to reach a node are read by walking its parents back to the root.
+        """
+        pool = EightPuzzleNodePool(EightPuzzlePackedTransitionModel())
+        index = pool.add(0, ROOT, None, 0)
+        pool.add(99, index, EightPuzzleAgent.move_left, 1)  # A sibling branch
+        for depth, action in enumerate(ACTIONS, start=1):
+            index = pool.add(depth, index, action, depth)
+        self.assertEqual(ACTIONS, pool.actions_to(index))
+        self.assertEqual([], pool.actions_to(0))
+
+    def test_compact_buffers(self):
+        """
+        A 3x3 node takes 14.25 bytes of buffers.
+        """
+        pool = EightPuzzleNodePool(EightPuzzlePackedTransitionModel())
+        for index in range(400):
+            pool.add(index, ROOT if index == 0 else index - 1, EightPuzzleAgent.move_right, index)
+        self.assertEqual(400 * 14.25, pool.nbytes())
+
+    def test_large_boards(self):
+        """
+        States of boards too large for 64 bits are kept as Python integers.
+        """
+        transition_model = EightPuzzlePackedTransitionModel(4)
+        pool = EightPuzzleNodePool(transition_model)
+        state = transition_model.pack((15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, None))
+        self.assertGreater(state.bit_length(), 64)
+        self.assertEqual(state, pool.state(pool.add(state, ROOT, None, 0)))
+
+    def test_rejects_large_path_costs(self):
+        """
+        A path cost that does not fit in 16 bits is rejected.
+        """
+        pool = EightPuzzleNodePool(EightPuzzlePackedTransitionModel())
+        with self.assertRaises(EightPuzzleNodePoolException):
+            pool.add(0, ROOT, None, 70000)
+
+
+if __name__ == '__main__':
+    unittest.main()
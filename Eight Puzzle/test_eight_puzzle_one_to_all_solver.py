@@ -0,0 +1,71 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_one_to_all_solver
+
+import random
+import unittest
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_one_to_all_solver import EightPuzzleOneToAllSolver
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def final_state(initial_state, goal_state, actions):
+    problem = EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel(int(len(goal_state) ** 0.5)))
+    state = initial_state
+    for action in actions:
+        state = problem.result(state, action)
+    return state
+
+
+class TestEightPuzzleOneToAllSolver(unittest.TestCase):
+
+    """
+    Solving
+    """
+
+    def test_solutions_are_optimal(self):
+        """
+        Every start of a stream is answered with an optimal solution.
+        """
+        oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+        random.seed(23)
+        starts = [tuple(random.sample(GOAL_STATE, 9)) for _ in range(60)] + [(8, None, 6, 5, 4, 7, 2, 3, 1)]
+        solver = EightPuzzleOneToAllSolver(GOAL_STATE)
+        for start, result in zip(starts, solver.solve_many(iter(starts))):
+            distance = oracle.distance(start)
+            if distance is None:
+                self.assertEqual(EightPuzzleSearchResult.UNSOLVABLE, result.status)
+                continue
+            self.assertEqual(EightPuzzleSearchResult.SOLVED, result.status)
+            self.assertEqual(distance, len(result.actions))
+            self.assertEqual(GOAL_STATE, final_state(start, GOAL_STATE, result.actions))
+
+    def test_search_grows_on_demand(self):
+        """
+        The backward search only runs as deep as the starts asked about so far.
+        """
+        solver = EightPuzzleOneToAllSolver(GOAL_STATE)
+        self.assertEqual([], solver.solve(GOAL_STATE).actions)
+        self.assertEqual(2, len(solver.solve((1, 2, None, 3, 4, 5, 6, 7, 8)).actions))
+        self.assertLess(solver.states_reached, 50)
+        self.assertTrue(solver.search_until())
+        self.assertEqual(181440, solver.states_reached)
+
+    def test_fifteen_puzzle(self):
+        """
+        Starts near the goal of a 4x4 board are solved optimally from a dict of moves.
+        """
+        goal_state = (None,) + tuple(range(1, 16))
+        initial_state = (1, 5, 2, 3, 4, 9, 7, 11, 8, None, 6, 15, 12, 10, 13, 14)
+        solver = EightPuzzleOneToAllSolver(goal_state)
+        self.assertIsInstance(solver.table, dict)
+        result = solver.solve(initial_state)
+        self.assertEqual(11, len(result.actions))
+        self.assertEqual(goal_state, final_state(initial_state, goal_state, result.actions))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_packed_problem
+
+import unittest
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_packed_problem import EightPuzzlePackedProblem
+from eight_puzzle_problem import EightPuzzleProblem, EightPuzzleProblemException
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+
+class TestEightPuzzlePackedProblem(unittest.TestCase):
+
+    """
+    Properties
+    """
+
+    def test_states_are_packed(self):
+        """
+        An EightPuzzlePackedProblem packs its initial and goal states.
+        """
+        problem = EightPuzzlePackedProblem((1, None, 2, 3, 4, 5, 6, 7, 8), (None, 1, 2, 3, 4, 5, 6, 7, 8))
+        self.assertEqual((1, None, 2, 3, 4, 5, 6, 7, 8), problem.transition_model.unpack(problem.initial_state))
+        self.assertEqual((None, 1, 2, 3, 4, 5, 6, 7, 8), problem.transition_model.unpack(problem.goal_state))
+
+    def test_from_problem(self):
+        """
+        An EightPuzzlePackedProblem can be made from an EightPuzzleProblem.
+        """
+        problem = EightPuzzleProblem((1, None, 2, 3, 4, 5, 6, 7, 8), (None, 1, 2, 3, 4, 5, 6, 7, 8), EightPuzzleTransitionModel())
+        packed_problem = EightPuzzlePackedProblem.from_problem(problem)
+        self.assertFalse(packed_problem.is_goal(packed_problem.initial_state))
+        self.assertTrue(packed_problem.is_goal(packed_problem.goal_state))
+
+    """
+    actions and result
+    """
+
+    def test_actions_match_eight_puzzle_problem(self):
+        """
+        The actions for every position of the blank tile match EightPuzzleProblem.
+        """
+        tuple_problem = EightPuzzleProblem(None, None, EightPuzzleTransitionModel())
+        for blank in range(9):
+            tiles = iter(range(1, 9))
+            state = tuple(None if index == blank else next(tiles) for index in range(9))
+            problem = EightPuzzlePackedProblem(state, state)
+            self.assertEqual(tuple_problem.actions(state), list(problem.actions(problem.initial_state)))
+            for action in problem.actions(problem.initial_state):
+                expected = tuple_problem.result(state, action)
+                self.assertEqual(expected, problem.transition_model.unpack(problem.result(problem.initial_state, action)))
+
+    def test_result_rejects_unknown_action(self):
+        """
+        The result of an action that is not a move raises an exception.
+        """
+        problem = EightPuzzlePackedProblem((1, None, 2, 3, 4, 5, 6, 7, 8), (None, 1, 2, 3, 4, 5, 6, 7, 8))
+        with self.assertRaises(EightPuzzleProblemException):
+            problem.result(problem.initial_state, EightPuzzleAgent.action)
+
+    def test_tile_distances(self):
+        """
+        The tile distance table holds the Manhattan distance of each tile from its goal.
+        """
+        problem = EightPuzzlePackedProblem((8, 1, 2, 3, 4, 5, 6, 7, None), (None, 1, 2, 3, 4, 5, 6, 7, 8))
+        self.assertEqual(4, problem.tile_distances[0][8])
+        self.assertEqual(0, problem.tile_distances[1][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_packed_transition_model
+
+import itertools
+import unittest
+from eight_puzzle_packed_transition_model import EightPuzzlePackedTransitionModel
+from eight_puzzle_transition_model import EightPuzzleTransitionModel, EightPuzzleTransitionException
+
+
+class TestEightPuzzlePackedTransitionModel(unittest.TestCase):
+
+    """
+    pack and unpack
+    """
+
+    def test_pack_unpack_round_trip(self):
+        """
+        Unpacking a packed state produces the original tuple.
+        """
+        transition_model = EightPuzzlePackedTransitionModel()
+        state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+        self.assertEqual(state, transition_model.unpack(transition_model.pack(state)))
+
+    def test_pack_blank_index(self):
+        """
+        A packed state records the index of the blank tile.
+        """
+        transition_model = EightPuzzlePackedTransitionModel()
+        self.assertEqual(4, transition_model.blank_index(transition_model.pack((7, 2, 4, 5, None, 6, 8, 3, 1))))
+
+    def test_pack_fits_in_40_bits(self):
+        """
+        A packed state is a 36-bit board plus a 4-bit blank index.
+        """
+        transition_model = EightPuzzlePackedTransitionModel()
+        self.assertLess(transition_model.pack((8, 7, 6, 5, 4, 3, 2, 1, None)), 1 << 40)
+
+    def test_pack_rejects_invalid_tiles(self):
+        """
+        Only tiles 1 to 15 and a single blank tile can be packed.
+        """
+        transition_model = EightPuzzlePackedTransitionModel()
+        with self.assertRaises(EightPuzzleTransitionException):
+            transition_model.pack((None, 0, 0, 0, 0, 0, 0, 0, 0))
+        with self.assertRaises(EightPuzzleTransitionException):
+            transition_model.pack((1, 2, 3, 4, 5, 6, 7, 8, 9))
+
+    """
+    Movement
+    """
+
+    def test_moves_match_tuple_transition_model(self):
+        """
+        Every move produces the same state as EightPuzzleTransitionModel, for every
+        position of the blank tile.
+        """
+        packed_model = EightPuzzlePackedTransitionModel()
+        tuple_model = EightPuzzleTransitionModel()
+        for blank in range(9):
+            tiles = iter((7, 2, 4, 5, 6, 8, 3, 1))
+            state = tuple(None if index == blank else next(tiles) for index in range(9))
+            packed = packed_model.pack(state)
+            for move in ("left", "right", "up", "down"):
+                can_move = getattr(tuple_model, f"can_move_{move}")(state)
+                self.assertEqual(can_move, getattr(packed_model, f"can_move_{move}")(packed))
+                if can_move:
+                    expected = getattr(tuple_model, f"move_{move}")(state)
+                    self.assertEqual(expected, packed_model.unpack(getattr(packed_model, f"move_{move}")(packed)))
+                else:
+                    with self.assertRaises(EightPuzzleTransitionException):
+                        getattr(packed_model, f"move_{move}")(packed)
+
+    def test_moves_are_invertible(self):
+        """
+        Moving left then right, or up then down, restores the packed state.
+        """
+        transition_model = EightPuzzlePackedTransitionModel()
+        packed = transition_model.pack((1, 2, 3, 4, None, 5, 6, 7, 8))
+        for there, back in itertools.permutations(("left", "right"), 2):
+            moved = getattr(transition_model, f"move_{there}")(packed)
+            self.assertEqual(packed, getattr(transition_model, f"move_{back}")(moved))
+        for there, back in itertools.permutations(("up", "down"), 2):
+            moved = getattr(transition_model, f"move_{there}")(packed)
+            self.assertEqual(packed, getattr(transition_model, f"move_{back}")(moved))
+
+    """
+    Other board widths
+    """
+
+    def test_fifteen_and_twenty_four_puzzles(self):
+        """
+        4x4 states use 4 bits per cell and 5x5 states use 5, and moves match the tuple model.
+        """
+        for width, bits in ((4, 4), (5, 5)):
+            packed_model = EightPuzzlePackedTransitionModel(width)
+            tuple_model = EightPuzzleTransitionModel(width)
+            self.assertEqual(bits, packed_model.bits_per_cell)
+            state = tuple(range(1, width * width)) + (None,)
+            packed = packed_model.pack(state)
+            self.assertEqual(state, packed_model.unpack(packed))
+            self.assertEqual(tuple_model.move_up(state), packed_model.unpack(packed_model.move_up(packed)))
+            self.assertEqual(tuple_model.move_left(state), packed_model.unpack(packed_model.move_left(packed)))
+            self.assertFalse(packed_model.can_move_down(packed))
+
+
+if __name__ == '__main__':
+    unittest.main()
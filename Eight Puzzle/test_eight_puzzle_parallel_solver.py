@@ -0,0 +1,107 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_parallel_solver
+
+import threading
+import unittest
+from eight_puzzle_parallel_solver import EightPuzzleParallelSolver, EightPuzzleParallelSolverException, owner
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzleParallelSolver(unittest.TestCase):
+
+    """
+    Ownership
+    """
+
+    def test_owner_is_a_worker(self):
+        """
+        Every state is owned by one of the workers.
+        """
+        for state in range(1000):
+            self.assertIn(owner(state, 3), range(3))
+        self.assertEqual({0, 1, 2}, {owner(state, 3) for state in range(1000)})
+
+    """
+    Solving
+    """
+
+    def test_solutions_are_optimal(self):
+        """
+        Several workers find solutions as short as A* does, which reach the goal.
+        """
+        transition_model = EightPuzzleTransitionModel()
+        solver = EightPuzzleParallelSolver(workers=3, batch_size=8)
+        for initial_state, length in (((8, None, 6, 5, 4, 7, 2, 3, 1), 31),
+                                      ((7, 2, 4, 5, None, 6, 8, 3, 1), 26),
+                                      ((1, None, 2, 3, 4, 5, 6, 7, 8), 1),
+                                      (GOAL_STATE, 0)):
+            problem = EightPuzzleProblem(initial_state, GOAL_STATE, transition_model)
+            result = solver.solve(problem)
+            self.assertEqual(EightPuzzleSearchResult.SOLVED, result.status)
+            self.assertEqual(length, len(result.actions))
+            state = initial_state
+            for action in result.actions:
+                state = problem.result(state, action)
+            self.assertEqual(GOAL_STATE, state)
+
+    def test_repeated_solves_terminate(self):
+        """
+        Many solves with small batches, which exercise the termination check the most, all end in time.
+        """
+        transition_model = EightPuzzleTransitionModel()
+        problems = [EightPuzzleProblem(state, GOAL_STATE, transition_model)
+                    for state in ((1, None, 2, 3, 4, 5, 6, 7, 8), GOAL_STATE, (7, 2, 4, 5, None, 6, 8, 3, 1))]
+        lengths = []
+
+        def solve_repeatedly():
+            for workers, batch_size in ((2, 1), (3, 2), (4, 8)) * 4:
+                solver = EightPuzzleParallelSolver(workers=workers, batch_size=batch_size)
+                lengths.extend(len(solver.solution(problem)) for problem in problems)
+
+        thread = threading.Thread(target=solve_repeatedly, daemon=True)
+        thread.start()
+        thread.join(timeout=120)
+        self.assertFalse(thread.is_alive(), "A parallel solve did not terminate")
+        self.assertEqual([1, 0, 26] * 12, lengths)
+
+    def test_statistics_count_all_workers(self):
+        """
+        The nodes expanded by every worker are added to the statistics.
+        """
+        problem = EightPuzzleProblem((7, 2, 4, 5, None, 6, 8, 3, 1), GOAL_STATE, EightPuzzleTransitionModel())
+        statistics = EightPuzzleSearchStatistics()
+        EightPuzzleParallelSolver(workers=2).solve(problem, statistics)
+        self.assertGreater(statistics.nodes_expanded, 0)
+        self.assertEqual(26, statistics.solution_depth)
+
+    def test_unsolvable_problem(self):
+        """
+        A problem of the wrong parity is reported unsolvable without starting the workers.
+        """
+        problem = EightPuzzleProblem((None, 1, 2, 3, 4, 5, 6, 8, 7), GOAL_STATE, EightPuzzleTransitionModel())
+        result = EightPuzzleParallelSolver(workers=2).solve(problem)
+        self.assertEqual(EightPuzzleSearchResult.UNSOLVABLE, result.status)
+        self.assertEqual([], result.actions)
+
+    def test_one_worker_solves_in_process(self):
+        """
+        With one worker the problem is solved in the calling process.
+        """
+        problem = EightPuzzleProblem((7, 2, 4, 5, None, 6, 8, 3, 1), GOAL_STATE, EightPuzzleTransitionModel())
+        self.assertEqual(26, len(EightPuzzleParallelSolver(workers=1).solution(problem)))
+
+    def test_rejects_invalid_batch_size(self):
+        """
+        A batch must hold at least one node.
+        """
+        with self.assertRaises(EightPuzzleParallelSolverException):
+            EightPuzzleParallelSolver(workers=2, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
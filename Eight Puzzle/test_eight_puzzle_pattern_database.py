@@ -0,0 +1,130 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_pattern_database
+
+import os
+import tempfile
+import unittest
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver, EightPuzzleSolverException
+from eight_puzzle_pattern_database import EightPuzzlePatternDatabase, EightPuzzlePatternDatabaseException
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzlePatternDatabase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.database = EightPuzzlePatternDatabase.build(GOAL_STATE)
+
+    """
+    Building
+    """
+
+    def test_default_patterns(self):
+        """
+        The default patterns split the tiles into two disjoint halves.
+        """
+        self.assertEqual(((1, 2, 3, 4), (5, 6, 7, 8)), EightPuzzlePatternDatabase.default_patterns(GOAL_STATE))
+
+    def test_rejects_overlapping_patterns(self):
+        """
+        Patterns that share a tile are not additive.
+        """
+        with self.assertRaises(EightPuzzlePatternDatabaseException):
+            EightPuzzlePatternDatabase.build(GOAL_STATE, ((1, 2, 3), (3, 4, 5)))
+
+    def test_goal_state_is_zero(self):
+        """
+        The heuristic value of the goal state is 0.
+        """
+        self.assertEqual(0, self.database.heuristic(GOAL_STATE))
+
+    """
+    Heuristic
+    """
+
+    def test_dominates_manhattan_distance(self):
+        """
+        The pattern database is never less informed than the Manhattan distance.
+        """
+        solver = EightPuzzleBestFirstSearchSolver()
+        problem = EightPuzzleProblem(None, GOAL_STATE, None)
+        for state in ((7, 2, 4, 5, None, 6, 8, 3, 1), (8, 6, 7, 2, 5, 4, 3, None, 1), (1, 2, None, 3, 4, 5, 6, 7, 8)):
+            self.assertGreaterEqual(self.database.heuristic(state), solver.heuristic(state, problem))
+
+    def test_admissible(self):
+        """
+        The pattern database never overestimates the length of an optimal solution.
+        """
+        for state in ((7, 2, 4, 5, None, 6, 8, 3, 1), (8, None, 6, 5, 4, 7, 2, 3, 1), (3, 1, 2, 6, 4, 5, None, 7, 8)):
+            problem = EightPuzzleProblem(state, GOAL_STATE, EightPuzzleTransitionModel())
+            optimal = len(EightPuzzleBestFirstSearchSolver().solution(problem))
+            self.assertLessEqual(self.database.heuristic(state), optimal)
+
+    """
+    Persistence
+    """
+
+    def test_save_and_load(self):
+        """
+        A loaded pattern database produces the same values as the one that was saved.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.pdb")
+            self.database.save(path)
+            loaded = EightPuzzlePatternDatabase.load(path)
+            self.assertEqual(self.database.goal_state, loaded.goal_state)
+            self.assertEqual(self.database.patterns, loaded.patterns)
+            state = (8, 6, 7, 2, 5, 4, 3, None, 1)
+            self.assertEqual(self.database.heuristic(state), loaded.heuristic(state))
+
+    def test_load_or_build_reuses_file(self):
+        """
+        load_or_build writes the pattern database once and maps the file afterwards.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.pdb")
+            EightPuzzlePatternDatabase.load_or_build(path, GOAL_STATE)
+            modified = os.path.getmtime(path)
+            database = EightPuzzlePatternDatabase.load_or_build(path, GOAL_STATE)
+            self.assertEqual(modified, os.path.getmtime(path))
+            self.assertIsInstance(database.tables[0], memoryview)
+
+    def test_load_rejects_other_files(self):
+        """
+        Loading a file that is not a pattern database raises an exception.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "not_a.pdb")
+            with open(path, "wb") as file:
+                file.write(b"not a pattern database")
+            with self.assertRaises(EightPuzzlePatternDatabaseException):
+                EightPuzzlePatternDatabase.load(path)
+
+    """
+    Solving
+    """
+
+    def test_solver_with_pattern_database(self):
+        """
+        A* and IDA* with the pattern database find optimal solutions.
+        """
+        problem = EightPuzzleProblem((8, None, 6, 5, 4, 7, 2, 3, 1), GOAL_STATE, EightPuzzleTransitionModel())
+        for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+            solver = EightPuzzleBestFirstSearchSolver(algorithm, pattern_database=self.database)
+            self.assertEqual(31, len(solver.solution(problem)))
+
+    def test_solver_rejects_other_goal_state(self):
+        """
+        A pattern database built for a different goal state cannot be used.
+        """
+        problem = EightPuzzleProblem(GOAL_STATE, (1, 2, 3, 4, 5, 6, 7, 8, None), EightPuzzleTransitionModel())
+        solver = EightPuzzleBestFirstSearchSolver(pattern_database=self.database)
+        with self.assertRaises(EightPuzzleSolverException):
+            solver.solution(problem)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_permutation_rank
+
+import itertools
+import math
+import random
+import unittest
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_permutation_rank import (EightPuzzlePermutationRanker, EightPuzzleRankedClosedSet,
+                                           EightPuzzlePermutationRankException, lexicographic_rank,
+                                           lexicographic_unrank, myrvold_ruskey_rank, myrvold_ruskey_unrank,
+                                           lexicographic_rank_batch, lexicographic_unrank_batch,
+                                           myrvold_ruskey_rank_batch, myrvold_ruskey_unrank_batch, numpy)
+from eight_puzzle_problem import EightPuzzleProblem
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzlePermutationRank(unittest.TestCase):
+
+    """
+    Ranking permutations
+    """
+
+    def test_lexicographic_rank(self):
+        """
+        Permutations in lexicographic order have consecutive ranks, and unrank back.
+        """
+        for size in range(1, 7):
+            for rank, permutation in enumerate(itertools.permutations(range(size))):
+                self.assertEqual(rank, lexicographic_rank(permutation))
+                self.assertEqual(list(permutation), lexicographic_unrank(rank, size))
+
+    def test_myrvold_ruskey_rank(self):
+        """
+        Myrvold-Ruskey ranks are a bijection onto range(n!), and unrank back.
+        """
+        for size in range(1, 7):
+            ranks = set()
+            for permutation in itertools.permutations(range(size)):
+                rank = myrvold_ruskey_rank(permutation)
+                ranks.add(rank)
+                self.assertEqual(list(permutation), myrvold_ruskey_unrank(rank, size))
+            self.assertEqual(set(range(math.factorial(size))), ranks)
+
+    def test_large_permutations(self):
+        """
+        Permutations of the 24-puzzle's 25 cells round-trip through both rankings.
+        """
+        random.seed(22)
+        for _ in range(20):
+            permutation = random.sample(range(25), 25)
+            self.assertEqual(permutation, lexicographic_unrank(lexicographic_rank(permutation), 25))
+            self.assertEqual(permutation, myrvold_ruskey_unrank(myrvold_ruskey_rank(permutation), 25))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_batches_match(self):
+        """
+        The NumPy batch variants give the same ranks and permutations as the pure-Python functions.
+        """
+        random.seed(22)
+        for size in (2, 9, 16, 20):
+            permutations = [random.sample(range(size), size) for _ in range(50)]
+            ranks = [lexicographic_rank(permutation) for permutation in permutations]
+            self.assertEqual(ranks, lexicographic_rank_batch(permutations).tolist())
+            self.assertEqual(permutations, lexicographic_unrank_batch(ranks, size).tolist())
+            ranks = [myrvold_ruskey_rank(permutation) for permutation in permutations]
+            self.assertEqual(ranks, myrvold_ruskey_rank_batch(permutations).tolist())
+            self.assertEqual(permutations, myrvold_ruskey_unrank_batch(ranks, size).tolist())
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            myrvold_ruskey_rank_batch([list(range(21))])
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            lexicographic_unrank_batch([0], 21)
+        self.assertEqual([list(permutation) for permutation in itertools.permutations(range(4))],
+                         lexicographic_unrank_batch(range(24), 4).tolist())
+
+    @unittest.skipIf(numpy is not None, "NumPy is installed")
+    def test_batches_need_numpy(self):
+        """
+        Without NumPy, the batch variants raise.
+        """
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            lexicographic_rank_batch([[0, 1]])
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            lexicographic_unrank_batch([0], 2)
+
+    """
+    Ranking states
+    """
+
+    def test_index_is_perfect(self):
+        """
+        The 9!/2 states that can reach the goal have distinct indexes in range(9!/2), which unindex back.
+        """
+        ranker = EightPuzzlePermutationRanker(GOAL_STATE)
+        oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+        indexes = set()
+        for distance in range(32):
+            for state in oracle.states_at_distance(distance):
+                index = ranker.index(state)
+                indexes.add(index)
+                if index % 101 == 0:
+                    self.assertEqual(state, ranker.unindex(index))
+        self.assertEqual(set(range(181440)), indexes)
+
+    def test_fifteen_puzzle_states(self):
+        """
+        States of a 4x4 board with the blank tile anywhere in the goal round-trip through rank and index.
+        """
+        goal_state = (3, 1, None, 8, 4, 5, 6, 7, 2, 9, 10, 11, 12, 13, 14, 15)
+        ranker = EightPuzzlePermutationRanker(goal_state)
+        random.seed(22)
+        for _ in range(50):
+            state = tuple(random.sample(goal_state, len(goal_state)))
+            self.assertEqual(state, ranker.unrank(ranker.rank(state)))
+            if EightPuzzleProblem(state, goal_state, None).is_solvable():
+                self.assertEqual(state, ranker.unindex(ranker.index(state)))
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            EightPuzzlePermutationRanker((1, 2, 3))
+
+    """
+    Closed sets
+    """
+
+    def test_closed_set(self):
+        """
+        A ranked closed set holds the states added to it in one bit each.
+        """
+        closed = EightPuzzleRankedClosedSet(GOAL_STATE)
+        self.assertEqual(22680, len(closed.bits))
+        state = (1, 2, None, 3, 4, 5, 6, 7, 8)
+        self.assertNotIn(state, closed)
+        closed.add(state)
+        closed.add(state)
+        closed.add(GOAL_STATE)
+        self.assertIn(state, closed)
+        self.assertIn(GOAL_STATE, closed)
+        self.assertNotIn((1, None, 2, 3, 4, 5, 6, 7, 8), closed)
+        self.assertEqual(2, len(closed))
+        with self.assertRaises(EightPuzzlePermutationRankException):
+            EightPuzzleRankedClosedSet((None,) + tuple(range(1, 16)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -135,6 +135,16 @@ class TestEightPuzzleProblem(unittest.TestCase):
         problem = EightPuzzleProblem(None, None, None)
         self.assertEqual([EightPuzzleAgent.move_left, EightPuzzleAgent.move_up], problem.actions((0, 0, 0, 0, 0, 0, 0, 0, None)))
 
+    def test_actions_fifteen_puzzle(self):
+        """
+        The actions of a 4x4 board follow from the width of the state.
+        """
+        problem = EightPuzzleProblem(None, None, None)
+        self.assertEqual([EightPuzzleAgent.move_right, EightPuzzleAgent.move_down], problem.actions((None,) + (0,) * 15))
+        self.assertEqual([EightPuzzleAgent.move_left, EightPuzzleAgent.move_right, EightPuzzleAgent.move_up, EightPuzzleAgent.move_down],
+                         problem.actions((0,) * 5 + (None,) + (0,) * 10))
+        self.assertEqual([EightPuzzleAgent.move_left, EightPuzzleAgent.move_up], problem.actions((0,) * 15 + (None,)))
+
     """
     result
     """
@@ -320,6 +330,48 @@ class TestEightPuzzleProblem(unittest.TestCase):
         problem = EightPuzzleProblem(None, None, None)
         self.assertEqual(1, problem.action_cost(None, None, None))
 
+    """
+    is_solvable
+    """
+
+    def test_is_solvable_goal_state(self):
+        """
+        A problem that starts at its goal state is solvable.
+        """
+        goal_state = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+        self.assertTrue(EightPuzzleProblem(goal_state, goal_state, None).is_solvable())
+
+    def test_is_solvable_one_move(self):
+        """
+        A problem one move from its goal state is solvable.
+        """
+        problem = EightPuzzleProblem((3, 1, 2, None, 4, 5, 6, 7, 8), (None, 1, 2, 3, 4, 5, 6, 7, 8), None)
+        self.assertTrue(problem.is_solvable())
+
+    def test_is_not_solvable_swapped_tiles(self):
+        """
+        Swapping two tiles of the goal state makes a problem unsolvable.
+        """
+        problem = EightPuzzleProblem((None, 2, 1, 3, 4, 5, 6, 7, 8), (None, 1, 2, 3, 4, 5, 6, 7, 8), None)
+        self.assertFalse(problem.is_solvable())
+
+    def test_is_solvable_fifteen_puzzle(self):
+        """
+        The parity check works for a 4x4 board, where the row of the blank tile matters.
+        """
+        goal_state = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, None)
+        swapped = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14, None)
+        moved_up = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, None, 13, 14, 15, 12)
+        self.assertFalse(EightPuzzleProblem(swapped, goal_state, None).is_solvable())
+        self.assertTrue(EightPuzzleProblem(moved_up, goal_state, None).is_solvable())
+
+    def test_is_not_solvable_different_tiles(self):
+        """
+        A problem whose initial and goal states hold different tiles is unsolvable.
+        """
+        problem = EightPuzzleProblem((None, 1, 2, 3, 4, 5, 6, 7, 9), (None, 1, 2, 3, 4, 5, 6, 7, 8), None)
+        self.assertFalse(problem.is_solvable())
+
 
 def fake_value():
     return f"FAKE {time.time()}"
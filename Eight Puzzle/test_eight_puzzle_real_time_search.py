@@ -0,0 +1,101 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_real_time_search
+
+import contextlib
+import io
+import unittest
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_heuristics import EightPuzzleManhattanHeuristic
+from eight_puzzle_real_time_search import EightPuzzleRealTimeSearch, EightPuzzleRealTimeSearchException
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def run_episode(initial_state, planner):
+    """
+    Run an online agent from a state to the goal, returning its number of moves.
+    """
+    agent = EightPuzzleAgent(initial_state, EightPuzzleTransitionModel(), [], planner=planner)
+    moves = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while agent.has_actions():
+            agent.action()(agent)
+            moves += 1
+    assert agent.current_state == GOAL_STATE
+    return moves
+
+
+class TestEightPuzzleRealTimeSearch(unittest.TestCase):
+
+    """
+    Initialization
+    """
+
+    def test_lookahead(self):
+        """
+        The lookahead is a positive number of expansions, and the evaluator matches the goal.
+        """
+        with self.assertRaises(EightPuzzleRealTimeSearchException):
+            EightPuzzleRealTimeSearch(GOAL_STATE, lookahead=0)
+        with self.assertRaises(EightPuzzleRealTimeSearchException):
+            EightPuzzleRealTimeSearch(GOAL_STATE, evaluator=EightPuzzleManhattanHeuristic((1, None, 2, 3, 4, 5, 6, 7, 8)))
+
+    """
+    Planning
+    """
+
+    def test_plan_is_bounded(self):
+        """
+        Each plan expands at most `lookahead` states, learning a value for each.
+        """
+        planner = EightPuzzleRealTimeSearch(GOAL_STATE, lookahead=5)
+        state = (7, 2, 4, 5, None, 6, 8, 3, 1)
+        actions = planner.plan(state)
+        self.assertGreater(len(actions), 0)
+        self.assertLessEqual(len(planner.learned_heuristic), 5)
+        self.assertEqual([], planner.plan(GOAL_STATE))
+        with self.assertRaises(EightPuzzleRealTimeSearchException):
+            planner.plan((2, 1, None, 3, 4, 5, 6, 7, 8))
+
+    def test_learned_values_are_admissible(self):
+        """
+        Learned values only raise the base heuristic, and never above the true distance.
+        """
+        oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+        manhattan = EightPuzzleManhattanHeuristic(GOAL_STATE)
+        planner = EightPuzzleRealTimeSearch(GOAL_STATE, lookahead=8)
+        for _ in range(20):
+            run_episode((7, 2, 4, 5, None, 6, 8, 3, 1), planner)
+        for state, value in planner.learned_heuristic.items():
+            self.assertLessEqual(manhattan.heuristic(state), value)
+            self.assertLessEqual(value, oracle.distance(state))
+
+    """
+    Online agents
+    """
+
+    def test_agent_reaches_goal(self):
+        """
+        An agent with a planner acts until it reaches the goal.
+        """
+        self.assertEqual(0, run_episode(GOAL_STATE, EightPuzzleRealTimeSearch(GOAL_STATE)))
+        self.assertGreaterEqual(run_episode((1, 2, 3, None, 4, 5, 6, 7, 8), EightPuzzleRealTimeSearch(GOAL_STATE)), 13)
+
+    def test_episodes_converge(self):
+        """
+        Repeated episodes that share learned values settle on an optimal path.
+        """
+        learned_heuristic = {}
+        moves = []
+        for _ in range(50):
+            moves.append(run_episode((1, 2, 3, None, 4, 5, 6, 7, 8),
+                                     EightPuzzleRealTimeSearch(GOAL_STATE, lookahead=8,
+                                                               learned_heuristic=learned_heuristic)))
+        self.assertGreater(max(moves), 13)
+        self.assertEqual([13] * 10, moves[-10:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_relabeling
+
+import unittest
+from eight_puzzle_agent import EightPuzzleAgent
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_distance_oracle import EightPuzzleDistanceOracle
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_relabeling import canonical_goal_state, canonical_problem
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzleRelabeling(unittest.TestCase):
+
+    """
+    Canonical goals
+    """
+
+    def test_canonical_goal_keeps_the_blank_cell(self):
+        """
+        The canonical goal numbers the tiles in reading order around the goal's blank cell.
+        """
+        self.assertEqual(GOAL_STATE, canonical_goal_state((None, 8, 7, 6, 5, 4, 3, 2, 1)))
+        self.assertEqual((1, 2, 3, 4, 5, 6, 7, 8, None), canonical_goal_state((8, 7, 6, 5, 4, 3, 2, 1, None)))
+        self.assertEqual((1, None, 2), canonical_goal_state(("a", None, "b")))
+
+    def test_canonical_problem_renames_initial_state(self):
+        """
+        The initial state is renamed with the goal's labels.
+        """
+        goal = (None, 8, 7, 6, 5, 4, 3, 2, 1)
+        problem = EightPuzzleProblem((8, None, 7, 6, 5, 4, 3, 2, 1), goal, EightPuzzleTransitionModel())
+        canonical = canonical_problem(problem)
+        self.assertEqual(GOAL_STATE, canonical.goal_state)
+        self.assertEqual((1, None, 2, 3, 4, 5, 6, 7, 8), canonical.initial_state)
+        self.assertIs(problem.transition_model, canonical.transition_model)
+
+    def test_canonical_problem_is_unchanged_when_already_canonical(self):
+        """
+        A problem whose goal is canonical, or whose tiles cannot be renamed, is returned as it is.
+        """
+        problem = EightPuzzleProblem((1, None, 2, 3, 4, 5, 6, 7, 8), GOAL_STATE, EightPuzzleTransitionModel())
+        self.assertIs(problem, canonical_problem(problem))
+        problem = EightPuzzleProblem((1, None, 2, 3, 4, 5, 6, 7, 9), (None, 8, 7, 6, 5, 4, 3, 2, 1),
+                                     EightPuzzleTransitionModel())
+        self.assertIs(problem, canonical_problem(problem))
+
+    """
+    Solving
+    """
+
+    def test_solution_of_canonical_problem_solves_original(self):
+        """
+        Renaming tiles does not change the actions, so a canonical solution solves the original.
+        """
+        goal = (3, 8, None, 1, 4, 6, 2, 7, 5)
+        transition_model = EightPuzzleTransitionModel()
+        state = goal
+        problem = EightPuzzleProblem(state, goal, transition_model)
+        for action in [EightPuzzleAgent.move_left, EightPuzzleAgent.move_down, EightPuzzleAgent.move_down,
+                       EightPuzzleAgent.move_right, EightPuzzleAgent.move_up]:
+            state = problem.result(state, action)
+        problem = EightPuzzleProblem(state, goal, transition_model)
+        solver = EightPuzzleBestFirstSearchSolver(canonicalize=True)
+        actions = solver.solution(problem)
+        self.assertEqual(len(EightPuzzleBestFirstSearchSolver().solution(problem)), len(actions))
+        for action in actions:
+            state = problem.result(state, action)
+        self.assertEqual(goal, state)
+
+    def test_oracle_serves_relabeled_goals(self):
+        """
+        With canonicalize, an oracle built for (None, 1, ..., 8) serves any goal with the blank first.
+        """
+        oracle = EightPuzzleDistanceOracle.build(GOAL_STATE)
+        solver = EightPuzzleBestFirstSearchSolver(canonicalize=True)
+        solver.distance_oracle = oracle
+        goal = (None, 8, 7, 6, 5, 4, 3, 2, 1)
+        problem = EightPuzzleProblem((8, 5, 7, 6, None, 4, 3, 2, 1), goal, EightPuzzleTransitionModel())
+        self.assertEqual(oracle.solution(canonical_problem(problem)), solver.solution(problem))
+
+
+if __name__ == '__main__':
+    unittest.main()
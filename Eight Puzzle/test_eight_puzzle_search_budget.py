@@ -0,0 +1,74 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_search_budget
+
+import threading
+import time
+import unittest
+from eight_puzzle_search_budget import EightPuzzleCancellationToken, EightPuzzleSearchBudget, EightPuzzleBudgetExceeded
+
+
+class TestEightPuzzleSearchBudget(unittest.TestCase):
+
+    """
+    Limits
+    """
+
+    def test_max_nodes(self):
+        """
+        The expansion after the last one allowed exceeds the budget.
+        """
+        budget = EightPuzzleSearchBudget(max_nodes=3)
+        for _ in range(3):
+            budget.charge(5, [], list)
+        with self.assertRaises(EightPuzzleBudgetExceeded) as raised:
+            budget.charge(5, [], list)
+        self.assertEqual(EightPuzzleSearchBudget.MAX_NODES, raised.exception.reason)
+
+    def test_deadline(self):
+        """
+        A budget whose deadline has passed is exceeded at the next check.
+        """
+        budget = EightPuzzleSearchBudget(deadline=time.monotonic() - 1)
+        with self.assertRaises(EightPuzzleBudgetExceeded) as raised:
+            budget.charge(5, [], list)
+        self.assertEqual(EightPuzzleSearchBudget.DEADLINE, raised.exception.reason)
+
+    def test_cancellation_from_another_thread(self):
+        """
+        A token cancelled on another thread stops the search within CHECK_INTERVAL expansions.
+        """
+        token = EightPuzzleCancellationToken()
+        budget = EightPuzzleSearchBudget(cancellation_token=token)
+        budget.charge(5, [], list)
+        thread = threading.Thread(target=token.cancel)
+        thread.start()
+        thread.join()
+        self.assertTrue(token.cancelled)
+        with self.assertRaises(EightPuzzleBudgetExceeded) as raised:
+            for _ in range(EightPuzzleSearchBudget.CHECK_INTERVAL):
+                budget.charge(5, [], list)
+        self.assertEqual(EightPuzzleSearchBudget.CANCELLED, raised.exception.reason)
+
+    """
+    Partial solutions
+    """
+
+    def test_keeps_the_path_to_the_lowest_estimate(self):
+        """
+        The partial actions lead to the node with the lowest estimate, copied when it was charged.
+        """
+        budget = EightPuzzleSearchBudget()
+        path = ["a"]
+        budget.charge(4, path, list)
+        path.append("b")
+        budget.charge(2, path, list)
+        path.append("c")
+        budget.charge(3, path, list)
+        path.clear()
+        self.assertEqual(2, budget.best_estimate)
+        self.assertEqual(["a", "b"], budget.partial_actions)
+        self.assertEqual(3, budget.nodes_expanded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_search_statistics
+
+import unittest
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_heuristics import EightPuzzleWalkingDistanceHeuristic
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+INITIAL = (7, 2, 4, 5, None, 6, 8, 3, 1)  # 26 moves from GOAL
+
+
+class TestEightPuzzleSearchStatistics(unittest.TestCase):
+
+    """
+    Counters
+    """
+
+    def test_a_star_counts_expansions(self):
+        """
+        A* records expansions, generated nodes, pruned duplicates and peak sizes.
+        """
+        problem = EightPuzzleProblem(INITIAL, GOAL, EightPuzzleTransitionModel())
+        statistics = EightPuzzleSearchStatistics()
+        result = EightPuzzleBestFirstSearchSolver().solve(problem, statistics)
+        self.assertTrue(result.solved)
+        self.assertIs(result.statistics, statistics)
+        self.assertEqual(statistics.solution_depth, len(result.actions))
+        self.assertGreater(statistics.nodes_expanded, statistics.solution_depth)
+        self.assertGreaterEqual(statistics.nodes_generated, statistics.nodes_expanded)
+        self.assertGreater(statistics.duplicates_pruned, 0)
+        self.assertGreater(statistics.peak_frontier_size, 0)
+        self.assertEqual(statistics.peak_explored_size, statistics.nodes_expanded)
+        self.assertGreater(statistics.search_time, 0)
+
+    def test_statistics_do_not_change_the_solution(self):
+        """
+        Collecting statistics finds the same solution as searching without them.
+        """
+        for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+            problem = EightPuzzleProblem(INITIAL, GOAL, EightPuzzleTransitionModel())
+            solver = EightPuzzleBestFirstSearchSolver(algorithm=algorithm)
+            self.assertEqual(solver.solve(problem, EightPuzzleSearchStatistics()).actions, solver.solution(problem))
+
+    def test_ida_star_counts_iterations(self):
+        """
+        IDA* records its iterations, which re-expand the nodes of earlier ones.
+        """
+        problem = EightPuzzleProblem(INITIAL, GOAL, EightPuzzleTransitionModel())
+        statistics = EightPuzzleSearchStatistics()
+        solver = EightPuzzleBestFirstSearchSolver(algorithm=EightPuzzleBestFirstSearchSolver.ITERATIVE_DEEPENING_A_STAR)
+        result = solver.solve(problem, statistics)
+        self.assertEqual(len(result.actions), 26)
+        self.assertGreater(statistics.iterations, 1)
+        self.assertGreater(statistics.nodes_expanded, 26)
+        self.assertLessEqual(statistics.peak_frontier_size, 26)
+
+    def test_every_algorithm_is_timed(self):
+        """
+        Every algorithm times its expansions, and all but breadth-first search time their heuristic.
+        """
+        problem = EightPuzzleProblem(INITIAL, GOAL, EightPuzzleTransitionModel())
+        solvers = [EightPuzzleBestFirstSearchSolver(algorithm=algorithm)
+                   for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS]
+        solvers += [EightPuzzleBestFirstSearchSolver(compact_nodes=True),
+                    EightPuzzleBestFirstSearchSolver(evaluator=EightPuzzleWalkingDistanceHeuristic(GOAL))]
+        for solver in solvers:
+            statistics = EightPuzzleSearchStatistics()
+            solver.solve(problem, statistics)
+            self.assertGreater(statistics.expansion_time, 0)
+            if solver.algorithm == EightPuzzleBestFirstSearchSolver.BIDIRECTIONAL_BREADTH_FIRST:
+                self.assertEqual(0, statistics.heuristic_time)
+            else:
+                self.assertGreater(statistics.heuristic_time, 0)
+            self.assertLess(statistics.heuristic_time + statistics.expansion_time, statistics.search_time)
+
+    def test_unsolvable_problem_has_no_depth(self):
+        """
+        An unsolvable problem is rejected without expanding a node.
+        """
+        problem = EightPuzzleProblem((None, 2, 1, 3, 4, 5, 6, 7, 8), GOAL, EightPuzzleTransitionModel())
+        statistics = EightPuzzleSearchStatistics()
+        EightPuzzleBestFirstSearchSolver().solve(problem, statistics)
+        self.assertEqual(statistics.nodes_expanded, 0)
+        self.assertIsNone(statistics.solution_depth)
+        self.assertIsNone(statistics.effective_branching_factor)
+
+    """
+    Callbacks
+    """
+
+    def test_on_expand_sees_every_expansion(self):
+        """
+        Each on_expand callback is called once per expanded node, for both algorithms.
+        """
+        for algorithm in EightPuzzleBestFirstSearchSolver.ALGORITHMS:
+            problem = EightPuzzleProblem(INITIAL, GOAL, EightPuzzleTransitionModel())
+            depths = []
+            statistics = EightPuzzleSearchStatistics(on_expand=[lambda node: depths.append(node.path_cost)])
+            EightPuzzleBestFirstSearchSolver(algorithm=algorithm).solve(problem, statistics)
+            self.assertEqual(len(depths), statistics.nodes_expanded)
+            self.assertEqual(min(depths), 0)
+
+    """
+    Effective branching factor
+    """
+
+    def test_effective_branching_factor(self):
+        """
+        b* solves N + 1 = 1 + b* + ... + b*^d.
+        """
+        statistics = EightPuzzleSearchStatistics()
+        statistics.solution_depth = 2
+        statistics.nodes_generated = 6  # 1 + 2 + 4 = 7
+        self.assertAlmostEqual(statistics.effective_branching_factor, 2.0, places=6)
+        statistics.solution_depth = 5
+        statistics.nodes_generated = 5
+        self.assertAlmostEqual(statistics.effective_branching_factor, 1.0, places=6)
+
+    def test_effective_branching_factor_of_deep_solution(self):
+        """
+        b* of a deep solution, as the 15-puzzle produces, is computed without overflow.
+        """
+        statistics = EightPuzzleSearchStatistics()
+        statistics.solution_depth = 60
+        statistics.nodes_generated = 1_000_000
+        branching_factor = statistics.effective_branching_factor
+        self.assertGreater(branching_factor, 1.0)
+        self.assertLess(branching_factor, 1.3)
+        self.assertAlmostEqual(sum(branching_factor ** level for level in range(61)), 1_000_001, delta=1)
+        self.assertIn("effective_branching_factor", repr(statistics))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_server
+
+import asyncio
+import json
+import os
+import socket
+import struct
+import tempfile
+import unittest
+from eight_puzzle_server import EightPuzzleServer, EightPuzzleServerException
+
+GOAL_STATE = [None, 1, 2, 3, 4, 5, 6, 7, 8]
+# Korf's first 15-puzzle instance, far beyond what A* with Manhattan distance solves in a test
+HARD_FIFTEEN_PUZZLE = [14, 13, 15, 7, 11, 12, 9, 5, 6, None, 2, 1, 4, 8, 10, 3]
+FIFTEEN_PUZZLE_GOAL = [None] + list(range(1, 16))
+
+
+def solve_request(request_id, initial_state, goal_state=GOAL_STATE, **budgets):
+    return dict(budgets, id=request_id, initial_state=initial_state, goal_state=goal_state)
+
+
+class TestEightPuzzleServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = EightPuzzleServer(workers=2, max_in_flight=4)
+        await self.server.start()
+        self.reader, self.writer = await asyncio.open_connection(*self.server.address[:2])
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def send(self, *requests, writer=None):
+        writer = writer or self.writer
+        writer.write(b"".join(json.dumps(request).encode() + b"\n" for request in requests))
+        await writer.drain()
+
+    async def receive(self, reader=None):
+        line = await asyncio.wait_for((reader or self.reader).readline(), timeout=60)
+        return json.loads(line)
+
+    async def stats(self):
+        await self.send({"op": "stats"})
+        return await self.receive()
+
+    """
+    Solving
+    """
+
+    async def test_solves_a_request(self):
+        """
+        A solve request is answered with an optimal list of actions and its latency.
+        """
+        await self.send(solve_request(7, [7, 2, 4, 5, None, 6, 8, 3, 1]))
+        response = await self.receive()
+        self.assertEqual(7, response["id"])
+        self.assertEqual("solved", response["status"])
+        self.assertEqual(26, len(response["actions"]))
+        self.assertIn("move_left", response["actions"])
+        self.assertGreater(response["latency"], 0)
+
+    async def test_unsolvable_request(self):
+        """
+        A problem whose goal cannot be reached is reported as unsolvable.
+        """
+        await self.send(solve_request(1, [2, 1, 3, 4, 5, 6, 7, 8, None]))
+        response = await self.receive()
+        self.assertEqual("unsolvable", response["status"])
+        self.assertEqual([], response["actions"])
+
+    async def test_pipelined_requests(self):
+        """
+        More requests than may be in flight are all answered, on one connection.
+        """
+        initial_states = [[1, None, 2, 3, 4, 5, 6, 7, 8], [1, 2, None, 3, 4, 5, 6, 7, 8],
+                          [3, 1, 2, None, 4, 5, 6, 7, 8], [1, 4, 2, 3, None, 5, 6, 7, 8],
+                          [1, 2, 5, 3, 4, None, 6, 7, 8], [3, 1, 2, 6, 4, 5, None, 7, 8]]
+        await self.send(*(solve_request(index, state) for index, state in enumerate(initial_states)))
+        lengths = {}
+        for _ in initial_states:
+            response = await self.receive()
+            lengths[response["id"]] = len(response["actions"])
+        self.assertEqual({0: 1, 1: 2, 2: 1, 3: 2, 4: 3, 5: 2}, lengths)
+
+    async def test_unix_socket(self):
+        """
+        The server can listen on a Unix socket instead of TCP.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "eight_puzzle.sock")
+            server = EightPuzzleServer(workers=1)
+            async with server:
+                await server.start(path=path)
+                reader, writer = await asyncio.open_unix_connection(path)
+                await self.send(solve_request(1, [1, 2, None, 3, 4, 5, 6, 7, 8]), writer=writer)
+                response = await self.receive(reader)
+                writer.close()
+            self.assertEqual(["move_left", "move_left"], response["actions"])
+
+    """
+    Budgets
+    """
+
+    async def test_node_budget(self):
+        """
+        A solve that expands more nodes than the request allows stops with no actions.
+        """
+        await self.send(solve_request(1, [8, None, 6, 5, 4, 7, 2, 3, 1], max_nodes=50))
+        response = await self.receive()
+        self.assertEqual("node_budget_exceeded", response["status"])
+        self.assertEqual([], response["actions"])
+
+    async def test_time_budget(self):
+        """
+        A solve that runs past the request's time budget stops.
+        """
+        await self.send(solve_request(1, HARD_FIFTEEN_PUZZLE, FIFTEEN_PUZZLE_GOAL, time_budget=0.2))
+        response = await self.receive()
+        self.assertEqual("timed_out", response["status"])
+
+    async def test_invalid_requests(self):
+        """
+        Malformed lines, mismatched states and invalid budgets are answered with errors.
+        """
+        self.writer.write(b"not json\n")
+        await self.send(solve_request(2, [1, 2, 3]), solve_request(3, [1, 2, 3, 4, 5, 6, 7, 8, 9]),
+                        solve_request(4, [1, None, 2, 3, 4, 5, 6, 7, 8], max_nodes=-1))
+        responses = [await self.receive() for _ in range(4)]
+        self.assertEqual([None, 2, 3, 4], [response["id"] for response in responses])
+        self.assertTrue(all(response["status"] == "error" for response in responses))
+        with self.assertRaises(EightPuzzleServerException):
+            EightPuzzleServer(max_in_flight=0)
+
+    async def test_oversized_request(self):
+        """
+        A request line longer than the limit is answered with an error, and the next line is read.
+        """
+        self.writer.write(b'{"id": 1, "padding": "' + b"x" * 70000 + b'"}\n')
+        await self.send(solve_request(2, [1, None, 2, 3, 4, 5, 6, 7, 8]))
+        response = await self.receive()
+        self.assertEqual("error", response["status"])
+        self.assertIn("longer than 65536 bytes", response["error"])
+        response = await self.receive()
+        self.assertEqual(2, response["id"])
+        self.assertEqual("solved", response["status"])
+
+    async def test_half_closed_connection(self):
+        """
+        A client that closes its side after sending its requests still receives the responses.
+        """
+        await self.send(solve_request(1, [7, 2, 4, 5, None, 6, 8, 3, 1]))
+        self.writer.write_eof()
+        response = await self.receive()
+        self.assertEqual("solved", response["status"])
+        self.assertEqual(b"", await self.reader.read())
+        self.assertNotIn("cancelled", self.server.counts)
+
+    """
+    Sharing and cancelling
+    """
+
+    async def test_identical_requests_share_a_solve(self):
+        """
+        Identical requests in flight at once are answered from one solve.
+        """
+        initial_state = [8, None, 6, 5, 4, 7, 2, 3, 1]
+        await self.send(solve_request(1, initial_state), solve_request(2, initial_state))
+        responses = [await self.receive() for _ in range(2)]
+        self.assertEqual({1, 2}, {response["id"] for response in responses})
+        self.assertEqual(responses[0]["actions"], responses[1]["actions"])
+        self.assertEqual(1, (await self.stats())["counts"]["deduplicated"])
+
+    async def test_disconnect_cancels_solve(self):
+        """
+        A solve whose only client resets its connection is cancelled, and frees its worker.
+        """
+        reader, writer = await asyncio.open_connection(*self.server.address[:2])
+        await self.send(solve_request(1, HARD_FIFTEEN_PUZZLE, FIFTEEN_PUZZLE_GOAL, time_budget=600), writer=writer)
+        while (await self.stats())["in_flight"] == 0:
+            await asyncio.sleep(0.05)
+        # Close with a reset rather than the end of the stream, which only half-closes
+        writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+        writer.close()
+        for _ in range(600):
+            stats = await self.stats()
+            if stats["in_flight"] == 0:
+                break
+            await asyncio.sleep(0.05)
+        self.assertEqual(0, stats["in_flight"])
+        self.assertEqual(1, stats["counts"]["cancelled"])
+
+    """
+    Statistics
+    """
+
+    async def test_latency_percentiles(self):
+        """
+        The stats request reports the counts of responses and latency percentiles.
+        """
+        self.assertEqual({"p50": None, "p90": None, "p99": None}, (await self.stats())["latency"])
+        await self.send(*(solve_request(index, [1, None, 2, 3, 4, 5, 6, 7, 8]) for index in range(3)))
+        for _ in range(3):
+            await self.receive()
+        stats = await self.stats()
+        self.assertEqual(3, stats["counts"]["solved"])
+        latency = stats["latency"]
+        self.assertLessEqual(latency["p50"], latency["p90"])
+        self.assertLessEqual(latency["p90"], latency["p99"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_solution_cache
+
+import os
+import tempfile
+import unittest
+from eight_puzzle_best_first_search_solver import EightPuzzleBestFirstSearchSolver
+from eight_puzzle_problem import EightPuzzleProblem
+from eight_puzzle_search_result import EightPuzzleSearchResult
+from eight_puzzle_search_statistics import EightPuzzleSearchStatistics
+from eight_puzzle_solution_cache import EightPuzzleSolutionCache
+from eight_puzzle_transition_model import EightPuzzleTransitionModel
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+INITIAL_STATE = (7, 2, 4, 5, None, 6, 8, 3, 1)
+
+
+def problem(initial_state=INITIAL_STATE, goal_state=GOAL_STATE):
+    return EightPuzzleProblem(initial_state, goal_state, EightPuzzleTransitionModel())
+
+
+class TestEightPuzzleSolutionCache(unittest.TestCase):
+
+    """
+    Memory
+    """
+
+    def test_hit_skips_search(self):
+        """
+        A repeated problem is answered from the cache without expanding a node.
+        """
+        solver = EightPuzzleBestFirstSearchSolver(solution_cache=EightPuzzleSolutionCache())
+        first = solver.solve(problem())
+        statistics = EightPuzzleSearchStatistics()
+        second = solver.solve(problem(), statistics)
+        self.assertEqual(first.actions, second.actions)
+        self.assertTrue(second.solved)
+        self.assertEqual(0, statistics.nodes_expanded)
+        self.assertEqual(26, statistics.solution_depth)
+        self.assertEqual(1, solver.solution_cache.hits)
+
+    def test_relabeled_problems_share_an_entry(self):
+        """
+        Problems that differ only in the names of their tiles share a cache entry.
+        """
+        cache = EightPuzzleSolutionCache()
+        solver = EightPuzzleBestFirstSearchSolver(solution_cache=cache)
+        solver.solve(problem((1, None, 2, 3, 4, 5, 6, 7, 8)))
+        renamed = problem((8, None, 7, 6, 5, 4, 3, 2, 1), (None, 8, 7, 6, 5, 4, 3, 2, 1))
+        result = solver.solve(renamed)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, len(result.actions))
+
+    def test_caches_unsolvable_results(self):
+        """
+        An unsolvable result is cached with its status.
+        """
+        cache = EightPuzzleSolutionCache()
+        unsolvable = problem((None, 2, 1, 3, 4, 5, 6, 7, 8))
+        EightPuzzleBestFirstSearchSolver(solution_cache=cache).solve(unsolvable)
+        result = cache.get(unsolvable)
+        self.assertEqual(EightPuzzleSearchResult.UNSOLVABLE, result.status)
+        self.assertIsNone(result.suboptimality_bound)
+
+    def test_evicts_least_recently_used(self):
+        """
+        Past its capacity, the cache forgets the least recently used result.
+        """
+        cache = EightPuzzleSolutionCache(capacity=2)
+        states = [(1, None, 2, 3, 4, 5, 6, 7, 8), (1, 2, None, 3, 4, 5, 6, 7, 8), (3, 1, 2, None, 4, 5, 6, 7, 8)]
+        solver = EightPuzzleBestFirstSearchSolver(solution_cache=cache)
+        solver.solve(problem(states[0]))
+        solver.solve(problem(states[1]))
+        cache.get(problem(states[0]))
+        solver.solve(problem(states[2]))
+        self.assertIsNotNone(cache.get(problem(states[0])))
+        self.assertIsNone(cache.get(problem(states[1])))
+
+    def test_results_are_copies(self):
+        """
+        Changing a returned list of actions does not change the cached result.
+        """
+        cache = EightPuzzleSolutionCache()
+        EightPuzzleBestFirstSearchSolver(solution_cache=cache).solve(problem())
+        cache.get(problem()).actions.clear()
+        self.assertEqual(26, len(cache.get(problem()).actions))
+
+    """
+    Disk
+    """
+
+    def test_persists_between_caches(self):
+        """
+        Results written to a cache file are found by a later cache on the same file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions")
+            with EightPuzzleSolutionCache(path=path) as cache:
+                expected = EightPuzzleBestFirstSearchSolver(solution_cache=cache).solve(problem()).actions
+            with EightPuzzleSolutionCache(capacity=1, path=path) as cache:
+                self.assertEqual(0, len(cache))
+                self.assertEqual(expected, cache.get(problem()).actions)
+
+
+if __name__ == '__main__':
+    unittest.main()
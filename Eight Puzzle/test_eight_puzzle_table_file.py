@@ -0,0 +1,46 @@
+# DO NOT MODIFY THE CODE IN THE TESTS
+# Run me via: python3 -m unittest test_eight_puzzle_table_file
+
+import os
+import tempfile
+import unittest
+from eight_puzzle_table_file import HEADER, save_table, load_table
+
+GOAL_STATE = (None, 1, 2, 3, 4, 5, 6, 7, 8)
+
+
+class TestEightPuzzleTableFile(unittest.TestCase):
+
+    """
+    Saving and loading
+    """
+
+    def test_round_trip(self):
+        """
+        A saved table is mapped back with its goal state, after a header of fixed size.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table")
+            save_table(path, b"TEST", 1, GOAL_STATE, bytes(range(10)))
+            self.assertEqual(HEADER.size + 10, os.path.getsize(path))
+            self.assertEqual([path], [os.path.join(directory, name) for name in os.listdir(directory)])
+            goal_state, table = load_table(path, b"TEST", 1, 10)
+            self.assertEqual(GOAL_STATE, goal_state)
+            self.assertEqual(bytes(range(10)), bytes(table))
+            with self.assertRaises(TypeError):
+                table[0] = 1
+
+    def test_rejects_other_tables(self):
+        """
+        A table of another kind, version or size is not loaded.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table")
+            save_table(path, b"TEST", 1, GOAL_STATE, bytes(10))
+            self.assertIsNone(load_table(path, b"BEST", 1, 10))
+            self.assertIsNone(load_table(path, b"TEST", 2, 10))
+            self.assertIsNone(load_table(path, b"TEST", 1, 11))
+
+
+if __name__ == '__main__':
+    unittest.main()
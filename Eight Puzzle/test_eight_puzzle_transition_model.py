@@ -306,6 +306,39 @@ class TestEightPuzzleTransitionModel(unittest.TestCase):
         expected = (1, 2, 3, 4, 5, 8, 6, 7, None)
         self.assertEqual(expected, transition_model.move_down(state))
 
+    """
+    Other board widths
+    """
+
+    def test_fifteen_puzzle_moves(self):
+        """
+        A transition model with width 4 moves the blank tile on a 4x4 board.
+        """
+        transition_model = EightPuzzleTransitionModel(4)
+        state = (1, 2, 3, 4, 5, None, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15)
+        self.assertEqual((1, 2, 3, 4, None, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), transition_model.move_left(state))
+        self.assertEqual((1, None, 3, 4, 5, 2, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), transition_model.move_up(state))
+        self.assertEqual((1, 2, 3, 4, 5, 9, 6, 7, 8, None, 10, 11, 12, 13, 14, 15), transition_model.move_down(state))
+
+    def test_fifteen_puzzle_edges(self):
+        """
+        On a 4x4 board, the blank tile cannot leave the board.
+        """
+        transition_model = EightPuzzleTransitionModel(4)
+        state = (0, 0, 0, None, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        self.assertFalse(transition_model.can_move_right(state))
+        self.assertFalse(transition_model.can_move_up(state))
+        self.assertTrue(transition_model.can_move_left(state))
+        with self.assertRaises(EightPuzzleTransitionException):
+            transition_model.move_right(state)
+
+    def test_state_of_wrong_width(self):
+        """
+        Moving a state that does not fit the board width raises an exception.
+        """
+        with self.assertRaises(EightPuzzleTransitionException):
+            EightPuzzleTransitionModel(4).move_left((1, None, 2, 3, 4, 5, 6, 7, 8))
+
 
 def fake_value():
     return f"FAKE {time.time()}"